@@ -6,6 +6,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 import pandas as pd
@@ -57,7 +58,7 @@ class FiverrGigScraper:
                 print(f"Scraping page {page}: {url}")
                 
                 self.driver.get(url)
-                time.sleep(3)  # Wait for page load
+                self._wait_for_page_ready()
                 
                 # Scroll to load all content
                 self._scroll_page()
@@ -81,9 +82,37 @@ class FiverrGigScraper:
         
         return gigs_data
     
+    def _wait_for_page_ready(self):
+        """Wait for gig cards to appear instead of sleeping a fixed time"""
+        try:
+            self.wait.until(EC.presence_of_element_located(
+                (By.CSS_SELECTOR, 'article[data-test="gig-card"], div[class*="gig-card"]')
+            ))
+        except TimeoutException:
+            print("No gig cards appeared before timeout")
+        self._wait_for_settle(timeout=5, quiet_period=0.5)
+    
+    def _wait_for_settle(self, timeout=3, quiet_period=0.2):
+        """Wait until page height and loaded resources stop changing"""
+        state = {'snapshot': None, 'since': time.monotonic()}
+        
+        def settled(driver):
+            snapshot = driver.execute_script(
+                "return [document.body.scrollHeight, performance.getEntriesByType('resource').length];"
+            )
+            now = time.monotonic()
+            if snapshot != state['snapshot']:
+                state['snapshot'], state['since'] = snapshot, now
+                return False
+            return now - state['since'] >= quiet_period
+        
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(settled)
+        except TimeoutException:
+            pass
+    
     def _scroll_page(self):
         """Scroll page to load all content"""
-        scroll_pause_time = 1
         screen_height = self.driver.execute_script("return window.screen.height;")
         i = 1
         
@@ -91,7 +120,7 @@ class FiverrGigScraper:
             # Scroll one screen height each time
             self.driver.execute_script(f"window.scrollTo(0, {screen_height * i});")
             i += 1
-            time.sleep(scroll_pause_time)
+            self._wait_for_settle()
             
             # Check if we've reached the bottom
             scroll_height = self.driver.execute_script("return document.body.scrollHeight;")
@@ -104,7 +133,7 @@ class FiverrGigScraper:
         
         try:
             # Get page source and parse with BeautifulSoup
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            soup = BeautifulSoup(self.driver.page_source, 'lxml')
             
             # Find gig cards - Fiverr's structure may vary
             # These selectors might need adjustment if Fiverr changes their layout
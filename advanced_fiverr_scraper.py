@@ -1,7 +1,8 @@
+import os
+import sys
 import time
 import csv
 import json
-import pandas as pd
 import numpy as np
 from datetime import datetime
 from selenium import webdriver
@@ -12,14 +13,21 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+from parser_backends import ParserBackend, get_backend
+from card_detection import detect_repeated_cards
+from selector_cache import SelectorCache
+from gig_sinks import GigSink, CsvSink, JsonLinesSink, sort_csv, csv_to_excel
+from gig_index import GigIndex, HASH_FIELDS, canonical_gig_url
+from gig_filters import GigFilters
+from scrape_control import ScrapeControl
+from page_cache import PageCache, CachedPage
 import urllib.parse
 import re
 import requests
 from fake_useragent import UserAgent
 import logging
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Callable, List, Dict, Optional, Tuple
+from dataclasses import dataclass, fields as dataclass_fields
 import threading
 import queue
 from pathlib import Path
@@ -34,8 +42,60 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# (field, tag names, class pattern, collect every match) for the single-pass
+# card extractor; the patterns mirror the per-field finds of the legacy path.
+CARD_FIELD_RULES = [
+    ('title', ('h3', 'a'), re.compile(r'title|gig-title', re.I), False),
+    ('seller', ('a', 'span'), re.compile(r'seller|user|username', re.I), False),
+    ('rating', ('span', 'div'), re.compile(r'rating|stars', re.I), False),
+    ('reviews', ('span', 'div'), re.compile(r'review|rating-count', re.I), False),
+    ('price', ('span', 'div'), re.compile(r'price|amount', re.I), False),
+    ('description', ('p', 'div'), re.compile(r'description|text|content', re.I), False),
+    ('tags', ('span', 'a'), re.compile(r'tag|skill|category', re.I), True),
+    ('level', ('span', 'div'), re.compile(r'level|badge|seller-level', re.I), True),
+    ('online', ('span', 'div'), re.compile(r'online|status', re.I), False),
+    ('delivery', ('span', 'div'), re.compile(r'delivery|time|days', re.I), False),
+    ('completed', ('span', 'div'), re.compile(r'orders|completed|delivered', re.I), False),
+    ('response', ('span', 'div'), re.compile(r'response|reply', re.I), False),
+]
+
+def card_rules_by_tag(names: Optional[frozenset] = None) -> Dict[str, List[Tuple]]:
+    rules_by_tag: Dict[str, List[Tuple]] = {}
+    for rule in CARD_FIELD_RULES:
+        if names is None or rule[0] in names:
+            for tag in rule[1]:
+                rules_by_tag.setdefault(tag, []).append(rule)
+    return rules_by_tag
+
+CARD_RULES_BY_TAG = card_rules_by_tag()
+
+# GigData fields a caller can ask for, and the card rule each is read from.
+# url is always extracted (it's the gig's identity); fields that aren't
+# asked for are None ([] for tags), so sinks can't mistake them for data.
+PROJECTABLE_FIELDS = {
+    'title': 'title', 'freelancer': 'seller', 'rating': 'rating', 'reviews': 'reviews',
+    'price': 'price', 'description': 'description', 'tags': 'tags', 'level': 'level',
+    'online_status': 'online', 'delivery_time': 'delivery', 'completed_jobs': 'completed',
+    'response_time': 'response',
+}
+ALWAYS_FIELDS = ('url', 'category', 'keywords', 'last_delivery', 'gig_created', 'scraped_at')
+FILTER_RULES = frozenset({'rating', 'price', 'level'})
+
+RATING_RE = re.compile(r'(\d+\.?\d*)')
+REVIEWS_RE = re.compile(r'\(?(\d+)\)?')
+COMPLETED_JOBS_RE = re.compile(r'(\d+[\d,]*)\s*(orders|completed|delivered)', re.I)
+
+# Values shared by many gigs; interned so a large result set holds one copy of each.
+INTERNED_FIELDS = ('freelancer', 'category', 'level', 'delivery_time', 'response_time')
+
 @dataclass
 class GigData:
+    # Slots instead of a per-instance __dict__. Not frozen: callers fill in
+    # category and keywords after scraping.
+    __slots__ = ('title', 'url', 'freelancer', 'rating', 'reviews', 'price', 'delivery_time',
+                 'completed_jobs', 'category', 'keywords', 'description', 'tags', 'level',
+                 'online_status', 'response_time', 'last_delivery', 'gig_created', 'scraped_at')
+    
     title: str
     url: str
     freelancer: str
@@ -55,21 +115,189 @@ class GigData:
     gig_created: str
     scraped_at: datetime
     
+    def __post_init__(self):
+        for name in INTERNED_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
+    
     def to_dict(self):
-        data = asdict(self)
+        # Flat fields only, so this is a shallow copy rather than asdict's deep one.
+        data = {name: getattr(self, name) for name in GIG_FIELD_NAMES}
+        data['keywords'] = list(self.keywords)
+        data['tags'] = list(self.tags)
         data['scraped_at'] = self.scraped_at.isoformat()
         return data
 
+GIG_FIELD_NAMES = tuple(field.name for field in dataclass_fields(GigData))
+
+_chromedriver_path: Optional[str] = None
+_chromedriver_lock = threading.Lock()
+
+def chromedriver_path() -> str:
+    """Resolve (and if needed download) chromedriver once per process."""
+    global _chromedriver_path
+    with _chromedriver_lock:
+        if _chromedriver_path is None:
+            _chromedriver_path = ChromeDriverManager().install()
+        return _chromedriver_path
+
+def process_tree_rss(root_pid: int) -> int:
+    """Resident memory in bytes of a process and all its descendants, read from /proc."""
+    children: Dict[int, List[int]] = {}
+    try:
+        entries = os.listdir('/proc')
+    except OSError:
+        return 0
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                # The command name may contain spaces; fields resume after its ')'.
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    total = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        try:
+            with open(f'/proc/{pid}/statm') as f:
+                total += int(f.read().split()[1]) * page_size
+        except (OSError, IndexError, ValueError):
+            continue
+        stack.extend(children.get(pid, []))
+    return total
+
+class PolitenessPolicy:
+    def __init__(self, between_pages: Tuple[float, float] = (3, 6),
+                 between_scrolls: Tuple[float, float] = (0, 0)):
+        self.between_pages_range = between_pages
+        self.between_scrolls_range = between_scrolls
+    
+    def _sleep(self, delay_range: Tuple[float, float], control: Optional[ScrapeControl] = None):
+        low, high = delay_range
+        delay = np.random.uniform(low, high) if high > 0 else 0
+        if control is not None:
+            control.sleep(delay)
+        elif delay:
+            time.sleep(delay)
+    
+    def between_pages(self, control: Optional[ScrapeControl] = None):
+        self._sleep(self.between_pages_range, control)
+    
+    def between_scrolls(self, control: Optional[ScrapeControl] = None):
+        self._sleep(self.between_scrolls_range, control)
+
 class AdvancedFiverrScraper:
-    def __init__(self, headless: bool = True, proxy: Optional[str] = None):
+    SORT_MAP = {
+        "relevant": "relevant",
+        "best_selling": "best_selling",
+        "newest": "newest",
+        "rating": "seller_rating"
+    }
+    
+    # "offline" replays pages from the page cache only, without any network.
+    FETCH_MODES = ("auto", "http", "browser", "offline")
+    WAIT_STRATEGIES = ("events", "fixed")
+    STATE_SCRIPT_IDS = ("perseus-initial-props", "__NEXT_DATA__")
+    CARD_SELECTORS = [
+        'article[data-test="gig-card"]',
+        'div[class*="gig-card"]',
+        'div[class*="gig-wrapper"]',
+    ]
+    DRIVER_PROFILES = ("lean", "full")
+    # Requests the lean profile never makes; card text doesn't depend on any of them.
+    BLOCKED_URL_PATTERNS = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+        "*.mp4", "*.webm", "*.m3u8", "*.woff", "*.woff2", "*.ttf", "*.otf",
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*facebook.net*", "*facebook.com/tr*", "*hotjar.com*", "*segment.com*", "*segment.io*",
+        "*clarity.ms*", "*bat.bing.com*", "*tiktok.com*", "*quantserve.com*", "*pinimg.com*",
+    ]
+    LEAN_CHROME_ARGS = [
+        "--blink-settings=imagesEnabled=false",
+        "--disable-extensions",
+        "--disable-background-networking",
+        "--disable-component-update",
+        "--disable-default-apps",
+        "--disable-sync",
+        "--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication",
+        "--mute-audio",
+        "--no-first-run",
+        "--window-size=1280,900",
+    ]
+    # Navigation and resource transfer sizes plus load time, read once per page.
+    PAGE_METRICS_JS = (
+        "const nav = performance.getEntriesByType('navigation')[0] || {};"
+        " const res = performance.getEntriesByType('resource');"
+        " return [nav.transferSize || 0, res.reduce((t, r) => t + (r.transferSize || 0), 0),"
+        " res.length, nav.loadEventEnd ? nav.loadEventEnd - nav.startTime : performance.now()];"
+    )
+    # One round trip that changes whenever the page is still rendering or loading.
+    READY_SNAPSHOT_JS = (
+        "return [document.readyState,"
+        " document.body ? document.body.scrollHeight : 0,"
+        " performance.getEntriesByType('resource').length,"
+        " document.querySelectorAll(arguments[0]).length];"
+    )
+    
+    def __init__(self, headless: bool = True, proxy: Optional[str] = None,
+                 base_url: str = "https://www.fiverr.com", fetch_mode: str = "auto",
+                 politeness: Optional[PolitenessPolicy] = None, wait_strategy: str = "events",
+                 parser_backend: str = "lxml", selector_cache: Optional[SelectorCache] = None,
+                 page_cache: Optional[PageCache] = None, driver_profile: str = "lean",
+                 max_browser_rss: Optional[int] = 1536 * 1024 * 1024):
+        if fetch_mode not in self.FETCH_MODES:
+            raise ValueError(f"Unknown fetch mode: {fetch_mode}")
+        if fetch_mode == "offline" and page_cache is None:
+            raise ValueError("Offline mode needs a page cache to replay from")
+        if wait_strategy not in self.WAIT_STRATEGIES:
+            raise ValueError(f"Unknown wait strategy: {wait_strategy}")
+        if driver_profile not in self.DRIVER_PROFILES:
+            raise ValueError(f"Unknown driver profile: {driver_profile}")
         self.headless = headless
         self.proxy = proxy
+        self.base_url = base_url.rstrip('/')
+        self.fetch_mode = fetch_mode
+        self.politeness = politeness or PolitenessPolicy()
+        self.wait_strategy = wait_strategy
+        self.driver_profile = driver_profile
+        self.backend: ParserBackend = get_backend(parser_backend)
+        self.selector_cache = selector_cache if selector_cache is not None else SelectorCache()
+        self.page_cache = page_cache
+        self.page_settle_timeout = 10.0
+        self.scroll_settle_timeout = 3.0
+        self._cards_missing = False
         self.driver = None
         self.wait = None
         self.session = None
         self.user_agent = UserAgent()
         self.categories_cache = {}
-        self.initialize_driver()
+        self.page_stats: List[Dict] = []
+        self.run_stats: Dict = {}
+        # Set for the length of a search; the extractors check cards against it.
+        self.filters: Optional[GigFilters] = None
+        # Cards found on the last parsed page, including any the filters rejected.
+        self.last_page_cards = 0
+        self.fields: Optional[frozenset] = None
+        # Receives progress events (dicts with a 'type') for the length of a search.
+        self.on_event: Optional[Callable[[Dict], None]] = None
+        # Checked at safe points during a search to pause it or stop it early.
+        self.control: Optional[ScrapeControl] = None
+        self._card_rules = CARD_RULES_BY_TAG
+        self._card_rule_names: Optional[frozenset] = None
+        self._omitted_fields: Tuple[str, ...] = ()
+        self.pages_served = 0
+        # Chrome is restarted between pages once its process tree grows past this.
+        self.max_browser_rss = max_browser_rss
+        # HTTP-first modes only pay for Chrome once a page actually needs it.
+        if fetch_mode == "browser":
+            self.initialize_driver()
         self.initialize_session()
         
     def initialize_driver(self):
@@ -89,19 +317,79 @@ class AdvancedFiverrScraper:
         if self.proxy:
             chrome_options.add_argument(f'--proxy-server={self.proxy}')
         
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--start-maximized")
+        if self.driver_profile == "lean":
+            for argument in self.LEAN_CHROME_ARGS:
+                chrome_options.add_argument(argument)
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            })
+            # Readiness waits decide when the page is done; don't block on every subresource.
+            chrome_options.page_load_strategy = "eager"
+        else:
+            chrome_options.add_argument("--window-size=1920,1080")
+            chrome_options.add_argument("--start-maximized")
         
         try:
-            service = Service(ChromeDriverManager().install())
+            service = Service(chromedriver_path())
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            if self.driver_profile == "lean":
+                self._block_resources()
             self.wait = WebDriverWait(self.driver, 15)
             logger.info("Chrome driver initialized")
         except Exception as e:
             logger.error(f"Failed to initialize driver: {e}")
             raise
     
+    def _block_resources(self):
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning(f"Could not set up request blocking: {e}")
+    
+    def _page_metrics(self) -> Dict:
+        try:
+            document_bytes, resource_bytes, requests_made, load_ms = self.driver.execute_script(self.PAGE_METRICS_JS)
+        except Exception:
+            return {}
+        # Cross-origin resources report 0 bytes unless they send Timing-Allow-Origin.
+        return {
+            'bytes': int(document_bytes + resource_bytes),
+            'requests': int(requests_made),
+            'load_seconds': load_ms / 1000,
+        }
+    
+    def restart_driver(self):
+        """Swap the browser for a fresh one with the same settings; the HTTP session stays."""
+        had_driver = self.driver is not None
+        if had_driver:
+            try:
+                self.driver.quit()
+            except Exception as e:
+                logger.warning(f"Failed to quit browser: {e}")
+        self.driver = None
+        self.wait = None
+        self.pages_served = 0
+        if had_driver or self.fetch_mode == "browser":
+            self.initialize_driver()
+    
+    def browser_memory_bytes(self) -> int:
+        """RSS of chromedriver plus every Chrome process it started; 0 without a browser."""
+        process = getattr(getattr(self.driver, 'service', None), 'process', None)
+        if process is None:
+            return 0
+        return process_tree_rss(process.pid)
+    
+    def is_healthy(self) -> bool:
+        if self.driver is None:
+            return True
+        try:
+            return self.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+    
     def initialize_session(self):
         self.session = requests.Session()
         self.session.headers.update({
@@ -109,6 +397,32 @@ class AdvancedFiverrScraper:
             'Accept': 'application/json, text/plain, */*',
             'Accept-Language': 'en-US,en;q=0.9',
         })
+        if self.proxy:
+            self.session.proxies.update({'http': self.proxy, 'https': self.proxy})
+    
+    def ensure_driver(self):
+        if self.driver is None:
+            self.initialize_driver()
+    
+    def set_fields(self, fields: Optional[List[str]]):
+        """Restrict card extraction to these GigData fields (None for all of them).
+        
+        Set filters first: the fields they check are always extracted.
+        """
+        if fields is None:
+            self.fields, self._card_rules, self._card_rule_names = None, CARD_RULES_BY_TAG, None
+            self._omitted_fields = ()
+            return
+        unknown = set(fields) - set(PROJECTABLE_FIELDS) - set(ALWAYS_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown gig fields: {', '.join(sorted(unknown))}")
+        names = frozenset(PROJECTABLE_FIELDS[name] for name in fields if name in PROJECTABLE_FIELDS)
+        if self.filters is not None:
+            names |= FILTER_RULES
+        self.fields = frozenset(fields)
+        self._card_rules = card_rules_by_tag(names)
+        self._card_rule_names = names
+        self._omitted_fields = tuple(name for name in PROJECTABLE_FIELDS if name not in self.fields)
     
     def search_gigs_advanced(
         self,
@@ -121,72 +435,492 @@ class AdvancedFiverrScraper:
         sort_by: str = "relevant",
         delivery_time: Optional[str] = None,
         online_only: bool = False,
-        top_rated_seller: bool = False
+        top_rated_seller: bool = False,
+        sink: Optional[GigSink] = None,
+        index: Optional[GigIndex] = None,
+        start_page: int = 1,
+        on_page: Optional[Callable[[int, List[GigData], bool], None]] = None,
+        fields: Optional[List[str]] = None,
+        on_event: Optional[Callable[[Dict], None]] = None,
+        control: Optional[ScrapeControl] = None
     ) -> List[GigData]:
         
+        if index is not None and fields is not None:
+            # Fields left out are empty, so every known gig would hash as
+            # changed and rows missing those fields would land in its history.
+            missing = set(HASH_FIELDS) - set(fields)
+            if missing:
+                raise ValueError(f"An index needs every hashed field; fields is missing {', '.join(sorted(missing))}")
         all_gigs = []
+        seen_urls = set()
+        self.page_stats = []
+        self.run_stats = {'driver_restarts': 0}
+        filters = GigFilters(min_price, max_price, min_rating, top_rated_seller)
+        self.filters = filters if filters.active else None
+        self.set_fields(fields)
+        self.on_event = on_event
+        self.control = control
+        cancelled = False
+        started = time.perf_counter()
         
         try:
-            base_url = "https://www.fiverr.com/search/gigs"
-            
-            query_parts = []
-            if keywords:
-                query_parts.append(" ".join(keywords))
-            if category:
-                query_parts.append(category)
-            
-            search_query = " ".join(query_parts)
-            encoded_query = urllib.parse.quote(search_query)
-            
-            url = f"{base_url}?query={encoded_query}"
-            
-            sort_map = {
-                "relevant": "relevant",
-                "best_selling": "best_selling",
-                "newest": "newest",
-                "rating": "seller_rating"
-            }
-            url += f"&order={sort_map.get(sort_by, 'relevant')}"
-            
-            if delivery_time:
-                url += f"&delivery={delivery_time}"
-            if online_only:
-                url += "&online=true"
-            
+            url = self.build_search_url(keywords, category, sort_by, delivery_time, online_only,
+                                        min_price, max_price, top_rated_seller)
             logger.info(f"Searching with URL: {url}")
+            self._emit('search_started', start_page=start_page, max_pages=max_pages)
             
-            for page in range(1, max_pages + 1):
+            for page in range(start_page, max_pages + 1):
+                if self._should_stop():
+                    cancelled = True
+                    break
                 try:
-                    page_url = f"{url}&page={page}" if page > 1 else url
                     logger.info(f"Scraping page {page}")
+                    self._emit('page_started', page=page)
+                    page_gigs, has_next = self.scrape_page_with_recovery(self.page_url(url, page))
+                    parsed = len(page_gigs)
+                    # Cancelled while this page was loading: its cards so far are
+                    # kept, unless the caller checkpoints pages (on_page). Then the
+                    # page is dropped before the index or sink sees it, so a
+                    # resume fetches it whole instead of writing its gigs twice.
+                    cut_short = self._cancelled()
+                    if cut_short and on_page is not None:
+                        logger.info(f"Dropping page {page}, cut short by the cancel")
+                        cancelled = True
+                        break
                     
-                    self.driver.get(page_url)
-                    time.sleep(np.random.uniform(2, 4))
-                    
-                    self._scroll_page_gradually()
-                    page_gigs = self._parse_advanced_page()
+                    unique_gigs = []
+                    for gig in page_gigs:
+                        key = canonical_gig_url(gig.url)
+                        if key is None or key not in seen_urls:
+                            seen_urls.add(key)
+                            unique_gigs.append(gig)
+                    page_gigs = unique_gigs
                     
-                    if min_rating:
-                        page_gigs = [gig for gig in page_gigs if gig.rating >= min_rating]
+                    # Incremental mode: only new or changed gigs are returned, and a
+                    # page of nothing but unchanged known gigs ends the pagination.
+                    all_unchanged = False
+                    indexed = page_gigs if index is not None else []
+                    if indexed:
+                        page_gigs, unchanged = index.changes(indexed)
+                        all_unchanged = not page_gigs
                     
                     all_gigs.extend(page_gigs)
+                    if sink is not None:
+                        sink.write(page_gigs)
+                    if indexed:
+                        # Gigs are marked as seen only once they are safely in the
+                        # sink; a crash in between emits them again next run
+                        # instead of losing them.
+                        if sink is not None and hasattr(sink, 'flush'):
+                            sink.flush()
+                        index.update(indexed)
                     logger.info(f"Found {len(page_gigs)} gigs on page {page}")
+                    stats = self.page_stats[-1] if self.page_stats else {}
+                    self._emit('page_finished', page=page, parsed=parsed, gigs=len(page_gigs),
+                               total_gigs=len(all_gigs), has_next=has_next and not all_unchanged,
+                               seconds=stats.get('seconds'), tier=stats.get('tier'),
+                               browser_rss=stats.get('browser_rss'), partial=cut_short)
+                    if cut_short:
+                        cancelled = True
+                        break
+                    if on_page is not None:
+                        # Called once the page's gigs are in the sink, e.g. to checkpoint.
+                        on_page(page, page_gigs, has_next and not all_unchanged)
                     
-                    if not self._has_next_page():
+                    if not has_next:
+                        break
+                    if all_unchanged:
+                        logger.info(f"All {unchanged} gigs on page {page} are unchanged, stopping early")
                         break
                     
-                    time.sleep(np.random.uniform(3, 6))
+                    self.politeness.between_pages(self.control)
                     
                 except Exception as e:
                     logger.error(f"Error scraping page {page}: {e}")
+                    self._emit('page_failed', page=page, error=str(e))
                     break
             
+            self.run_stats.update(self.memory_summary())
+            self.run_stats['filtered'] = dict(filters.eliminated)
+            self.run_stats['cancelled'] = cancelled
+            if cancelled:
+                logger.info(f"Search cancelled after {len(self.page_stats)} pages, keeping the gigs found so far")
+            if filters.rejected:
+                logger.info("Cards eliminated by filters: " + ", ".join(
+                    f"{name} {count}" for name, count in filters.eliminated.items() if count))
             logger.info(f"Total gigs scraped: {len(all_gigs)}")
+            self._emit('search_finished', pages=len(self.page_stats), gigs=len(all_gigs),
+                       seconds=time.perf_counter() - started, **self.run_stats)
             return all_gigs
             
         except Exception as e:
             logger.error(f"Search failed: {e}")
+            self._emit('search_failed', error=str(e))
             return []
+        finally:
+            self.filters = None
+            self.set_fields(None)
+            self.on_event = None
+            self.control = None
+    
+    def _cancelled(self) -> bool:
+        return self.control is not None and self.control.cancelled
+    
+    def _should_stop(self) -> bool:
+        # Blocks while the search is paused; the browser just sits on its page.
+        return self.control is not None and self.control.wait()
+    
+    def _sleep(self, seconds: float):
+        if self.control is not None:
+            self.control.sleep(seconds)
+        else:
+            time.sleep(seconds)
+    
+    def _emit(self, event_type: str, **data):
+        if self.on_event is None:
+            return
+        data['type'] = event_type
+        data['time'] = time.time()
+        try:
+            self.on_event(data)
+        except Exception as e:
+            logger.warning(f"Event handler failed on {event_type}: {e}")
+    
+    def build_search_url(
+        self,
+        keywords: List[str],
+        category: Optional[str] = None,
+        sort_by: str = "relevant",
+        delivery_time: Optional[str] = None,
+        online_only: bool = False,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        top_rated_seller: bool = False
+    ) -> str:
+        query_parts = []
+        if keywords:
+            query_parts.append(" ".join(keywords))
+        if category:
+            query_parts.append(category)
+        
+        search_query = " ".join(query_parts)
+        encoded_query = urllib.parse.quote(search_query)
+        
+        url = f"{self.base_url}/search/gigs?query={encoded_query}"
+        url += f"&order={self.SORT_MAP.get(sort_by, 'relevant')}"
+        
+        if delivery_time:
+            url += f"&delivery={delivery_time}"
+        if online_only:
+            url += "&online=true"
+        facets = GigFilters(min_price, max_price, top_rated_seller=top_rated_seller).url_facets()
+        if facets:
+            url += f"&ref={facets}"
+        
+        return url
+    
+    @staticmethod
+    def page_url(url: str, page: int) -> str:
+        return f"{url}&page={page}" if page > 1 else url
+    
+    def scrape_page(self, page_url: str) -> Tuple[List[GigData], bool]:
+        started = time.perf_counter()
+        stats = {'url': page_url}
+        page_gigs, has_next, tier = [], False, None
+        # A page whose cards were all filtered out is done; only a page without
+        # cards falls through to the next tier.
+        self.last_page_cards = 0
+        
+        cached = self.page_cache.get(page_url) if self.page_cache is not None else None
+        if cached is not None and (cached.fresh or self.fetch_mode == "offline"):
+            page_gigs, has_next, _ = self.parse_page_html(cached.html)
+            tier = "cache"
+        elif self.fetch_mode == "offline":
+            logger.warning(f"Page not in cache, skipping: {page_url}")
+        
+        if not self.last_page_cards and self.fetch_mode in ("auto", "http") and not self._cancelled():
+            page_gigs, has_next, tier = self._scrape_page_http(page_url, cached)
+        
+        if not self.last_page_cards and self.fetch_mode in ("auto", "browser") and not self._cancelled():
+            page_gigs, has_next = self._scrape_page_browser(page_url, stats)
+            tier = "browser"
+        
+        stats.update({
+            'tier': tier or "http",
+            'cards': self.last_page_cards,
+            'gigs': len(page_gigs),
+            'seconds': time.perf_counter() - started,
+        })
+        if self.driver is not None:
+            stats['browser_rss'] = self.browser_memory_bytes()
+        self.page_stats.append(stats)
+        self.pages_served += 1
+        if 'bytes' in stats:
+            logger.info(f"Page served by {stats['tier']} tier in {stats['seconds']:.2f}s "
+                        f"({stats['bytes'] / 1024:.0f} KiB in {stats['requests'] + 1} requests, "
+                        f"load {stats['load_seconds']:.2f}s)")
+        else:
+            logger.info(f"Page served by {stats['tier']} tier in {stats['seconds']:.2f}s")
+        return page_gigs, has_next
+    
+    def scrape_page_with_recovery(self, page_url: str) -> Tuple[List[GigData], bool]:
+        """scrape_page with the memory governor applied.
+        
+        A browser that crashed is restarted and the page retried once, and one
+        over max_browser_rss is restarted before the next page, so long runs
+        pick up from the last completed page instead of ending early.
+        """
+        result = self._with_recovery(self.scrape_page, page_url)
+        self._check_browser_rss(self.page_stats[-1].get('browser_rss') if self.page_stats else None)
+        return result
+    
+    def fetch_page_html_with_recovery(self, page_url: str, use_browser: bool = False
+                                      ) -> Tuple[Optional[str], Optional[bool], Optional[str]]:
+        """fetch_page_html with the same memory governor as scrape_page_with_recovery."""
+        result = self._with_recovery(lambda url: self.fetch_page_html(url, use_browser), page_url)
+        if self.driver is not None:
+            self._check_browser_rss(self.browser_memory_bytes())
+        return result
+    
+    def _with_recovery(self, fetch: Callable, page_url: str):
+        try:
+            return fetch(page_url)
+        except Exception as e:
+            if self.driver is None or self._cancelled() or self.is_healthy():
+                raise
+            logger.warning(f"Browser stopped responding ({e}), restarting it and retrying {page_url}")
+            self._governor_restart("unresponsive")
+            self._emit('retry', url=page_url, error=str(e))
+            return fetch(page_url)
+    
+    def _check_browser_rss(self, rss: Optional[int]):
+        if self.max_browser_rss and rss and rss > self.max_browser_rss:
+            logger.warning(f"Browser uses {rss / 2 ** 20:.0f} MiB (limit {self.max_browser_rss / 2 ** 20:.0f} MiB), "
+                           f"restarting it before the next page")
+            self._governor_restart("memory", browser_rss=rss)
+    
+    def _governor_restart(self, reason: str, **data):
+        self.restart_driver()
+        self.run_stats['driver_restarts'] = self.run_stats.get('driver_restarts', 0) + 1
+        self._emit('driver_restart', reason=reason, **data)
+    
+    def memory_summary(self) -> Dict:
+        samples = [stats['browser_rss'] for stats in self.page_stats if stats.get('browser_rss')]
+        if not samples:
+            return {'peak_browser_rss': 0, 'avg_browser_rss': 0}
+        return {'peak_browser_rss': max(samples), 'avg_browser_rss': sum(samples) // len(samples)}
+    
+    def fetch_page_html(self, page_url: str,
+                        use_browser: bool = False) -> Tuple[Optional[str], Optional[bool], Optional[str]]:
+        """Fetch a page without parsing it, e.g. to hand the HTML to a ParsePipeline.
+        
+        Returns (html, has_next, tier); has_next is None when only parsing the
+        HTML can tell. `use_browser` skips the cache and HTTP tiers.
+        """
+        self.pages_served += 1
+        cached = None
+        if self.page_cache is not None and not use_browser:
+            cached = self.page_cache.get(page_url)
+        if cached is not None and (cached.fresh or self.fetch_mode == "offline"):
+            return cached.html, None, "cache"
+        if self.fetch_mode == "offline":
+            logger.warning(f"Page not in cache, skipping: {page_url}")
+            return None, False, None
+        
+        if not use_browser and self.fetch_mode in ("auto", "http"):
+            html, tier = self._fetch_http(page_url, cached)
+            if html is not None:
+                return html, None, tier
+        
+        if self.fetch_mode in ("auto", "browser"):
+            html = self._render_page(page_url, {})
+            return html, self._has_next_page(), "browser"
+        return None, False, None
+    
+    def _fetch_http(self, page_url: str, cached: Optional[CachedPage] = None) -> Tuple[Optional[str], Optional[str]]:
+        headers = {'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'}
+        # Stale entries are revalidated; a 304 costs no body and no re-download.
+        if cached is not None and cached.source == "http":
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+        try:
+            response = self.session.get(page_url, timeout=15, headers=headers)
+        except requests.RequestException as e:
+            logger.warning(f"HTTP fetch failed for {page_url}: {e}")
+            return None, None
+        
+        if response.status_code == 304 and cached is not None:
+            self.page_cache.touch(page_url)
+            return cached.html, "cache"
+        
+        if response.status_code != 200:
+            logger.info(f"HTTP fetch returned {response.status_code}, falling back")
+            return None, None
+        
+        if self.page_cache is not None:
+            self.page_cache.put(page_url, response.text, response.headers.get('ETag'),
+                                response.headers.get('Last-Modified'), source="http")
+        return response.text, "http"
+    
+    def _scrape_page_http(self, page_url: str,
+                          cached: Optional[CachedPage] = None) -> Tuple[List[GigData], bool, Optional[str]]:
+        html, tier = self._fetch_http(page_url, cached)
+        if html is None:
+            return [], False, None
+        page_gigs, has_next, parsed_tier = self.parse_page_html(html)
+        return page_gigs, has_next, tier if tier == "cache" else parsed_tier
+    
+    def parse_page_html(self, html: str) -> Tuple[List[GigData], bool, str]:
+        doc = self.backend.parse(html)
+        fingerprint = self.selector_cache.fingerprint(self.backend, doc)
+        entry = self.selector_cache.get(fingerprint)
+        
+        # Layouts known to render cards only in markup skip the state lookup.
+        if entry is None or entry['strategy'] == "json":
+            page_gigs, cards = self._parse_embedded_state(doc)
+            self.last_page_cards = cards
+            if cards:
+                self.selector_cache.remember(fingerprint, "json")
+                return page_gigs, self._has_next_page_html(doc), "json"
+            if entry is not None:
+                self.selector_cache.invalidate(fingerprint)
+        
+        page_gigs = self._parse_advanced_page(doc, fingerprint)
+        return page_gigs, self._has_next_page_html(doc), "http"
+    
+    def _scrape_page_browser(self, page_url: str, stats: Dict) -> Tuple[List[GigData], bool]:
+        html = self._render_page(page_url, stats)
+        self.last_page_cards = 0
+        page_gigs = self._parse_advanced_page(self.backend.parse(html))
+        return page_gigs, self._has_next_page()
+    
+    def _render_page(self, page_url: str, stats: Dict) -> str:
+        self.ensure_driver()
+        started = time.perf_counter()
+        self.driver.get(page_url)
+        self._wait_for_page_ready()
+        stats['ready_seconds'] = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        self._scroll_page_gradually()
+        stats['scroll_seconds'] = time.perf_counter() - started
+        stats.update(self._page_metrics())
+        
+        html = self.driver.page_source
+        # A page whose scrolling was cut short would replay with cards missing.
+        if self.page_cache is not None and not self._cancelled():
+            self.page_cache.put(page_url, html, source="browser")
+        return html
+    
+    def _wait_for_page_ready(self):
+        if self.wait_strategy == "fixed":
+            self._sleep(np.random.uniform(2, 4))
+            return
+        
+        card_selector = ", ".join(self.CARD_SELECTORS)
+        # Once a layout without the known selectors has been seen, waiting the
+        # full timeout for them on every page only slows the fallback parser down.
+        if not self._cards_missing:
+            try:
+                self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, card_selector)))
+            except TimeoutException:
+                logger.warning("No known gig card selector appeared, relying on fallback parsing")
+                self._cards_missing = True
+        
+        self._wait_until_settled(self.page_settle_timeout, quiet_period=0.5)
+    
+    def _wait_until_settled(self, timeout: float, quiet_period: float) -> bool:
+        card_selector = ", ".join(self.CARD_SELECTORS)
+        state = {'snapshot': None, 'since': time.monotonic()}
+        
+        def settled(driver):
+            if self._cancelled():
+                return True
+            snapshot = driver.execute_script(self.READY_SNAPSHOT_JS, card_selector)
+            now = time.monotonic()
+            if snapshot != state['snapshot']:
+                state['snapshot'], state['since'] = snapshot, now
+                return False
+            return snapshot[0] == "complete" and now - state['since'] >= quiet_period
+        
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(settled)
+            return True
+        except TimeoutException:
+            return False
+    
+    def _parse_embedded_state(self, doc) -> Tuple[List[GigData], int]:
+        gigs, cards = [], 0
+        for script_id in self.STATE_SCRIPT_IDS:
+            scripts = self.backend.select(doc, f'script#{script_id}')
+            content = self.backend.raw_text(scripts[0]) if scripts else ""
+            if not content:
+                continue
+            try:
+                state = json.loads(content)
+            except ValueError:
+                continue
+            
+            items = self._find_state_gigs(state)
+            for item in items:
+                if self._should_stop():
+                    break
+                try:
+                    gig = self._gig_from_state(item)
+                except Exception:
+                    continue
+                if gig is not None:
+                    gigs.append(gig)
+            if items:
+                cards = len(items)
+                break
+        return gigs, cards
+    
+    def _find_state_gigs(self, state) -> List[Dict]:
+        stack = [state]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                if node and all(isinstance(item, dict) and 'gig_url' in item for item in node):
+                    return node
+                stack.extend(node)
+            elif isinstance(node, dict):
+                stack.extend(node.values())
+        return []
+    
+    def _gig_from_state(self, item: Dict) -> Optional[GigData]:
+        seller_rating = item.get('seller_rating') or {}
+        rating = float(seller_rating.get('score') or 0.0)
+        price = item.get('price_i') or item.get('price')
+        level = str(item.get('seller_level') or "Level 1")
+        if self.filters is not None and (self.filters.rejects_rating(rating) or self.filters.rejects_price(price)
+                                         or self.filters.rejects_level(level)):
+            return None
+        
+        href = item.get('gig_url') or ""
+        url = href if href.startswith('http') else f"https://www.fiverr.com{href}"
+        return GigData(
+            title=item.get('title') or "N/A",
+            url=url,
+            freelancer=item.get('seller_name') or "N/A",
+            rating=rating,
+            reviews=int(seller_rating.get('count') or 0),
+            price=f"From ${price}" if price is not None else "N/A",
+            delivery_time=f"{item['delivery_days']} days" if item.get('delivery_days') else "N/A",
+            completed_jobs=int(item.get('seller_completed_orders') or 0),
+            category="",
+            keywords=[],
+            description=(item.get('description') or "")[:200],
+            tags=list(item.get('tags') or [])[:5],
+            level=level,
+            online_status=bool(item.get('is_seller_online') or item.get('seller_online')),
+            response_time=str(item.get('response_time') or "N/A"),
+            last_delivery="",
+            gig_created="",
+            scraped_at=datetime.now()
+        )
     
     def _scroll_page_gradually(self):
         total_height = self.driver.execute_script("return document.body.scrollHeight")
@@ -195,38 +929,43 @@ class AdvancedFiverrScraper:
         scroll_step = viewport_height // 2
         
         while current_position < total_height:
+            # Stopping here still parses the cards loaded so far.
+            if self._should_stop():
+                break
             self.driver.execute_script(f"window.scrollTo(0, {current_position});")
             current_position += scroll_step
-            time.sleep(np.random.uniform(0.5, 1.5))
+            if self.wait_strategy == "fixed":
+                self._sleep(np.random.uniform(0.5, 1.5))
+            else:
+                self._wait_until_settled(self.scroll_settle_timeout, quiet_period=0.2)
+                self.politeness.between_scrolls(self.control)
             new_height = self.driver.execute_script("return document.body.scrollHeight")
             if new_height > total_height:
                 total_height = new_height
     
-    def _parse_advanced_page(self) -> List[GigData]:
+    def _parse_advanced_page(self, doc=None, fingerprint: Optional[str] = None) -> List[GigData]:
         gigs = []
         
         try:
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            selectors = [
-                'article[data-test="gig-card"]',
-                'div[class*="gig-card"]',
-                'div[class*="gig-wrapper"]',
-            ]
+            if doc is None:
+                doc = self.backend.parse(self.driver.page_source)
+            if fingerprint is None:
+                fingerprint = self.selector_cache.fingerprint(self.backend, doc)
+            entry = self.selector_cache.get(fingerprint)
             
-            gig_cards = []
-            for selector in selectors:
-                elements = soup.select(selector)
-                if elements:
-                    gig_cards = elements
-                    break
+            gig_cards, selector = [], None
+            if entry and entry['strategy'] == "dom" and entry.get('selector'):
+                selector = entry['selector']
+                gig_cards = self.backend.select(doc, selector)
             
             if not gig_cards:
-                potential_cards = soup.find_all(['article', 'div'], {
-                    'class': re.compile(r'card|gig|listing', re.I)
-                })
-                gig_cards = [card for card in potential_cards if len(card.text.strip()) > 50]
+                gig_cards, selector = self._probe_card_selectors(doc)
+            self.last_page_cards = len(gig_cards)
+            rejected_before = self.filters.rejected if self.filters is not None else 0
             
             for card in gig_cards:
+                if self._should_stop():
+                    break
                 try:
                     gig_data = self._extract_gig_details(card)
                     if gig_data:
@@ -234,12 +973,139 @@ class AdvancedFiverrScraper:
                 except:
                     continue
             
+            # Cards the filters rejected still prove the selector matches gig cards.
+            matched = len(gigs) + (self.filters.rejected - rejected_before if self.filters is not None else 0)
+            if matched and selector:
+                self.selector_cache.remember(fingerprint, "dom", selector)
+            elif not matched and entry is not None and not self._cancelled():
+                self.selector_cache.invalidate(fingerprint)
+            
         except Exception as e:
             logger.error(f"Error parsing page: {e}")
         
         return gigs
     
+    def _probe_card_selectors(self, doc) -> Tuple[List, Optional[str]]:
+        for selector in self.CARD_SELECTORS:
+            elements = self.backend.select(doc, selector)
+            if elements:
+                return elements, selector
+        
+        gig_cards, selector = detect_repeated_cards(self.backend, doc)
+        if gig_cards:
+            logger.info(f"Detected gig card layout: {selector or 'no stable selector'}")
+        return gig_cards, selector
+    
     def _extract_gig_details(self, card) -> Optional[GigData]:
+        try:
+            backend = self.backend
+            found: Dict[str, object] = {}
+            collected: Dict[str, List] = {'tags': [], 'level': []}
+            href = None
+            rules_by_tag = self._card_rules
+            # A projection without collect-all fields is complete at the first
+            # match of each field, so the rest of the card needn't be walked.
+            names = self._card_rule_names
+            stop_at = len(names) if names is not None and not names & {'tags', 'level'} else None
+            
+            for elem in backend.iter_descendants(card):
+                tag = backend.tag(elem)
+                if href is None and tag == 'a':
+                    href = backend.get_attr(elem, 'href')
+                rules = rules_by_tag.get(tag)
+                class_text = backend.class_text(elem) if rules else None
+                if class_text:
+                    for field, _, pattern, collect_all in rules:
+                        if collect_all:
+                            if pattern.search(class_text):
+                                collected[field].append(elem)
+                        elif field not in found and pattern.search(class_text):
+                            found[field] = elem
+                # Checked for every element: a url-only projection is done at the first link.
+                if stop_at is not None and href is not None and len(found) == stop_at:
+                    break
+            
+            def text_of(field: str, default: Optional[str] = None) -> Optional[str]:
+                elem = found.get(field)
+                return backend.text(elem) if elem is not None else default
+            
+            rating = 0.0
+            rating_text = text_of('rating')
+            if rating_text is not None:
+                rating_match = RATING_RE.search(rating_text)
+                if rating_match:
+                    rating = float(rating_match.group(1))
+            
+            # Filters only need rating, price and level, so a rejected card
+            # costs none of the other fields' text extraction.
+            price = text_of('price', "N/A")
+            level = "Level 1"
+            for indicator in collected['level']:
+                level_text = backend.text(indicator)
+                if any(word in level_text.lower() for word in ['top', 'pro', 'level']):
+                    level = level_text
+            filters = self.filters
+            if filters is not None and (filters.rejects_rating(rating) or filters.rejects_price(price)
+                                        or filters.rejects_level(level)):
+                return None
+            
+            url = "N/A"
+            if href is not None:
+                if href and not href.startswith('http'):
+                    url = f"https://www.fiverr.com{href}"
+                else:
+                    url = href
+            
+            reviews = 0
+            reviews_text = text_of('reviews')
+            if reviews_text is not None:
+                reviews_match = REVIEWS_RE.search(reviews_text)
+                if reviews_match:
+                    reviews = int(reviews_match.group(1))
+            
+            completed_jobs = 0
+            jobs_text = text_of('completed')
+            if jobs_text is not None:
+                match = COMPLETED_JOBS_RE.search(jobs_text)
+                if match:
+                    completed_jobs = int(match.group(1).replace(',', ''))
+            
+            tags = []
+            for tag_elem in collected['tags']:
+                tag_text = backend.text(tag_elem)
+                if tag_text and len(tag_text) < 30:
+                    tags.append(tag_text)
+            
+            gig = GigData(
+                title=text_of('title', "N/A"),
+                url=url,
+                freelancer=text_of('seller', "N/A"),
+                rating=rating,
+                reviews=reviews,
+                price=price,
+                delivery_time=text_of('delivery', "N/A"),
+                completed_jobs=completed_jobs,
+                category="",
+                keywords=[],
+                description=text_of('description', "")[:200],
+                tags=list(set(tags))[:5],
+                level=level,
+                online_status='online' in found,
+                response_time=text_of('response', "N/A"),
+                last_delivery="",
+                gig_created="",
+                scraped_at=datetime.now()
+            )
+            for name in self._omitted_fields:
+                setattr(gig, name, [] if name == 'tags' else None)
+            return gig
+            
+        except Exception as e:
+            return None
+    
+    def _extract_gig_details_legacy(self, card) -> Optional[GigData]:
+        # Reference implementation: one subtree search per field. Kept to
+        # check the single-pass extractor against (see benchmark_scraper.py).
         try:
             title_elem = card.find(['h3', 'a'], {
                 'class': re.compile(r'title|gig-title', re.I)
@@ -384,60 +1250,58 @@ class AdvancedFiverrScraper:
         except:
             return False
     
-    def export_to_csv(self, gigs_data: List[GigData], filename: str):
+    def _has_next_page_html(self, doc) -> bool:
+        next_buttons = self.backend.select(doc, '[aria-label*="Next"], button[class*="next"], a[class*="next"]')
+        return any(self.backend.get_attr(button, 'disabled') is None
+                   and self.backend.get_attr(button, 'aria-disabled') != 'true'
+                   for button in next_buttons)
+    
+    def export_to_csv(self, gigs_data: List[GigData], filename: str,
+                      sort: bool = True, excel: bool = True) -> Optional[str]:
+        """Streams the gigs to a CSV, optionally sorted and copied to .xlsx.
+        
+        Returns the CSV's path, or None without gigs. This used to return the
+        gigs as a DataFrame; use pandas.read_csv on the path for one.
+        """
         if not gigs_data:
             logger.warning("No data to export")
-            return
-        
-        data = []
-        for gig in gigs_data:
-            data.append({
-                'Title': gig.title,
-                'URL': gig.url,
-                'Freelancer': gig.freelancer,
-                'Rating': gig.rating,
-                'Reviews': gig.reviews,
-                'Price': gig.price,
-                'Delivery Time': gig.delivery_time,
-                'Completed Jobs': gig.completed_jobs,
-                'Category': gig.category,
-                'Keywords': ', '.join(gig.keywords),
-                'Description': gig.description,
-                'Tags': ', '.join(gig.tags),
-                'Seller Level': gig.level,
-                'Online Status': 'Online' if gig.online_status else 'Offline',
-                'Response Time': gig.response_time,
-                'Scraped At': gig.scraped_at.strftime('%Y-%m-%d %H:%M:%S')
-            })
+            return None
         
-        df = pd.DataFrame(data)
-        df = df.sort_values(['Rating', 'Completed Jobs'], ascending=[False, False])
-        df.to_csv(filename, index=False, encoding='utf-8')
+        with CsvSink(filename, append=False, fsync=False, flush_every=1000) as sink:
+            sink.write(gigs_data)
+        if sort:
+            sort_csv(filename)
         logger.info(f"Data exported to {filename}")
         
-        try:
-            excel_filename = filename.replace('.csv', '.xlsx')
-            df.to_excel(excel_filename, index=False)
-            logger.info(f"Data also exported to {excel_filename}")
-        except:
-            pass
+        if excel:
+            try:
+                excel_filename = csv_to_excel(filename)
+                logger.info(f"Data also exported to {excel_filename}")
+            except Exception as e:
+                logger.warning(f"Excel export failed: {e}")
         
-        return df
+        return filename
     
     def export_to_json(self, gigs_data: List[GigData], filename: str):
         if not gigs_data:
             return
         
-        data = []
-        for gig in gigs_data:
-            data.append(gig.to_dict())
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if filename.endswith('.jsonl'):
+            with JsonLinesSink(filename, append=False, fsync=False, flush_every=1000) as sink:
+                sink.write(gigs_data)
+        else:
+            # Written element by element so no second full copy of the data is built.
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write('[')
+                for index, gig in enumerate(gigs_data):
+                    f.write(',\n  ' if index else '\n  ')
+                    f.write(json.dumps(gig.to_dict(), indent=2, ensure_ascii=False).replace('\n', '\n  '))
+                f.write('\n]')
         
         logger.info(f"Data exported to {filename}")
     
     def close(self):
+        self.selector_cache.save()
         if self.driver:
             self.driver.quit()
             logger.info("Browser closed")
@@ -0,0 +1,251 @@
+import time
+import random
+import asyncio
+import logging
+import threading
+import urllib.parse
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import aiohttp
+from advanced_fiverr_scraper import AdvancedFiverrScraper, GigData
+from gig_index import canonical_gig_url
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+@dataclass(frozen=True)
+class SearchPageJob:
+    keywords: Tuple[str, ...]
+    category: Optional[str]
+    page: int
+    sort_by: str = "relevant"
+    delivery_time: Optional[str] = None
+    online_only: bool = False
+    min_rating: Optional[float] = None
+    
+    @property
+    def query_key(self) -> Tuple:
+        return (self.keywords, self.category, self.sort_by, self.delivery_time, self.online_only)
+
+class TokenBucket:
+    """Refills `rate` tokens per second up to `capacity`; each request takes one."""
+    
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class AsyncCrawlEngine:
+    """HTTP-only crawler for many search pages at once.
+    
+    Jobs are fetched with at most `concurrency` requests in flight, each host
+    is throttled by its own token bucket, and failed requests are retried with
+    jittered exponential backoff. Parsing reuses AdvancedFiverrScraper's HTML
+    parser in worker threads so the event loop keeps fetching meanwhile; each
+    thread has its own parser, since a scraper keeps per-page state.
+    """
+    
+    def __init__(
+        self,
+        concurrency: int = 8,
+        rate_per_host: float = 1.0,
+        burst: float = 2.0,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 30.0,
+        timeout: float = 20.0,
+        base_url: str = "https://www.fiverr.com",
+        proxy: Optional[str] = None
+    ):
+        self.concurrency = concurrency
+        self.rate_per_host = rate_per_host
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.timeout = timeout
+        self.proxy = proxy
+        self.parser = AdvancedFiverrScraper(base_url=base_url, proxy=proxy, fetch_mode="http")
+        self._thread_parser = threading.local()
+        self._thread_parsers: List[AdvancedFiverrScraper] = []
+        self._parsers_lock = threading.Lock()
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.stats = {'pages': 0, 'skipped': 0, 'retries': 0, 'failed': 0, 'gigs': 0, 'duplicates': 0}
+        
+    @staticmethod
+    def expand_jobs(
+        keyword_sets: List[List[str]],
+        category: Optional[str] = None,
+        max_pages: int = 3,
+        sort_by: str = "relevant",
+        delivery_time: Optional[str] = None,
+        online_only: bool = False,
+        min_rating: Optional[float] = None
+    ) -> List[SearchPageJob]:
+        # Page-major so the first pages of every sweep land before deep pagination.
+        return [
+            SearchPageJob(tuple(keywords), category, page, sort_by, delivery_time, online_only, min_rating)
+            for page in range(1, max_pages + 1)
+            for keywords in keyword_sets
+        ]
+        
+    def _bucket(self, url: str) -> TokenBucket:
+        host = urllib.parse.urlparse(url).netloc
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(self.rate_per_host, self.burst)
+        return self.buckets[host]
+        
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+        
+    async def _fetch(self, session, url: str) -> Optional[str]:
+        for attempt in range(self.max_retries + 1):
+            await self._bucket(url).acquire()
+            retry_after = None
+            try:
+                async with session.get(url, proxy=self.proxy) as response:
+                    if response.status == 200:
+                        return await response.text()
+                    if response.status not in RETRY_STATUSES:
+                        logger.warning(f"Giving up on {url}: HTTP {response.status}")
+                        return None
+                    retry_after = response.headers.get('Retry-After')
+                    reason = f"HTTP {response.status}"
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                reason = str(e) or type(e).__name__
+            
+            if attempt < self.max_retries:
+                delay = self._backoff(attempt, retry_after)
+                self.stats['retries'] += 1
+                logger.info(f"Retrying {url} in {delay:.1f}s ({reason})")
+                await asyncio.sleep(delay)
+        
+        logger.error(f"Failed to fetch {url} after {self.max_retries + 1} attempts")
+        return None
+        
+    def _parse(self, html: str) -> Tuple[List[GigData], bool, str]:
+        parser = getattr(self._thread_parser, 'scraper', None)
+        if parser is None:
+            # Layouts learned by one thread are shared through the selector cache.
+            parser = AdvancedFiverrScraper(base_url=self.parser.base_url, fetch_mode="http",
+                                           selector_cache=self.parser.selector_cache)
+            self._thread_parser.scraper = parser
+            with self._parsers_lock:
+                self._thread_parsers.append(parser)
+        return parser.parse_page_html(html)
+        
+    async def crawl(self, jobs: List[SearchPageJob]) -> AsyncIterator[GigData]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        finished: asyncio.Queue = asyncio.Queue()
+        last_page: Dict[Tuple, int] = {}
+        seen_urls = set()
+        loop = asyncio.get_running_loop()
+        
+        def past_end(job: SearchPageJob) -> bool:
+            if job.page > last_page.get(job.query_key, job.page):
+                self.stats['skipped'] += 1
+                return True
+            return False
+        
+        async def run_job(job: SearchPageJob, session) -> Tuple[SearchPageJob, List[GigData], bool]:
+            """Returns the job, its gigs and whether the query may go on past it."""
+            try:
+                async with semaphore:
+                    if past_end(job):
+                        return job, [], False
+                    url = AdvancedFiverrScraper.page_url(self.parser.build_search_url(
+                        list(job.keywords), job.category, job.sort_by, job.delivery_time, job.online_only
+                    ), job.page)
+                    html = await self._fetch(session, url)
+                if html is None:
+                    self.stats['failed'] += 1
+                    last_page[job.query_key] = min(last_page.get(job.query_key, job.page), job.page - 1)
+                    return job, [], False
+                
+                # Saves parsing a page that another page already showed to be past the end.
+                if past_end(job):
+                    return job, [], False
+                page_gigs, has_next, _ = await loop.run_in_executor(None, self._parse, html)
+                self.stats['pages'] += 1
+                more = has_next and bool(page_gigs)
+                if not more:
+                    last_page[job.query_key] = min(last_page.get(job.query_key, job.page), job.page)
+                if job.min_rating:
+                    page_gigs = [gig for gig in page_gigs if gig.rating >= job.min_rating]
+                return job, page_gigs, more
+            except Exception as e:
+                logger.error(f"Job {job} failed: {e}")
+                self.stats['failed'] += 1
+                return job, [], False
+        
+        # Pages finish out of order, so each query's pages are released in page
+        # order: a page is only yielded once every page before it had a next one,
+        # and pages past the first one without are dropped.
+        unreleased: Dict[Tuple, List[int]] = {}
+        for job in jobs:
+            unreleased.setdefault(job.query_key, []).append(job.page)
+        for pages in unreleased.values():
+            pages.sort()
+        completed: Dict[Tuple[Tuple, int], Tuple[List[GigData], bool]] = {}
+        
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        headers = dict(self.parser.session.headers)
+        headers['Accept'] = 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
+        
+        async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
+            tasks = []
+            for job in jobs:
+                task = asyncio.ensure_future(run_job(job, session))
+                task.add_done_callback(finished.put_nowait)
+                tasks.append(task)
+            
+            try:
+                for _ in range(len(tasks)):
+                    job, page_gigs, more = (await finished.get()).result()
+                    pages = unreleased[job.query_key]
+                    if not pages:
+                        continue
+                    completed[(job.query_key, job.page)] = (page_gigs, more)
+                    while pages and (job.query_key, pages[0]) in completed:
+                        page_gigs, more = completed.pop((job.query_key, pages.pop(0)))
+                        for gig in page_gigs:
+                            key = canonical_gig_url(gig.url)
+                            if key is not None and key in seen_urls:
+                                self.stats['duplicates'] += 1
+                                continue
+                            seen_urls.add(key)
+                            self.stats['gigs'] += 1
+                            yield gig
+                        if not more:
+                            for page in pages:
+                                completed.pop((job.query_key, page), None)
+                            pages.clear()
+            finally:
+                for task in tasks:
+                    task.cancel()
+                    
+    async def collect(self, jobs: List[SearchPageJob]) -> List[GigData]:
+        return [gig async for gig in self.crawl(jobs)]
+        
+    def close(self):
+        with self._parsers_lock:
+            parsers, self._thread_parsers = self._thread_parsers, []
+        for parser in parsers:
+            parser.close()
+        self.parser.close()
\ No newline at end of file
@@ -0,0 +1,557 @@
+import argparse
+import hashlib
+import random
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+LEVELS = ["Level 1", "Level 2", "Top Rated", "Pro"]
+WORDS = ["logo", "website", "wordpress", "design", "seo", "shopify", "landing", "page",
+         "modern", "minimalist", "responsive", "custom", "professional", "ecommerce"]
+
+def make_gig_card(rng: random.Random, index: int) -> str:
+    title = " ".join(rng.choice(WORDS) for _ in range(8)).capitalize()
+    slug = "-".join(title.lower().split()[:5])
+    seller = f"seller_{rng.randint(1000, 99999)}"
+    tags = "".join(f'<a class="tag" href="/tags/{w}">{w}</a>' for w in rng.sample(WORDS, 4))
+    return f"""
+    <article data-test="gig-card" class="gig-card-layout">
+      <div class="gig-card-wrapper">
+        <a class="media" href="/{seller}/{slug}-{index}"><img src="/img/{index}.jpg"></a>
+        <div class="seller-info">
+          <span class="seller-name">{seller}</span>
+          <span class="seller-level">{rng.choice(LEVELS)}</span>
+          <span class="online-indicator">Online</span>
+        </div>
+        <h3 class="gig-title">{title}</h3>
+        <p class="gig-description">I will {title.lower()} for your business, fast and clean.</p>
+        <div class="rating-wrapper">
+          <span class="rating-score">{rng.uniform(4, 5):.1f}</span>
+          <span class="rating-count">({rng.randint(1, 2500)})</span>
+        </div>
+        <div class="tags-row">{tags}</div>
+        <div class="stats-row">
+          <span class="delivery-time">{rng.choice([1, 2, 3, 5, 7, 14])} days delivery</span>
+          <span class="orders-completed">{rng.randint(0, 5000):,} orders completed</span>
+          <span class="response-time">Avg. response time: {rng.randint(1, 24)} hours</span>
+        </div>
+        <footer class="price-wrapper"><span class="price">From ${rng.randint(5, 1500)}</span></footer>
+      </div>
+    </article>"""
+
+def make_search_page(page: int, total_pages: int = 20, cards_per_page: int = 48, seed: int = 0) -> str:
+    rng = random.Random(seed * 100003 + page)
+    cards = "".join(make_gig_card(rng, (page - 1) * cards_per_page + i) for i in range(cards_per_page))
+    next_link = '<a class="pagination-next" aria-label="Next" href="#">Next</a>' if page < total_pages else ""
+    return f"""<!DOCTYPE html>
+<html><head><title>Fiverr search fixture</title></head>
+<body class="search-page">
+  <header class="site-header"><nav class="main-nav"><a href="/">Home</a></nav></header>
+  <main class="search-results">
+    <div class="gig-listing">{cards}</div>
+    <div class="pagination">{next_link}</div>
+  </main>
+  <footer class="site-footer">fixture</footer>
+</body></html>"""
+
+class FixtureServer:
+    """Serves synthetic Fiverr search pages on localhost for repeatable benchmarks."""
+    
+    def __init__(self, total_pages: int = 20, cards_per_page: int = 48, latency: float = 0.0):
+        total, per_page = total_pages, cards_per_page
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.startswith('/img/'):
+                    # Stand-in thumbnails so browser benchmarks pay for image traffic.
+                    body = bytes(48 * 1024)
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'image/jpeg')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+                params = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+                page = int(params.get('page', ['1'])[0])
+                if latency:
+                    time.sleep(latency)
+                body = make_search_page(page, total, per_page).encode('utf-8')
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                self.end_headers()
+                self.wfile.write(body)
+                
+            def log_message(self, *args):
+                pass
+        
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+        
+    def __enter__(self):
+        self.thread.start()
+        return self
+        
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+def bench_pool(sizes: List[int], pages: int, politeness: float):
+    from advanced_fiverr_scraper import AdvancedFiverrScraper, PolitenessPolicy
+    from scraper_pool import DriverPool, PooledPageScheduler
+    
+    with FixtureServer(total_pages=pages) as server:
+        baseline = None
+        for size in sizes:
+            factory = lambda: AdvancedFiverrScraper(headless=True, base_url=server.base_url, fetch_mode="browser")
+            with DriverPool(size, factory=factory) as pool:
+                policy = PolitenessPolicy(between_pages=(politeness, politeness))
+                scheduler = PooledPageScheduler(pool, politeness=policy)
+                gigs = scheduler.search(keywords=["logo"], max_pages=pages)
+                rate = scheduler.stats['pages_per_second']
+                baseline = baseline or rate
+                print(f"pool={size:2d} pages={scheduler.stats['pages_fetched']:3d} gigs={len(gigs):5d} "
+                      f"time={scheduler.stats['seconds']:6.1f}s rate={rate:.2f} pages/s "
+                      f"speedup={rate / baseline:.2f}x")
+
+def bench_readiness(pages: int, latency: float):
+    from advanced_fiverr_scraper import AdvancedFiverrScraper, PolitenessPolicy
+    
+    with FixtureServer(total_pages=pages, latency=latency) as server:
+        for strategy in ("fixed", "events"):
+            scraper = AdvancedFiverrScraper(
+                headless=True, base_url=server.base_url, fetch_mode="browser",
+                politeness=PolitenessPolicy(between_pages=(0, 0)), wait_strategy=strategy
+            )
+            try:
+                scraper.search_gigs_advanced(["logo"], max_pages=pages)
+            finally:
+                scraper.close()
+            stats = scraper.page_stats
+            mean = lambda key: sum(page.get(key, 0.0) for page in stats) / max(len(stats), 1)
+            print(f"{strategy:>6}: pages={len(stats)} per-page={mean('seconds'):.2f}s "
+                  f"(ready {mean('ready_seconds'):.2f}s, scroll {mean('scroll_seconds'):.2f}s)")
+
+def bench_profile(pages: int, latency: float):
+    from advanced_fiverr_scraper import AdvancedFiverrScraper, PolitenessPolicy
+    
+    with FixtureServer(total_pages=pages, latency=latency) as server:
+        for profile in ("full", "lean"):
+            started = time.perf_counter()
+            scraper = AdvancedFiverrScraper(
+                headless=True, base_url=server.base_url, fetch_mode="browser",
+                politeness=PolitenessPolicy(between_pages=(0, 0)), driver_profile=profile
+            )
+            startup = time.perf_counter() - started
+            try:
+                scraper.search_gigs_advanced(["logo"], max_pages=pages)
+            finally:
+                scraper.close()
+            stats = scraper.page_stats
+            mean = lambda key: sum(page.get(key, 0) for page in stats) / max(len(stats), 1)
+            print(f"{profile:>4}: startup={startup:.2f}s pages={len(stats)} per-page={mean('seconds'):.2f}s "
+                  f"load={mean('load_seconds'):.2f}s {mean('bytes') / 1024:.0f} KiB/page "
+                  f"{mean('requests') + 1:.0f} requests/page")
+
+def load_pages(html_files: List[str], cards: int) -> List[str]:
+    if html_files:
+        pages = []
+        for path in html_files:
+            with open(path, encoding='utf-8') as f:
+                pages.append(f.read())
+        return pages
+    per_page = 48
+    return [make_search_page(page, cards_per_page=per_page) for page in range(1, cards // per_page + 2)]
+
+def comparable(gig) -> dict:
+    data = gig.to_dict()
+    data.pop('scraped_at')
+    # Tags come out of a set, whose order varies between processes.
+    data['tags'] = sorted(data['tags'])
+    return data
+
+def bench_extract(html_files: List[str], cards: int, repeat: int, fields: Optional[List[str]] = None):
+    from bs4 import BeautifulSoup
+    from advanced_fiverr_scraper import AdvancedFiverrScraper
+    
+    scraper = AdvancedFiverrScraper(fetch_mode="http", parser_backend="html.parser")
+    corpus = []
+    for html in load_pages(html_files, cards):
+        soup = BeautifulSoup(html, 'html.parser')
+        for selector in scraper.CARD_SELECTORS:
+            found = soup.select(selector)
+            if found:
+                corpus.extend(found)
+                break
+    if not html_files:
+        corpus = corpus[:cards]
+    
+    legacy = [scraper._extract_gig_details_legacy(card) for card in corpus]
+    compiled = [scraper._extract_gig_details(card) for card in corpus]
+    mismatches = sum(1 for a, b in zip(legacy, compiled)
+                     if (a is None) != (b is None) or (a and comparable(a) != comparable(b)))
+    
+    timings = {}
+    for name, extract in (("legacy", scraper._extract_gig_details_legacy),
+                          ("single-pass", scraper._extract_gig_details)):
+        best = float('inf')
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for card in corpus:
+                extract(card)
+            best = min(best, time.perf_counter() - started)
+        timings[name] = best
+        print(f"{name:>11}: {best * 1000:8.1f} ms for {len(corpus)} cards "
+              f"({best / max(len(corpus), 1) * 1e6:.0f} us/card)")
+    print(f"speedup: {timings['legacy'] / timings['single-pass']:.2f}x, mismatching cards: {mismatches}")
+    
+    if fields:
+        scraper.set_fields(fields)
+        best = float('inf')
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for card in corpus:
+                scraper._extract_gig_details(card)
+            best = min(best, time.perf_counter() - started)
+        print(f"{'projected':>11}: {best * 1000:8.1f} ms for {len(corpus)} cards "
+              f"({best / max(len(corpus), 1) * 1e6:.0f} us/card, {best / timings['single-pass']:.0%} "
+              f"of single-pass) with fields {', '.join(fields)}")
+        scraper.set_fields(None)
+    scraper.close()
+
+def _run_backend(backend: str, pages: List[str], repeat: int, results):
+    import resource
+    from advanced_fiverr_scraper import AdvancedFiverrScraper
+    
+    scraper = AdvancedFiverrScraper(fetch_mode="http", parser_backend=backend)
+    scraper.parse_page_html(pages[0])
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    
+    best = float('inf')
+    records = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        records = [comparable(gig) for html in pages for gig in scraper.parse_page_html(html)[0]]
+        best = min(best, time.perf_counter() - started)
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results.put((best / len(pages), max(peak_rss - baseline_rss, 0), records))
+
+def bench_parsers(html_files: List[str], pages: int, repeat: int, backends: List[str]):
+    import multiprocessing
+    
+    corpus = load_pages(html_files, pages * 48)
+    reference = None
+    ctx = multiprocessing.get_context('spawn')
+    for backend in backends:
+        # A fresh process per backend so ru_maxrss reflects only that backend.
+        results = ctx.Queue()
+        process = ctx.Process(target=_run_backend, args=(backend, corpus, repeat, results))
+        process.start()
+        per_page, peak_kb, records = results.get()
+        process.join()
+        
+        if reference is None:
+            reference = records
+        status = "match" if records == reference else f"DIFFERS from {backends[0]}"
+        print(f"{backend:>12}: {per_page * 1000:7.2f} ms/page parse+extract, "
+              f"peak +{peak_kb / 1024:6.1f} MiB RSS, {len(records)} gigs ({status})")
+
+def bench_fallback(depths: List[int], backend_name: str):
+    from parser_backends import get_backend
+    from card_detection import detect_repeated_cards
+    
+    # Unknown markup: none of the known card selectors match these cards.
+    html = make_search_page(1).replace('data-test="gig-card" class="gig-card-layout"', 'class="listing-item"')
+    backend = get_backend(backend_name)
+    for depth in depths:
+        nested = '<div class="layout-wrapper">' * depth + html + '</div>' * depth
+        doc = backend.parse(nested)
+        started = time.perf_counter()
+        cards, selector = detect_repeated_cards(backend, doc)
+        elapsed = time.perf_counter() - started
+        print(f"depth={depth:5d} cards={len(cards):3d} selector={selector} detect={elapsed * 1000:7.1f} ms")
+
+def _dir_size(path: str) -> int:
+    import os
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+def bench_store(gigs: int, days: int):
+    import os
+    import dataclasses
+    import tempfile
+    from datetime import datetime, timedelta
+    import pandas as pd
+    import pyarrow.dataset as ds
+    from advanced_fiverr_scraper import AdvancedFiverrScraper
+    from gig_sinks import CsvSink
+    from gig_store import GigStore
+    
+    scraper = AdvancedFiverrScraper(fetch_mode="http")
+    parsed = [gig for html in load_pages([], min(gigs, 4800)) for gig in scraper.parse_page_html(html)[0]]
+    # Month-sized runs are larger than is worth parsing, so recycle parsed gigs.
+    corpus = [dataclasses.replace(parsed[index % len(parsed)], url=f"{parsed[index % len(parsed)].url}?run={index}")
+              for index in range(gigs)]
+    categories = ["graphics-design", "programming-tech", "writing-translation", "digital-marketing"]
+    start = datetime(2024, 1, 1, 12)
+    for index, gig in enumerate(corpus):
+        gig.category = categories[index % len(categories)]
+        gig.scraped_at = start + timedelta(days=index * days // len(corpus))
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "gigs.csv")
+        with CsvSink(csv_path, append=False, fsync=False) as sink:
+            sink.write(corpus)
+        store = GigStore(os.path.join(tmp, "store"))
+        store.write(corpus)
+        
+        def timed(load):
+            started = time.perf_counter()
+            frame = load()
+            return time.perf_counter() - started, len(frame)
+        
+        last_day = (start + timedelta(days=days - 1)).date()
+        cases = [
+            ("csv, full load", lambda: pd.read_csv(csv_path)),
+            ("parquet, full load", lambda: store.to_pandas()),
+            ("csv, 1 category/day", lambda: (lambda df: df[(df['Category'] == categories[0])
+                                                           & df['Scraped At'].str.startswith(str(last_day))])(pd.read_csv(csv_path))),
+            ("parquet, 1 category/day", lambda: store.to_pandas(categories=[categories[0]], since=last_day)),
+            ("parquet, price < $50", lambda: store.to_pandas(columns=['url', 'price_usd'],
+                                                             filter=ds.field('price_usd') < 50)),
+        ]
+        print(f"{len(corpus)} gigs over {days} days: csv {_dir_size(csv_path) / 1024:.0f} KiB, "
+              f"parquet store {_dir_size(store.root) / 1024:.0f} KiB")
+        for name, load in cases:
+            elapsed, rows = timed(load)
+            print(f"{name:>24}: {elapsed * 1000:8.1f} ms, {rows} rows")
+    scraper.close()
+
+def bench_memory(gigs: int):
+    import gc
+    import dataclasses
+    import tracemalloc
+    import pandas as pd
+    from advanced_fiverr_scraper import AdvancedFiverrScraper, GigData, GIG_FIELD_NAMES
+    from gig_batch import GigBatch
+    
+    scraper = AdvancedFiverrScraper(fetch_mode="http")
+    parsed = [gig for html in load_pages([], min(gigs, 4800)) for gig in scraper.parse_page_html(html)[0]]
+    rows = []
+    for index in range(gigs):
+        row = [getattr(parsed[index % len(parsed)], name) for name in GIG_FIELD_NAMES]
+        row[1] = f"{row[1]}?run={index}"
+        rows.append(row)
+    
+    def fresh(value):
+        # A distinct object per gig, as every page parse produces.
+        if isinstance(value, str):
+            return value.encode().decode()
+        return list(value) if isinstance(value, list) else value
+    
+    # GigData as it was: a regular dataclass with a __dict__ and no interning.
+    PlainGig = dataclasses.make_dataclass('PlainGig', [(field.name, field.type) for field in dataclasses.fields(GigData)])
+    
+    def build_batch():
+        batch = GigBatch()
+        for start in range(0, len(rows), 4096):
+            batch.extend([GigData(*map(fresh, row)) for row in rows[start:start + 4096]])
+        return batch
+    
+    def measure(label, build):
+        gc.collect()
+        tracemalloc.start()
+        started = time.perf_counter()
+        result = build()
+        elapsed = time.perf_counter() - started
+        held, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:>22}: {held / len(rows):7.0f} bytes/gig, {held / 2 ** 20:7.1f} MiB, built in {elapsed:.2f}s")
+        return result
+    
+    plain = measure("dataclass (before)", lambda: [PlainGig(*map(fresh, row)) for row in rows])
+    del plain
+    slotted = measure("slotted + interned", lambda: [GigData(*map(fresh, row)) for row in rows])
+    batch = measure("GigBatch", build_batch)
+    
+    started = time.perf_counter()
+    pd.DataFrame([gig.to_dict() for gig in slotted])
+    from_dicts = time.perf_counter() - started
+    started = time.perf_counter()
+    batch.to_dataframe()
+    from_batch = time.perf_counter() - started
+    print(f"DataFrame of {len(rows)} gigs: {from_dicts:.2f}s from dicts, {from_batch:.3f}s from GigBatch")
+    scraper.close()
+
+def bench_cache(pages: int, latency: float, replay_dir: Optional[str], backend: str):
+    import tempfile
+    from advanced_fiverr_scraper import AdvancedFiverrScraper, PolitenessPolicy
+    from page_cache import PageCache
+    
+    def run(cache: PageCache, fetch_mode: str, base_url: str, label: str):
+        scraper = AdvancedFiverrScraper(base_url=base_url, fetch_mode=fetch_mode, parser_backend=backend,
+                                        politeness=PolitenessPolicy(between_pages=(0, 0)), page_cache=cache)
+        started = time.perf_counter()
+        gigs = scraper.search_gigs_advanced(["logo"], max_pages=pages)
+        elapsed = time.perf_counter() - started
+        tiers = {}
+        for stats in scraper.page_stats:
+            tiers[stats['tier']] = tiers.get(stats['tier'], 0) + 1
+        print(f"{label:>12}: {elapsed:6.2f}s for {len(scraper.page_stats)} pages, {len(gigs)} gigs, tiers {tiers}")
+        scraper.close()
+    
+    if replay_dir:
+        cache = PageCache(replay_dir)
+        scraper = AdvancedFiverrScraper(fetch_mode="offline", parser_backend=backend, page_cache=cache)
+        started = time.perf_counter()
+        replayed = empty = gigs = 0
+        for url, html in cache.iter_pages():
+            page_gigs = scraper.parse_page_html(html)[0]
+            replayed += 1
+            gigs += len(page_gigs)
+            empty += not page_gigs
+        elapsed = time.perf_counter() - started
+        print(f"replayed {replayed} cached pages in {elapsed:.2f}s ({elapsed / max(replayed, 1) * 1000:.1f} ms/page), "
+              f"{gigs} gigs, {empty} pages without gigs")
+        scraper.close()
+        return
+    
+    with FixtureServer(total_pages=pages, latency=latency) as server, tempfile.TemporaryDirectory() as tmp:
+        run(PageCache(tmp), "http", server.base_url, "cold")
+        run(PageCache(tmp), "http", server.base_url, "fresh")
+        run(PageCache(tmp, ttl=0), "http", server.base_url, "revalidated")
+    with tempfile.TemporaryDirectory() as tmp:
+        with FixtureServer(total_pages=pages, latency=latency) as server:
+            run(PageCache(tmp), "http", server.base_url, "cold")
+        run(PageCache(tmp, ttl=0), "offline", server.base_url, "offline")
+
+def bench_pipeline(pages: int, workers: List[int], pool_size: int, latency: float):
+    from advanced_fiverr_scraper import AdvancedFiverrScraper, PolitenessPolicy
+    from parse_pipeline import ParsePipeline
+    from scraper_pool import DriverPool, PooledPageScheduler
+    
+    corpus = [make_search_page(page, total_pages=pages) for page in range(1, pages + 1)]
+    scraper = AdvancedFiverrScraper(fetch_mode="http")
+    started = time.perf_counter()
+    expected = sum(len(scraper.parse_page_html(html)[0]) for html in corpus)
+    serial = time.perf_counter() - started
+    scraper.close()
+    print(f"{'in-thread':>12}: {pages / serial:7.1f} pages/s parse+extract ({expected} gigs)")
+    for count in workers:
+        with ParsePipeline(workers=count) as pipeline:
+            # Workers spawn lazily; keep their interpreter start-up out of the timing.
+            list(pipeline.map(corpus[:count * 2]))
+            started = time.perf_counter()
+            gigs = sum(len(result[0]) for result in pipeline.map(corpus))
+            elapsed = time.perf_counter() - started
+        print(f"{count:>2} processes: {pages / elapsed:7.1f} pages/s parse+extract "
+              f"({gigs} gigs, speedup {serial / elapsed:.2f}x)")
+    
+    # End to end: fetchers on the pool, parsing in-thread vs in the pipeline.
+    with FixtureServer(total_pages=pages, latency=latency) as server:
+        factory = lambda: AdvancedFiverrScraper(base_url=server.base_url, fetch_mode="http")
+        for count in [0] + workers[-1:]:
+            pipeline = ParsePipeline(workers=count) if count else None
+            if pipeline:
+                list(pipeline.map(corpus[:count * 2]))
+            with DriverPool(pool_size, factory=factory) as pool:
+                scheduler = PooledPageScheduler(pool, politeness=PolitenessPolicy(between_pages=(0, 0)),
+                                                pipeline=pipeline)
+                gigs = scheduler.search(keywords=["logo"], max_pages=pages)
+                if pipeline:
+                    pipeline.close()
+            label = f"{count} processes" if count else "in-thread"
+            print(f"{label:>12}: pool={pool_size} fetch+parse {scheduler.stats['pages_per_second']:6.1f} pages/s, "
+                  f"{len(gigs)} gigs")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks for the Fiverr scraper against local fixtures")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    pool_parser = subparsers.add_parser('pool', help="Page throughput of the pooled scheduler by pool size")
+    pool_parser.add_argument('--sizes', type=int, nargs='+', default=[1, 2, 4])
+    pool_parser.add_argument('--pages', type=int, default=12)
+    pool_parser.add_argument('--politeness', type=float, default=1.0)
+    
+    readiness_parser = subparsers.add_parser('readiness', help="Per-page wall clock, fixed sleeps vs readiness waits")
+    readiness_parser.add_argument('--pages', type=int, default=5)
+    readiness_parser.add_argument('--latency', type=float, default=0.2)
+    
+    extract_parser = subparsers.add_parser('extract', help="Legacy per-field finds vs single-pass card extraction")
+    extract_parser.add_argument('--cards', type=int, default=1000)
+    extract_parser.add_argument('--repeat', type=int, default=3)
+    extract_parser.add_argument('--html', nargs='*', default=[], help="Recorded search pages to use instead of fixtures")
+    extract_parser.add_argument('--fields', nargs='+', help="Also time extraction of only these GigData fields")
+    
+    parsers_parser = subparsers.add_parser('parsers', help="Parse+extract time and peak memory per parser backend")
+    parsers_parser.add_argument('--pages', type=int, default=10)
+    parsers_parser.add_argument('--repeat', type=int, default=3)
+    parsers_parser.add_argument('--backends', nargs='+', default=['html.parser', 'bs4-lxml', 'lxml', 'selectolax'])
+    parsers_parser.add_argument('--html', nargs='*', default=[], help="Recorded search pages to use instead of fixtures")
+    
+    fallback_parser = subparsers.add_parser('fallback', help="Structural card detection time vs nesting depth")
+    fallback_parser.add_argument('--depths', type=int, nargs='+', default=[10, 100, 1000, 3000])
+    fallback_parser.add_argument('--backend', default='html.parser')
+    
+    store_parser = subparsers.add_parser('store', help="CSV vs partitioned Parquet store: size and load time")
+    store_parser.add_argument('--gigs', type=int, default=200000)
+    store_parser.add_argument('--days', type=int, default=30)
+    
+    cache_parser = subparsers.add_parser('cache', help="Cold, cached, revalidated and offline page fetches")
+    cache_parser.add_argument('--pages', type=int, default=10)
+    cache_parser.add_argument('--latency', type=float, default=0.3)
+    cache_parser.add_argument('--replay', metavar='CACHE_DIR', help="Only re-parse every page in this page cache")
+    cache_parser.add_argument('--backend', default='lxml')
+    
+    pipeline_parser = subparsers.add_parser('pipeline', help="In-thread parsing vs the process-pool parse pipeline")
+    pipeline_parser.add_argument('--pages', type=int, default=40)
+    pipeline_parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    pipeline_parser.add_argument('--pool', type=int, default=4)
+    pipeline_parser.add_argument('--latency', type=float, default=0.05)
+    
+    memory_parser = subparsers.add_parser('memory', help="Memory per gig: plain dataclass vs slotted GigData vs GigBatch")
+    memory_parser.add_argument('--gigs', type=int, default=100000)
+    
+    profile_parser = subparsers.add_parser('profile', help="Full vs lean Chrome profile: load time and bytes per page")
+    profile_parser.add_argument('--pages', type=int, default=5)
+    profile_parser.add_argument('--latency', type=float, default=0.1)
+    
+    args = parser.parse_args()
+    if args.command == 'pool':
+        bench_pool(args.sizes, args.pages, args.politeness)
+    elif args.command == 'readiness':
+        bench_readiness(args.pages, args.latency)
+    elif args.command == 'extract':
+        bench_extract(args.html, args.cards, args.repeat, args.fields)
+    elif args.command == 'parsers':
+        bench_parsers(args.html, args.pages, args.repeat, args.backends)
+    elif args.command == 'fallback':
+        bench_fallback(args.depths, args.backend)
+    elif args.command == 'store':
+        bench_store(args.gigs, args.days)
+    elif args.command == 'cache':
+        bench_cache(args.pages, args.latency, args.replay, args.backend)
+    elif args.command == 'memory':
+        bench_memory(args.gigs)
+    elif args.command == 'profile':
+        bench_profile(args.pages, args.latency)
+    elif args.command == 'pipeline':
+        bench_pipeline(args.pages, args.workers, args.pool, args.latency)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,5 @@
+import os
+
+# Per-user, so runs from any working directory share the caches and the gig index.
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                         'fiverr_scraper')
@@ -0,0 +1,84 @@
+import re
+from collections import defaultdict
+from typing import List, Optional, Tuple
+from parser_backends import ParserBackend
+
+SAFE_CLASS_RE = re.compile(r'^-?[A-Za-z_][\w-]*$')
+
+def detect_repeated_cards(backend: ParserBackend, root, min_group: int = 3,
+                          min_text: int = 50) -> Tuple[List, Optional[str]]:
+    """Find the largest run of same-shaped sibling subtrees that carry real text.
+    
+    A single post-order walk computes, for every element, its tag and class
+    list and the length of all text beneath it, so the cost stays linear in
+    the size of the document however deeply the markup nests. Siblings with
+    the same tag form one group when their class lists overlap, so a card
+    with an extra modifier class or an optional badge stays with the rest.
+    Returns the cards and, when the group shares classes, a CSS selector
+    that finds them directly.
+    """
+    best_cards: List = []
+    best_key = (0, 0)
+    
+    # Each frame: [node, children iterator, [(signature, text length, node) per child]]
+    stack = [[root, iter(backend.children(root)), []]]
+    while stack:
+        frame = stack[-1]
+        child = next(frame[1], None)
+        if child is not None:
+            stack.append([child, iter(backend.children(child)), []])
+            continue
+        
+        stack.pop()
+        node, _, child_results = frame
+        
+        for members in _sibling_groups(child_results):
+            if len(members) < min_group:
+                continue
+            carrying_text = [member for member in members if member[0] > min_text]
+            key = (len(carrying_text), sum(length for length, _ in carrying_text))
+            if len(carrying_text) >= min_group and key > best_key:
+                best_key = key
+                best_cards = [member_node for _, member_node in carrying_text]
+        
+        if stack:
+            signature = (backend.tag(node), frozenset(backend.class_text(node).split()))
+            text_length = backend.direct_text_length(node) + sum(length for _, length, _ in child_results)
+            stack[-1][2].append((signature, text_length, node))
+    
+    return best_cards, card_selector(backend, best_cards)
+
+def _sibling_groups(child_results: List) -> List[List]:
+    """Group (signature, text length, node) siblings by tag, merging overlapping class lists."""
+    by_tag = defaultdict(list)
+    for position, ((tag, classes), text_length, child_node) in enumerate(child_results):
+        by_tag[tag].append((classes, (position, text_length, child_node)))
+    
+    groups = []
+    for members in by_tag.values():
+        # Each entry: [union of the classes seen, members]
+        merged: List[List] = []
+        for classes, member in members:
+            overlapping = [group for group in merged
+                           if group[0] & classes or not (group[0] or classes)]
+            group = [set(classes), [member]]
+            for other in overlapping:
+                group[0] |= other[0]
+                group[1].extend(other[1])
+                merged.remove(other)
+            merged.append(group)
+        # Merging can interleave members, so put the cards back in page order.
+        groups.extend([member[1:] for member in sorted(group[1])] for group in merged)
+    return groups
+
+def card_selector(backend: ParserBackend, cards: List) -> Optional[str]:
+    if not cards:
+        return None
+    common = None
+    for card in cards:
+        classes = set(backend.class_text(card).split())
+        common = classes if common is None else common & classes
+    common = sorted(name for name in common or () if SAFE_CLASS_RE.match(name))
+    if not common:
+        return None
+    return backend.tag(cards[0]) + "".join(f".{name}" for name in common)
\ No newline at end of file
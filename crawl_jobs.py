@@ -0,0 +1,188 @@
+import os
+import csv
+import json
+import logging
+import argparse
+from datetime import datetime
+from typing import Dict, Iterable, List, Set
+from advanced_fiverr_scraper import AdvancedFiverrScraper, GigData
+from gig_index import canonical_gig_url
+from gig_sinks import GigSink, open_sink
+
+logger = logging.getLogger(__name__)
+
+def read_output_urls(path: str) -> Set[str]:
+    """Canonical URLs of the gigs already in a sweep's output (.csv, .jsonl or .parquet)."""
+    if not os.path.exists(path):
+        return set()
+    if path.endswith('.parquet'):
+        from gig_store import GigStore
+        urls = GigStore(path).read(columns=['url']).column('url').to_pylist()
+    elif path.endswith('.csv'):
+        with open(path, encoding='utf-8', newline='') as f:
+            urls = [row['URL'] for row in csv.DictReader(f)]
+    else:
+        urls = []
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    urls.append(json.loads(line)['url'])
+                except (ValueError, KeyError):
+                    # A line cut off by a crash holds no complete gig.
+                    continue
+    return {key for key in map(canonical_gig_url, urls) if key is not None}
+
+class _UniqueSink:
+    """Sink wrapper that passes on only gigs whose URL the output doesn't hold yet."""
+
+    def __init__(self, sink: GigSink, seen: Set[str]):
+        self.sink = sink
+        self.seen = seen
+        self.last_written = 0
+
+    def write(self, gigs: Iterable) -> int:
+        fresh = []
+        for gig in gigs:
+            key = canonical_gig_url(gig.url)
+            if key is not None:
+                if key in self.seen:
+                    continue
+                self.seen.add(key)
+            fresh.append(gig)
+        self.last_written = self.sink.write(fresh)
+        return self.last_written
+
+    def flush(self):
+        self.sink.flush()
+
+class CrawlJob:
+    """A multi-search sweep that checkpoints after every page.
+
+    The checkpoint (a JSON file) holds each search's parameters, the next
+    page to fetch and whether the previous page had a next one. Gigs go to
+    an append-mode sink that is flushed before the checkpoint is written,
+    so after a crash `resume` continues from the first unfinished page and
+    checkpointed pages are never fetched again. A page flushed but not yet
+    checkpointed is fetched again, so the output holds each gig URL once:
+    `run` skips gigs whose URL is already in it, including across searches.
+    """
+
+    def __init__(self, path: str, searches: List[Dict], max_pages: int, output: str):
+        self.path = path
+        self.max_pages = max_pages
+        self.output = output
+        self.searches = [
+            {'params': params, 'next_page': 1, 'has_next': True, 'gigs': 0} for params in searches
+        ]
+        self.created_at = datetime.now().isoformat()
+        self.updated_at = self.created_at
+
+    @classmethod
+    def load(cls, path: str) -> 'CrawlJob':
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        job = cls(path, [], data['max_pages'], data['output'])
+        job.searches = data['searches']
+        job.created_at = data['created_at']
+        job.updated_at = data['updated_at']
+        return job
+
+    def save(self):
+        self.updated_at = datetime.now().isoformat()
+        data = {
+            'max_pages': self.max_pages,
+            'output': self.output,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'searches': self.searches,
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def is_done(self, search: Dict) -> bool:
+        return not search['has_next'] or search['next_page'] > self.max_pages
+
+    @property
+    def complete(self) -> bool:
+        return all(self.is_done(search) for search in self.searches)
+
+    def run(self, scraper: AdvancedFiverrScraper, sink: GigSink) -> bool:
+        """Run every unfinished search; returns whether the whole job is complete."""
+        sink.flush()
+        unique = _UniqueSink(sink, read_output_urls(self.output))
+        for index, search in enumerate(self.searches):
+            if self.is_done(search):
+                continue
+            logger.info(f"Search {index + 1}/{len(self.searches)} {search['params']} "
+                        f"from page {search['next_page']}")
+
+            def checkpoint(page: int, page_gigs: List[GigData], has_next: bool, search=search):
+                unique.flush()
+                search['next_page'] = page + 1
+                search['has_next'] = has_next
+                search['gigs'] += unique.last_written
+                self.save()
+
+            scraper.search_gigs_advanced(
+                max_pages=self.max_pages, start_page=search['next_page'],
+                sink=unique, on_page=checkpoint, **search['params']
+            )
+            if not self.is_done(search):
+                logger.warning(f"Search {index + 1} stopped at page {search['next_page']}; "
+                               f"run again with --resume to continue")
+        return self.complete
+
+def main():
+    parser = argparse.ArgumentParser(description="Checkpointed, resumable multi-keyword gig sweep")
+    parser.add_argument('--job', default="crawl_job.json", help="Checkpoint file")
+    parser.add_argument('--resume', action='store_true', help="Continue the job in --job where it stopped")
+    parser.add_argument('--keywords', nargs='+', default=[],
+                        help="One search per argument, comma-separated keywords, e.g. 'logo,minimalist'")
+    parser.add_argument('--category')
+    parser.add_argument('--sort-by', default="relevant", choices=list(AdvancedFiverrScraper.SORT_MAP))
+    parser.add_argument('--min-rating', type=float)
+    parser.add_argument('--pages', type=int, default=5)
+    parser.add_argument('--output', default="gigs.jsonl", help=".csv, .jsonl or .parquet")
+    parser.add_argument('--fetch-mode', default="auto", choices=AdvancedFiverrScraper.FETCH_MODES)
+    args = parser.parse_args()
+
+    if args.resume:
+        job = CrawlJob.load(args.job)
+        if job.complete:
+            print(f"Job {args.job} is already complete")
+            return
+    else:
+        if os.path.exists(args.job):
+            parser.error(f"{args.job} already exists; pass --resume to continue it or choose another --job")
+        if not args.keywords:
+            parser.error("--keywords is required for a new job")
+        searches = []
+        for keyword_set in args.keywords:
+            params = {'keywords': [keyword.strip() for keyword in keyword_set.split(',') if keyword.strip()],
+                      'category': args.category, 'sort_by': args.sort_by}
+            if args.min_rating:
+                params['min_rating'] = args.min_rating
+            searches.append(params)
+        job = CrawlJob(args.job, searches, args.pages, args.output)
+        job.save()
+
+    scraper = AdvancedFiverrScraper(fetch_mode=args.fetch_mode)
+    # A fresh job starts a fresh output; a resumed one appends to it.
+    sink = open_sink(job.output, append=args.resume)
+    try:
+        complete = job.run(scraper, sink)
+    finally:
+        sink.close()
+        scraper.close()
+    # Counted from the output, since a page re-fetched after a crash adds no rows to its search.
+    total = len(read_output_urls(job.output))
+    print(f"{'Complete' if complete else 'Incomplete'}: {total} gigs in {job.output}")
+    if not complete:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
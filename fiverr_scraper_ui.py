@@ -1,18 +1,54 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
+import time
 import threading
 import queue
 from datetime import datetime
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import re
 import webbrowser
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from advanced_fiverr_scraper import AdvancedFiverrScraper
+from scraper_service import ScraperService
+from scrape_control import ScrapeControl
+from gig_batch import GigBatch
+from advanced_fiverr_scraper import GIG_FIELD_NAMES
+
+# GigData field -> column name in the exported table.
+EXPORT_COLUMNS = {
+    'title': 'Title', 'url': 'URL', 'freelancer': 'Freelancer', 'rating': 'Rating', 'reviews': 'Reviews',
+    'price': 'Price', 'delivery_time': 'Delivery_Time', 'completed_jobs': 'Completed_Jobs',
+    'category': 'Category', 'description': 'Description', 'tags': 'Tags', 'level': 'Seller_Level',
+    'online_status': 'Online_Status', 'response_time': 'Response_Time',
+    'price_usd': 'Price_USD', 'delivery_days': 'Delivery_Days', 'response_hours': 'Response_Hours',
+}
+# Results column -> the store column it sorts on.
+SORT_COLUMNS = {
+    'Title': 'title', 'Freelancer': 'freelancer', 'Rating': 'rating', 'Price': 'price_usd',
+    'Delivery': 'delivery_days', 'Jobs': 'completed_jobs', 'Level': 'level', 'Status': 'online_status',
+}
+VISIBLE_ROWS = 20
+# The worker's page and progress messages are applied in one batch per tick.
+QUEUE_POLL_MS = 250
+
+class _QueueSink:
+    """Scraper sink that posts each page's gigs to the UI queue as it arrives."""
+    
+    def __init__(self, scraping_queue, category):
+        self.scraping_queue = scraping_queue
+        self.category = category
+        
+    def write(self, gigs):
+        gigs = list(gigs)
+        for gig in gigs:
+            gig.category = self.category
+        if gigs:
+            self.scraping_queue.put(('page', gigs))
+        return len(gigs)
 
 class FiverrScraperUI:
     def __init__(self, root):
@@ -21,12 +57,21 @@ class FiverrScraperUI:
         self.root.geometry("1400x800")
         self.root.configure(bg='#f0f0f0')
         
-        self.scraper = None
+        # Started right away so Chrome is warm by the time Start is pressed.
+        self.service = ScraperService(headless=True).start()
         self.scraping_thread = None
         self.scraping_queue = queue.Queue()
         self.is_scraping = False
-        self.gigs_data = []
-        self.current_df = None
+        self.scrape_control = None
+        # Results live in the batch; the Treeview only ever holds the visible rows.
+        self.gigs_batch = GigBatch()
+        self.view = np.arange(0)
+        self.first_row = 0
+        self.sort_column = None
+        self.sort_descending = False
+        self._filter_job = None
+        self._polling = False
+        self.scrape_progress = {}
         
         self.setup_styles()
         self.create_widgets()
@@ -95,6 +140,8 @@ class FiverrScraperUI:
         button_frame.pack(fill=tk.X, pady=(20, 0))
         
         ttk.Button(button_frame, text="🚀 Start Scraping", command=self.start_scraping).pack(side=tk.LEFT, padx=(0, 10))
+        self.pause_button = ttk.Button(button_frame, text="⏸️ Pause", command=self.toggle_pause)
+        self.pause_button.pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(button_frame, text="⏹️ Stop", command=self.stop_scraping).pack(side=tk.LEFT)
         
         right_panel = ttk.Frame(search_tab)
@@ -174,20 +221,28 @@ class FiverrScraperUI:
         self.results_label = ttk.Label(button_frame, text="Total Gigs: 0")
         self.results_label.pack(side=tk.RIGHT)
         
-        columns = ('Title', 'Freelancer', 'Rating', 'Price', 'Delivery', 'Jobs', 'Level', 'Status')
-        self.tree = ttk.Treeview(results_tab, columns=columns, show='headings', height=20)
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace('w', lambda *args: self._schedule_filter())
+        ttk.Entry(button_frame, textvariable=self.filter_var, width=30).pack(side=tk.RIGHT, padx=(0, 20))
+        ttk.Label(button_frame, text="Filter:").pack(side=tk.RIGHT, padx=(0, 5))
+        
+        columns = tuple(SORT_COLUMNS)
+        self.tree = ttk.Treeview(results_tab, columns=columns, show='headings', height=VISIBLE_ROWS)
         
         for col in columns:
-            self.tree.heading(col, text=col)
+            self.tree.heading(col, text=col, command=lambda col=col: self.sort_results(col))
             self.tree.column(col, width=150)
         
-        scrollbar = ttk.Scrollbar(results_tab, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        # The scrollbar moves a window over the store instead of scrolling widget rows.
+        self.results_scrollbar = ttk.Scrollbar(results_tab, orient=tk.VERTICAL, command=self._on_scroll)
         
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(20, 0), pady=(0, 20))
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y, padx=(0, 20), pady=(0, 20))
+        self.results_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, padx=(0, 20), pady=(0, 20))
         
         self.tree.bind('<Double-1>', self.open_selected_url)
+        self.tree.bind('<MouseWheel>', lambda event: self._scroll_rows(-3 if event.delta > 0 else 3))
+        self.tree.bind('<Button-4>', lambda event: self._scroll_rows(-3))
+        self.tree.bind('<Button-5>', lambda event: self._scroll_rows(3))
         
     def create_analytics_tab(self):
         analytics_tab = ttk.Frame(self.notebook)
@@ -230,31 +285,38 @@ class FiverrScraperUI:
         online_only = self.online_only_var.get()
         top_rated_seller = self.top_rated_var.get()
         
-        try:
-            self.scraper = AdvancedFiverrScraper(headless=True)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to initialize scraper: {e}")
-            return
+        if self.service is None or self.service.start_failed:
+            self.service = ScraperService(headless=True).start()
+        
+        self.gigs_batch = GigBatch()
+        self.first_row = 0
+        self._refresh_view()
         
         self.is_scraping = True
+        self.scrape_control = ScrapeControl()
+        self.pause_button.config(text="⏸️ Pause")
+        self.scrape_progress = {}
+        self.progress.config(mode='indeterminate', value=0)
         self.progress.pack(fill=tk.X, pady=(10, 0))
         self.progress.start()
         
         self.scraping_thread = threading.Thread(
             target=self._scrape_worker,
             args=(keywords, category, min_price, max_price, min_rating,
-                  max_pages, sort_by, delivery_time, online_only, top_rated_seller),
+                  max_pages, sort_by, delivery_time, online_only, top_rated_seller, self.scrape_control),
             daemon=True
         )
         self.scraping_thread.start()
         
         self.log(f"Started scraping: {keywords} in {category}")
         self.update_status(f"Scraping {keywords}...")
+        if not self._polling:
+            self.check_queue()
         
     def _scrape_worker(self, keywords, category, min_price, max_price, min_rating,
-                      max_pages, sort_by, delivery_time, online_only, top_rated_seller):
+                      max_pages, sort_by, delivery_time, online_only, top_rated_seller, control):
         try:
-            gigs_data = self.scraper.search_gigs_advanced(
+            gigs = self.service.search(
                 keywords=keywords,
                 category=category,
                 min_price=min_price,
@@ -264,13 +326,14 @@ class FiverrScraperUI:
                 sort_by=sort_by,
                 delivery_time=delivery_time,
                 online_only=online_only,
-                top_rated_seller=top_rated_seller
+                top_rated_seller=top_rated_seller,
+                sink=_QueueSink(self.scraping_queue, category),
+                on_event=lambda event: self.scraping_queue.put(('event', event)),
+                control=control
             )
             
-            for gig in gigs_data:
-                gig.category = category
-            
-            self.scraping_queue.put(('success', gigs_data))
+            # The gigs themselves already reached the UI page by page.
+            self.scraping_queue.put(('success', len(gigs)))
             
         except Exception as e:
             self.scraping_queue.put(('error', str(e)))
@@ -278,15 +341,25 @@ class FiverrScraperUI:
             self.scraping_queue.put(('finished', None))
             
     def check_queue(self):
+        appended = False
+        events = []
         try:
             while True:
                 msg_type, data = self.scraping_queue.get_nowait()
                 
-                if msg_type == 'success':
-                    self.gigs_data = data
-                    self.display_results(data)
-                    self.update_analytics(data)
-                    self.log(f"Scraping completed! Found {len(data)} gigs.")
+                if msg_type == 'page':
+                    self.gigs_batch.extend(data)
+                    appended = True
+                    
+                elif msg_type == 'event':
+                    events.append(data)
+                    
+                elif msg_type == 'success':
+                    self.update_analytics()
+                    if self.scrape_control is not None and self.scrape_control.cancelled:
+                        self.log(f"Scraping stopped. Kept {data} gigs.")
+                    else:
+                        self.log(f"Scraping completed! Found {data} gigs.")
                     
                 elif msg_type == 'error':
                     messagebox.showerror("Error", f"Scraping failed: {data}")
@@ -294,6 +367,8 @@ class FiverrScraperUI:
                     
                 elif msg_type == 'finished':
                     self.is_scraping = False
+                    self.scrape_control = None
+                    self.pause_button.config(text="⏸️ Pause")
                     self.progress.stop()
                     self.progress.pack_forget()
                     self.update_status("Ready")
@@ -301,14 +376,126 @@ class FiverrScraperUI:
         except queue.Empty:
             pass
         
-        self.root.after(100, self.check_queue)
-        
-    def display_results(self, gigs_data):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # However many pages arrived since the last tick, redraw once.
+        if appended:
+            self._show_appended()
+        if events:
+            self._apply_events(events)
+        
+        # Only poll while a scrape is running; start_scraping restarts the loop.
+        self._polling = self.is_scraping or not self.scraping_queue.empty()
+        if self._polling:
+            self.root.after(QUEUE_POLL_MS, self.check_queue)
+        
+    def _apply_events(self, events):
+        progress = self.scrape_progress
+        finished_pages = []
+        for event in events:
+            kind = event['type']
+            if kind == 'search_started':
+                progress.update(started=event['time'], pages=0, gigs=0, browser_rss=None,
+                                total=event['max_pages'] - event['start_page'] + 1)
+                self.progress.stop()
+                self.progress.config(mode='determinate', maximum=progress['total'], value=0)
+            elif kind == 'page_finished':
+                finished_pages.append(event['page'])
+                progress['pages'] = progress.get('pages', 0) + 1
+                progress['gigs'] = event['total_gigs']
+                progress['browser_rss'] = event.get('browser_rss') or progress.get('browser_rss')
+                if not event['has_next']:
+                    # Pagination ended early; the job is done at this page.
+                    progress['total'] = progress['pages']
+            elif kind == 'retry':
+                self.log(f"Retrying {event['url']} after error: {event['error']}")
+            elif kind == 'driver_restart':
+                self.log(f"Browser restarted ({event['reason']})")
+            elif kind == 'page_failed':
+                self.log(f"Page {event['page']} failed: {event['error']}")
+            elif kind == 'search_finished':
+                self.log(f"Fetched {event['pages']} pages in {event['seconds']:.1f}s "
+                         f"({event['driver_restarts']} browser restarts)")
+        
+        if finished_pages and 'started' in progress:
+            first, last = min(finished_pages), max(finished_pages)
+            self.log(f"Page {first} done" if first == last else f"Pages {first}-{last} done")
+            elapsed = max(time.time() - progress['started'], 1e-6)
+            rate = progress['pages'] / elapsed
+            remaining = progress['total'] - progress['pages']
+            status = (f"Page {progress['pages']}/{progress['total']} · {progress['gigs']} gigs · "
+                      f"{rate:.2f} pages/s")
+            if remaining > 0 and rate > 0:
+                status += f" · ETA {remaining / rate:.0f}s"
+            if progress['browser_rss']:
+                status += f" · browser {progress['browser_rss'] / 2 ** 20:.0f} MiB"
+            self.progress.config(maximum=progress['total'], value=progress['pages'])
+            self.update_status(status)
+        
+    def _show_appended(self):
+        if self.sort_column is None and not self.filter_var.get().strip():
+            self.view = np.arange(len(self.gigs_batch))
+            self._render()
+        else:
+            self._refresh_view()
         
-        for gig in gigs_data:
-            self.tree.insert('', tk.END, values=(
+    def sort_results(self, column):
+        if self.sort_column == column:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_column, self.sort_descending = column, False
+        for col in SORT_COLUMNS:
+            arrow = (" ▼" if self.sort_descending else " ▲") if col == column else ""
+            self.tree.heading(col, text=col + arrow)
+        self.first_row = 0
+        self._refresh_view()
+        
+    def _schedule_filter(self):
+        # Typing restarts the timer, so the store is filtered once per pause.
+        if self._filter_job is not None:
+            self.root.after_cancel(self._filter_job)
+        self._filter_job = self.root.after(200, self._apply_filter)
+        
+    def _apply_filter(self):
+        self._filter_job = None
+        self.first_row = 0
+        self._refresh_view()
+        
+    def _refresh_view(self):
+        """Recompute the row order from the store's columns, then redraw the window."""
+        batch = self.gigs_batch
+        order = np.arange(len(batch))
+        if self.sort_column is not None and len(batch):
+            name = SORT_COLUMNS[self.sort_column]
+            values = batch.normalized()[name] if name in ('price_usd', 'delivery_days') else batch.column(name)
+            if values.dtype.kind in 'fiub':
+                values = values.astype(np.float64)
+                # Negated rather than reversed, so unknown (NaN) values stay last.
+                order = np.argsort(-values if self.sort_descending else values, kind='stable')
+            else:
+                order = np.argsort(values, kind='stable')
+                if self.sort_descending:
+                    order = order[::-1]
+        
+        text = self.filter_var.get().strip()
+        if text and len(batch):
+            mask = np.zeros(len(batch), dtype=bool)
+            for name in ('title', 'freelancer', 'level'):
+                mask |= pd.Series(batch.column(name)).str.contains(text, case=False, regex=False).to_numpy()
+            order = order[mask[order]]
+        
+        self.view = order
+        self._render()
+        
+    def _render(self, first=None):
+        total = len(self.view)
+        if first is not None:
+            self.first_row = first
+        self.first_row = max(0, min(self.first_row, total - VISIBLE_ROWS))
+        rows = self.view[self.first_row:self.first_row + VISIBLE_ROWS]
+        
+        # A fixed set of item ids, one per visible slot, updated in place.
+        for slot, row in enumerate(rows):
+            gig = self.gigs_batch.gig(int(row))
+            values = (
                 gig.title[:50] + '...' if len(gig.title) > 50 else gig.title,
                 gig.freelancer,
                 f"{gig.rating:.1f} ⭐" if gig.rating > 0 else "N/A",
@@ -317,33 +504,43 @@ class FiverrScraperUI:
                 f"{gig.completed_jobs:,}" if gig.completed_jobs > 0 else "N/A",
                 gig.level,
                 "🟢" if gig.online_status else "⚫"
-            ))
-        
-        self.results_label.config(text=f"Total Gigs: {len(gigs_data)}")
-        
-        data = []
-        for gig in gigs_data:
-            data.append({
-                'Title': gig.title,
-                'URL': gig.url,
-                'Freelancer': gig.freelancer,
-                'Rating': gig.rating,
-                'Reviews': gig.reviews,
-                'Price': gig.price,
-                'Delivery_Time': gig.delivery_time,
-                'Completed_Jobs': gig.completed_jobs,
-                'Category': gig.category,
-                'Description': gig.description,
-                'Tags': ', '.join(gig.tags),
-                'Seller_Level': gig.level,
-                'Online_Status': 'Online' if gig.online_status else 'Offline',
-                'Response_Time': gig.response_time
-            })
-        
-        self.current_df = pd.DataFrame(data)
-        
-    def update_analytics(self, gigs_data):
-        if not gigs_data:
+            )
+            iid = str(slot)
+            if self.tree.exists(iid):
+                self.tree.item(iid, values=values)
+            else:
+                self.tree.insert('', tk.END, iid=iid, values=values)
+        for slot in range(len(rows), VISIBLE_ROWS):
+            if self.tree.exists(str(slot)):
+                self.tree.delete(str(slot))
+        
+        if total:
+            self.results_scrollbar.set(self.first_row / total, (self.first_row + len(rows)) / total)
+        else:
+            self.results_scrollbar.set(0, 1)
+        shown = f"{total} of {len(self.gigs_batch)}" if total != len(self.gigs_batch) else f"{total}"
+        self.results_label.config(text=f"Total Gigs: {shown}")
+        
+    def _on_scroll(self, action, value, unit=None):
+        if action == 'moveto':
+            self._render(int(float(value) * len(self.view)))
+        elif action == 'scroll':
+            self._scroll_rows(int(value) * (VISIBLE_ROWS if unit == 'pages' else 1))
+            
+    def _scroll_rows(self, rows):
+        self._render(self.first_row + rows)
+        
+    def _export_frame(self):
+        if not len(self.gigs_batch):
+            return None
+        df = self.gigs_batch.to_dataframe([name for name in EXPORT_COLUMNS if name in GIG_FIELD_NAMES],
+                                          normalized=True)
+        df['tags'] = [', '.join(tags) for tags in df['tags']]
+        df['online_status'] = df['online_status'].map({True: 'Online', False: 'Offline'})
+        return df.rename(columns=EXPORT_COLUMNS)
+        
+    def update_analytics(self):
+        if not len(self.gigs_batch):
             return
         
         for widget in self.charts_frame.winfo_children():
@@ -353,44 +550,37 @@ class FiverrScraperUI:
             fig, axes = plt.subplots(2, 2, figsize=(12, 10))
             fig.suptitle('Fiverr Gigs Analytics', fontsize=16, fontweight='bold')
             
-            ratings = [g.rating for g in gigs_data if g.rating > 0]
-            prices = []
-            for gig in gigs_data:
-                try:
-                    price_str = gig.price.replace('$', '').replace(',', '').strip()
-                    if 'k' in price_str.lower():
-                        price_val = float(price_str.lower().replace('k', '')) * 1000
-                    else:
-                        price_val = float(re.search(r'\d+\.?\d*', price_str).group())
-                    prices.append(price_val)
-                except:
-                    continue
-            
-            completed_jobs = [g.completed_jobs for g in gigs_data if g.completed_jobs > 0]
-            levels = [g.level for g in gigs_data]
+            batch = self.gigs_batch
+            ratings = batch.column('rating')
+            ratings = ratings[ratings > 0]
+            prices = batch.normalized()['price_usd']
+            prices = prices[~np.isnan(prices)]
+            completed_jobs = batch.column('completed_jobs')
+            completed_jobs = completed_jobs[completed_jobs > 0]
+            levels = batch.column('level')
             
-            if ratings:
+            if len(ratings):
                 axes[0, 0].hist(ratings, bins=20, alpha=0.7, color='skyblue', edgecolor='black')
                 axes[0, 0].set_xlabel('Rating')
                 axes[0, 0].set_ylabel('Frequency')
                 axes[0, 0].set_title('Rating Distribution')
                 axes[0, 0].grid(True, alpha=0.3)
             
-            if prices:
+            if len(prices):
                 axes[0, 1].hist(prices, bins=20, alpha=0.7, color='lightgreen', edgecolor='black')
-                axes[0, 1].set_xlabel('Price ($)')
+                axes[0, 1].set_xlabel('Price (USD)')
                 axes[0, 1].set_ylabel('Frequency')
                 axes[0, 1].set_title('Price Distribution')
                 axes[0, 1].grid(True, alpha=0.3)
             
-            if completed_jobs:
+            if len(completed_jobs):
                 axes[1, 0].hist(completed_jobs, bins=20, alpha=0.7, color='salmon', edgecolor='black', log=True)
                 axes[1, 0].set_xlabel('Completed Jobs')
                 axes[1, 0].set_ylabel('Frequency (log)')
                 axes[1, 0].set_title('Completed Jobs Distribution')
                 axes[1, 0].grid(True, alpha=0.3)
             
-            if levels:
+            if len(levels):
                 level_counts = pd.Series(levels).value_counts()
                 axes[1, 1].pie(level_counts.values, labels=level_counts.index, autopct='%1.1f%%',
                               startangle=90, colors=plt.cm.Set3.colors)
@@ -405,22 +595,37 @@ class FiverrScraperUI:
         except Exception as e:
             self.log(f"Error creating charts: {e}")
             
+    def toggle_pause(self):
+        control = self.scrape_control
+        if not self.is_scraping or control is None or control.cancelled:
+            return
+        
+        # The search holds at its next safe point; the browser stays open.
+        if control.paused:
+            control.resume()
+            self.pause_button.config(text="⏸️ Pause")
+            self.log("Scraping resumed")
+            self.update_status("Resumed")
+        else:
+            control.pause()
+            self.pause_button.config(text="▶️ Resume")
+            self.log("Scraping paused")
+            self.update_status("Paused")
+        
     def stop_scraping(self):
-        if not self.is_scraping:
+        if not self.is_scraping or self.scrape_control is None:
             messagebox.showinfo("Info", "No scraping in progress.")
             return
         
-        self.is_scraping = False
-        if self.scraper:
-            self.scraper.close()
-        
-        self.log("Scraping stopped by user")
-        self.update_status("Stopped")
-        self.progress.stop()
-        self.progress.pack_forget()
+        # The worker stops at its next safe point and reports the gigs found so
+        # far; the warm browser is kept for the next search.
+        self.scrape_control.cancel()
+        self.log("Stopping after the current step...")
+        self.update_status("Stopping...")
         
     def export_csv(self):
-        if self.current_df is None or self.current_df.empty:
+        df = self._export_frame()
+        if df is None:
             messagebox.showwarning("Warning", "No data to export!")
             return
         
@@ -432,14 +637,15 @@ class FiverrScraperUI:
         
         if filename:
             try:
-                self.current_df.to_csv(filename, index=False, encoding='utf-8')
+                df.to_csv(filename, index=False, encoding='utf-8')
                 messagebox.showinfo("Success", f"Data exported to {filename}")
                 self.log(f"Data exported to {filename}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export: {e}")
                 
     def export_excel(self):
-        if self.current_df is None or self.current_df.empty:
+        df = self._export_frame()
+        if df is None:
             messagebox.showwarning("Warning", "No data to export!")
             return
         
@@ -451,7 +657,7 @@ class FiverrScraperUI:
         
         if filename:
             try:
-                self.current_df.to_excel(filename, index=False)
+                df.to_excel(filename, index=False)
                 messagebox.showinfo("Success", f"Data exported to {filename}")
                 self.log(f"Data exported to {filename}")
             except Exception as e:
@@ -462,25 +668,22 @@ class FiverrScraperUI:
         if not selection:
             return
         
-        item = self.tree.item(selection[0])
-        values = item['values']
-        
-        title_to_find = values[0]
-        for gig in self.gigs_data:
-            if gig.title.startswith(title_to_find.replace('...', '').strip()):
-                if gig.url and gig.url != "N/A":
-                    webbrowser.open(gig.url)
-                else:
-                    messagebox.showwarning("Warning", "No URL available for this gig")
-                break
+        row = self.view[self.first_row + int(selection[0])]
+        url = self.gigs_batch.column('url')[row]
+        if url and url != "N/A":
+            webbrowser.open(url)
+        else:
+            messagebox.showwarning("Warning", "No URL available for this gig")
     
     def on_closing(self):
-        if self.is_scraping:
-            if messagebox.askyesno("Quit", "Scraping in progress. Are you sure you want to quit?"):
-                self.stop_scraping()
-                self.root.destroy()
-        else:
-            self.root.destroy()
+        if self.is_scraping and not messagebox.askyesno("Quit", "Scraping in progress. Are you sure you want to quit?"):
+            return
+        
+        # Only cancel here; waiting for the browsers would freeze the window.
+        # main() quits them once the event loop has returned.
+        if self.service:
+            self.service.stop()
+        self.root.destroy()
 
 def main():
     root = tk.Tk()
@@ -496,6 +699,8 @@ def main():
     root.geometry(f'{width}x{height}+{x}+{y}')
     
     root.mainloop()
+    if app.service:
+        app.service.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
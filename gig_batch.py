@@ -0,0 +1,150 @@
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+from advanced_fiverr_scraper import GigData, GIG_FIELD_NAMES
+from gig_normalize import price_usd, delivery_days, duration_hours
+
+NUMERIC_COLUMNS = {'rating': np.float64, 'reviews': np.int32, 'completed_jobs': np.int32, 'online_status': np.bool_}
+# Few distinct values per result set: stored as int32 codes into a pool of strings.
+POOLED_COLUMNS = ('freelancer', 'price', 'delivery_time', 'category', 'level', 'response_time',
+                  'last_delivery', 'gig_created')
+# Mostly unique per gig: one string object each, as scraped.
+OBJECT_COLUMNS = ('title', 'url', 'description', 'keywords', 'tags')
+
+class StringPool:
+    """Dictionary encoding for one column: each distinct string is stored once."""
+
+    def __init__(self):
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(sys.intern(value) if type(value) is str else value)
+        return code
+
+class GigBatch:
+    """Columnar store for many gigs.
+
+    Numbers live in NumPy arrays, repeated strings in per-column pools
+    with int32 codes, and the rest in object arrays, all grown by doubling
+    so `extend` is amortised O(1) per gig. `to_dataframe` hands the arrays
+    to pandas as they are (pooled columns become Categoricals over the
+    codes), so a DataFrame costs at most one copy of the data.
+    """
+
+    def __init__(self, gigs: Iterable[GigData] = (), capacity: int = 1024):
+        self._size = 0
+        self._capacity = capacity
+        self._numeric = {name: np.zeros(capacity, dtype) for name, dtype in NUMERIC_COLUMNS.items()}
+        self._codes = {name: np.zeros(capacity, np.int32) for name in POOLED_COLUMNS}
+        self.pools = {name: StringPool() for name in POOLED_COLUMNS}
+        self._objects = {name: np.empty(capacity, object) for name in OBJECT_COLUMNS}
+        self._scraped_at = np.zeros(capacity, 'datetime64[us]')
+        self.extend(gigs)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _grow(self, needed: int):
+        capacity = self._capacity
+        while capacity < needed:
+            capacity *= 2
+        if capacity == self._capacity:
+            return
+        for columns in (self._numeric, self._codes, self._objects):
+            for name, array in columns.items():
+                grown = np.zeros(capacity, array.dtype) if array.dtype != object else np.empty(capacity, object)
+                grown[:self._size] = array[:self._size]
+                columns[name] = grown
+        scraped_at = np.zeros(capacity, 'datetime64[us]')
+        scraped_at[:self._size] = self._scraped_at[:self._size]
+        self._scraped_at = scraped_at
+        self._capacity = capacity
+
+    def extend(self, gigs: Iterable[GigData]) -> int:
+        gigs = gigs if isinstance(gigs, (list, tuple)) else list(gigs)
+        if not gigs:
+            return 0
+        start = self._size
+        self._grow(start + len(gigs))
+        end = start + len(gigs)
+        for name in NUMERIC_COLUMNS:
+            self._numeric[name][start:end] = [getattr(gig, name) for gig in gigs]
+        for name in POOLED_COLUMNS:
+            code = self.pools[name].code
+            self._codes[name][start:end] = [code(getattr(gig, name)) for gig in gigs]
+        for name in OBJECT_COLUMNS:
+            column = self._objects[name]
+            for offset, gig in enumerate(gigs, start):
+                value = getattr(gig, name)
+                column[offset] = tuple(value) if isinstance(value, list) else value
+        self._scraped_at[start:end] = [gig.scraped_at for gig in gigs]
+        self._size = end
+        return len(gigs)
+
+    def column(self, name: str) -> np.ndarray:
+        """A read-only view (pooled columns decoded into a new object array)."""
+        if name in NUMERIC_COLUMNS:
+            array = self._numeric[name][:self._size]
+        elif name in POOLED_COLUMNS:
+            array = np.asarray(self.pools[name].values, dtype=object)[self._codes[name][:self._size]]
+        elif name in OBJECT_COLUMNS:
+            array = self._objects[name][:self._size]
+        elif name == 'scraped_at':
+            array = self._scraped_at[:self._size]
+        else:
+            raise KeyError(name)
+        array = array.view()
+        array.flags.writeable = False
+        return array
+
+    def gig(self, index: int) -> GigData:
+        if not -self._size <= index < self._size:
+            raise IndexError(index)
+        index %= self._size
+        values = {}
+        for name in GIG_FIELD_NAMES:
+            if name in NUMERIC_COLUMNS:
+                values[name] = self._numeric[name][index].item()
+            elif name in POOLED_COLUMNS:
+                values[name] = self.pools[name].values[self._codes[name][index]]
+            elif name == 'scraped_at':
+                values[name] = self._scraped_at[index].item()
+            else:
+                value = self._objects[name][index]
+                values[name] = list(value) if isinstance(value, tuple) else value
+        return GigData(**values)
+
+    def __iter__(self) -> Iterator[GigData]:
+        for index in range(self._size):
+            yield self.gig(index)
+
+    def normalized(self, rates: Optional[Dict[str, float]] = None) -> Dict[str, np.ndarray]:
+        """price_usd, delivery_days and response_hours as float arrays (NaN = unknown).
+
+        The source columns are pooled, so each distinct string is parsed once
+        and the results are gathered by code.
+        """
+        def gather(name, convert):
+            return convert(self.pools[name].values)[self._codes[name][:self._size]]
+        return {
+            'price_usd': gather('price', lambda values: price_usd(values, rates)),
+            'delivery_days': gather('delivery_time', delivery_days),
+            'response_hours': gather('response_time', duration_hours),
+        }
+
+    def to_dataframe(self, columns: Optional[Sequence[str]] = None, normalized: bool = False) -> pd.DataFrame:
+        data = {}
+        for name in columns or GIG_FIELD_NAMES:
+            if name in POOLED_COLUMNS:
+                data[name] = pd.Categorical.from_codes(self._codes[name][:self._size],
+                                                       categories=pd.Index(self.pools[name].values, dtype=object))
+            else:
+                data[name] = self.column(name)
+        if normalized:
+            data.update(self.normalized())
+        return pd.DataFrame(data, copy=False)
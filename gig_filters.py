@@ -0,0 +1,82 @@
+import math
+import urllib.parse
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from gig_normalize import price_usd_scalar
+
+FILTER_NAMES = ('min_price', 'max_price', 'min_rating', 'top_rated_seller')
+
+def is_top_rated(level: Optional[str]) -> bool:
+    return bool(level) and 'top rated' in level.replace('_', ' ').lower()
+
+@dataclass
+class GigFilters:
+    """Search filters compiled into Fiverr URL facets plus cheap per-card checks.
+
+    Price range and top-rated seller go into the search URL's `ref` facets,
+    so Fiverr only returns matching gigs. Every filter is also checked on
+    each card from the one or two fields it needs, before the rest of the
+    card is extracted, which covers pages the facets didn't apply to and
+    min_rating, which has no facet. `eliminated` counts the cards each
+    filter rejected.
+    """
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    min_rating: Optional[float] = None
+    top_rated_seller: bool = False
+    eliminated: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(FILTER_NAMES, 0))
+
+    @classmethod
+    def from_params(cls, params: Dict) -> 'GigFilters':
+        return cls(**{name: params.get(name) or None for name in FILTER_NAMES})
+
+    @property
+    def active(self) -> bool:
+        return any(getattr(self, name) for name in FILTER_NAMES)
+
+    @property
+    def rejected(self) -> int:
+        return sum(self.eliminated.values())
+
+    def url_facets(self) -> str:
+        facets = []
+        if self.min_price or self.max_price:
+            facets.append(f"gig_price_range:{int(self.min_price or 0)},{int(self.max_price) if self.max_price else ''}")
+        if self.top_rated_seller:
+            facets.append("seller_level:top_rated_seller")
+        return urllib.parse.quote("|".join(facets))
+
+    def _reject(self, name: str) -> bool:
+        self.eliminated[name] += 1
+        return True
+
+    def rejects_rating(self, rating: float) -> bool:
+        if self.min_rating and rating < self.min_rating:
+            return self._reject('min_rating')
+        return False
+
+    def rejects_price(self, price) -> bool:
+        """Takes the card's price text or USD number.
+        
+        Text is read by gig_normalize, so a price without a USD amount
+        ('€30', a bare '45') never rejects, just as it has no price_usd.
+        """
+        if not (self.min_price or self.max_price):
+            return False
+        value = price if isinstance(price, (int, float)) else price_usd_scalar(price)
+        if math.isnan(value):
+            return False
+        if self.min_price and value < self.min_price:
+            return self._reject('min_price')
+        if self.max_price and value > self.max_price:
+            return self._reject('max_price')
+        return False
+
+    def rejects_level(self, level: Optional[str]) -> bool:
+        if self.top_rated_seller and not is_top_rated(level):
+            return self._reject('top_rated_seller')
+        return False
+
+    def accepts(self, gig) -> bool:
+        return not (self.rejects_rating(gig.rating) or self.rejects_price(gig.price)
+                    or self.rejects_level(gig.level))
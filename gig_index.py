@@ -0,0 +1,148 @@
+import os
+import json
+import hashlib
+import sqlite3
+import logging
+import threading
+import urllib.parse
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from cache_paths import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = os.path.join(CACHE_DIR, 'gig_index.sqlite')
+
+# Fields that make up a gig's content. Search context (keywords, category),
+# the scrape time and the seller's online indicator change between runs
+# without the gig itself changing, so they are left out of the hash.
+HASH_FIELDS = ('title', 'freelancer', 'rating', 'reviews', 'price', 'delivery_time',
+               'completed_jobs', 'description', 'tags', 'level', 'response_time')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS gigs (
+    url TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    last_changed TEXT NOT NULL,
+    times_seen INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS gig_history (
+    url TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    scraped_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS gig_history_url ON gig_history (url, scraped_at);
+"""
+
+def canonical_gig_url(url: Optional[str]) -> Optional[str]:
+    """Drop query string, fragment and trailing slash; tracking params differ per listing.
+    
+    None for a card without a real gig link ("N/A", a bare domain), which
+    can't be told apart from other such cards and so must not be deduplicated.
+    """
+    parts = urllib.parse.urlsplit((url or "").strip())
+    if not parts.netloc or not parts.path.strip('/'):
+        return None
+    return urllib.parse.urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), '', ''))
+
+def content_hash(gig) -> str:
+    values = {}
+    for field in HASH_FIELDS:
+        value = getattr(gig, field)
+        values[field] = sorted(value) if field == 'tags' else value
+    return hashlib.sha1(json.dumps(values, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+class GigIndex:
+    """SQLite index of every gig seen, keyed on canonical URL.
+    
+    `update` records a page of gigs and returns only the new or changed
+    ones; each new version is appended to the gig's history. `changes`
+    answers the same question without recording anything, so a caller can
+    deliver the gigs first and only then mark them as seen.
+    """
+    
+    def __init__(self, path: str = DEFAULT_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        # Shared by pooled scrapers running in worker threads, guarded by _lock.
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        
+    def changes(self, gigs: Iterable) -> Tuple[List, int]:
+        """What `update` would return for these gigs, without recording them."""
+        fresh = []
+        unchanged = 0
+        with self._lock:
+            for gig in gigs:
+                url = canonical_gig_url(gig.url)
+                if url is not None:
+                    row = self._conn.execute("SELECT content_hash FROM gigs WHERE url = ?", (url,)).fetchone()
+                    if row is not None and row[0] == content_hash(gig):
+                        unchanged += 1
+                        continue
+                fresh.append(gig)
+        return fresh, unchanged
+        
+    def update(self, gigs: Iterable) -> Tuple[List, int]:
+        """Returns (new or changed gigs, number of known unchanged gigs)."""
+        fresh = []
+        unchanged = 0
+        now = datetime.now().isoformat()
+        with self._lock, self._conn:
+            for gig in gigs:
+                url = canonical_gig_url(gig.url)
+                if url is None:
+                    # Nothing to key it on: always reported, never recorded.
+                    fresh.append(gig)
+                    continue
+                digest = content_hash(gig)
+                row = self._conn.execute("SELECT content_hash FROM gigs WHERE url = ?", (url,)).fetchone()
+                if row is None:
+                    self._conn.execute(
+                        "INSERT INTO gigs (url, content_hash, first_seen, last_seen, last_changed) VALUES (?, ?, ?, ?, ?)",
+                        (url, digest, now, now, now)
+                    )
+                elif row[0] == digest:
+                    self._conn.execute(
+                        "UPDATE gigs SET last_seen = ?, times_seen = times_seen + 1 WHERE url = ?", (now, url)
+                    )
+                    unchanged += 1
+                    continue
+                else:
+                    self._conn.execute(
+                        "UPDATE gigs SET content_hash = ?, last_seen = ?, last_changed = ?, "
+                        "times_seen = times_seen + 1 WHERE url = ?", (digest, now, now, url)
+                    )
+                self._conn.execute(
+                    "INSERT INTO gig_history (url, content_hash, scraped_at, data) VALUES (?, ?, ?, ?)",
+                    (url, digest, gig.scraped_at.isoformat(), json.dumps(gig.to_dict(), ensure_ascii=False))
+                )
+                fresh.append(gig)
+        return fresh, unchanged
+        
+    def history(self, url: str) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM gig_history WHERE url = ? ORDER BY scraped_at", (canonical_gig_url(url),)
+            ).fetchall()
+        return [json.loads(data) for data, in rows]
+        
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM gigs WHERE url = ?", (canonical_gig_url(url),)
+            ).fetchone() is not None
+            
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM gigs").fetchone()[0]
+            
+    def close(self):
+        with self._lock:
+            self._conn.close()
\ No newline at end of file
@@ -0,0 +1,53 @@
+import re
+from typing import Dict, Iterable, Optional
+import numpy as np
+import pandas as pd
+
+# The first currency marker and the first amount in a price such as
+# "From $1,200", "US$45" or "€1.2k"; other currencies only convert with a rate.
+CURRENCY_RE = re.compile(r'(US\$|\$|USD|€|EUR|£|GBP)')
+AMOUNT_RE = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*([kK])?')
+CURRENCY_CODES = {'US$': 'USD', '$': 'USD', 'USD': 'USD', '€': 'EUR', 'EUR': 'EUR', '£': 'GBP', 'GBP': 'GBP'}
+USD_RATES = {'USD': 1.0}
+DURATION_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(minute|min|hour|hr|day|week|month)', re.I)
+HOURS_PER_UNIT = {'minute': 1 / 60, 'min': 1 / 60, 'hour': 1, 'hr': 1, 'day': 24, 'week': 168, 'month': 720}
+
+def _strings(values: Iterable) -> pd.Series:
+    return values if isinstance(values, pd.Series) else pd.Series(list(values), dtype=object)
+
+def price_usd(prices: Iterable, rates: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """USD amounts for a whole column of price strings; NaN where there is no amount or rate.
+
+    `rates` maps currency codes (EUR, GBP) to USD per unit; without one only
+    USD prices convert.
+    """
+    prices = _strings(prices)
+    amount = prices.str.extract(AMOUNT_RE)
+    value = pd.to_numeric(amount[0].str.replace(',', '', regex=False), errors='coerce')
+    value = value.where(amount[1].isna(), value * 1000)
+    currency = prices.str.extract(CURRENCY_RE)[0].map(CURRENCY_CODES)
+    rate = currency.map({**USD_RATES, **(rates or {})})
+    return (value * rate).to_numpy(dtype=np.float64, na_value=np.nan)
+
+def price_usd_scalar(price, rates: Optional[Dict[str, float]] = None) -> float:
+    """price_usd for one price, with the same rules; for per-card checks too small for a batch."""
+    if not isinstance(price, str):
+        return np.nan
+    amount, currency = AMOUNT_RE.search(price), CURRENCY_RE.search(price)
+    if amount is None or currency is None:
+        return np.nan
+    rate = {**USD_RATES, **(rates or {})}.get(CURRENCY_CODES[currency.group(1)])
+    if rate is None:
+        return np.nan
+    value = float(amount.group(1).replace(',', ''))
+    return (value * 1000 if amount.group(2) else value) * rate
+
+def duration_hours(texts: Iterable) -> np.ndarray:
+    """'2 days' -> 48.0, 'Avg. response time: 1 hour' -> 1.0; NaN without a duration."""
+    parts = _strings(texts).str.extract(DURATION_RE)
+    value = pd.to_numeric(parts[0], errors='coerce')
+    return (value * parts[1].str.lower().map(HOURS_PER_UNIT)).to_numpy(dtype=np.float64, na_value=np.nan)
+
+def delivery_days(texts: Iterable) -> np.ndarray:
+    # Anything under a day still takes a calendar day to deliver.
+    return np.maximum(np.ceil(duration_hours(texts) / 24), 1)
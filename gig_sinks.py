@@ -0,0 +1,236 @@
+import os
+import csv
+import json
+import heapq
+import shutil
+import logging
+import tempfile
+from typing import Dict, Iterable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+CSV_COLUMNS = [
+    'Title', 'URL', 'Freelancer', 'Rating', 'Reviews', 'Price', 'Delivery Time',
+    'Completed Jobs', 'Category', 'Keywords', 'Description', 'Tags', 'Seller Level',
+    'Online Status', 'Response Time', 'Scraped At',
+]
+NUMERIC_COLUMNS = {'Rating': float, 'Reviews': int, 'Completed Jobs': int}
+EXCEL_MAX_ROWS = 1048576
+
+def gig_to_row(gig) -> Dict:
+    return {
+        'Title': gig.title,
+        'URL': gig.url,
+        'Freelancer': gig.freelancer,
+        'Rating': gig.rating,
+        'Reviews': gig.reviews,
+        'Price': gig.price,
+        'Delivery Time': gig.delivery_time,
+        'Completed Jobs': gig.completed_jobs,
+        'Category': gig.category,
+        'Keywords': ', '.join(gig.keywords),
+        'Description': gig.description,
+        'Tags': ', '.join(gig.tags),
+        'Seller Level': gig.level,
+        # None when the search's fields left it out.
+        'Online Status': {True: 'Online', False: 'Offline'}.get(gig.online_status, ''),
+        'Response Time': gig.response_time,
+        'Scraped At': gig.scraped_at.strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+class GigSink:
+    """Appends gigs to a file as they are scraped.
+    
+    Rows are flushed (and fsync'd) every `flush_every` rows and on close, so
+    at most that many rows are lost if the process dies mid-run.
+    """
+    
+    def __init__(self, path: str, flush_every: int = 100, fsync: bool = True, append: bool = True):
+        self.path = path
+        self.flush_every = flush_every
+        self.fsync = fsync
+        self.append = append
+        self.rows_written = 0
+        self._pending = 0
+        
+    def write(self, gigs: Iterable) -> int:
+        count = 0
+        for gig in gigs:
+            self._write_one(gig)
+            count += 1
+        self.rows_written += count
+        self._pending += count
+        if self._pending >= self.flush_every:
+            self.flush()
+        return count
+        
+    def _write_one(self, gig):
+        raise NotImplementedError
+        
+    def flush(self):
+        self._pending = 0
+        
+    def close(self):
+        self.flush()
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, *exc):
+        self.close()
+
+class _TextFileSink(GigSink):
+    def __init__(self, path: str, **kwargs):
+        super().__init__(path, **kwargs)
+        self._file = open(path, 'a' if self.append else 'w', encoding='utf-8', newline='')
+        self._is_new = self._file.tell() == 0
+        
+    def flush(self):
+        if self._file.closed:
+            return
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        super().flush()
+        
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+class CsvSink(_TextFileSink):
+    def __init__(self, path: str, **kwargs):
+        super().__init__(path, **kwargs)
+        self._writer = csv.DictWriter(self._file, fieldnames=CSV_COLUMNS)
+        if self._is_new:
+            self._writer.writeheader()
+            
+    def _write_one(self, gig):
+        self._writer.writerow(gig_to_row(gig))
+
+class JsonLinesSink(_TextFileSink):
+    def _write_one(self, gig):
+        self._file.write(json.dumps(gig.to_dict(), ensure_ascii=False))
+        self._file.write('\n')
+
+class ParquetSink(GigSink):
+    """Appends to a GigStore (typed Parquet partitioned by category and date).
+    
+    Every flush writes complete Parquet files, so everything flushed before
+    a crash stays readable (a single growing file would lose its footer).
+    """
+    
+    def __init__(self, path: str, flush_every: int = 1000, **kwargs):
+        super().__init__(path, flush_every=flush_every, **kwargs)
+        from gig_store import GigStore
+        if not self.append and os.path.isdir(path):
+            shutil.rmtree(path)
+        self.store = GigStore(path)
+        self._gigs: List = []
+        
+    def _write_one(self, gig):
+        self._gigs.append(gig)
+        
+    def flush(self):
+        if self._gigs:
+            self.store.write(self._gigs, fsync=self.fsync)
+            self._gigs = []
+        super().flush()
+
+def open_sink(path: str, **kwargs) -> GigSink:
+    if path.endswith('.csv'):
+        return CsvSink(path, **kwargs)
+    if path.endswith('.jsonl'):
+        return JsonLinesSink(path, **kwargs)
+    if path.endswith('.parquet'):
+        return ParquetSink(path, **kwargs)
+    raise ValueError(f"Don't know how to stream gigs to {path} (use .csv, .jsonl or .parquet)")
+
+def _sort_key(columns: Sequence[str], ascending: bool):
+    def key(row: Dict):
+        values = []
+        for column in columns:
+            convert = NUMERIC_COLUMNS.get(column)
+            value = row.get(column, '')
+            if convert:
+                try:
+                    value = convert(value)
+                except ValueError:
+                    value = 0
+                values.append(value if ascending else -value)
+            elif ascending:
+                values.append(value)
+            else:
+                raise ValueError(f"Descending sort is only supported on numeric columns, not {column}")
+        return tuple(values)
+    return key
+
+def sort_csv(path: str, output: Optional[str] = None,
+             by: Sequence[str] = ('Rating', 'Completed Jobs'),
+             ascending: bool = False, chunk_rows: int = 50000) -> str:
+    """External merge sort of a streamed CSV, holding one chunk in memory at a time."""
+    output = output or path
+    key = _sort_key(by, ascending)
+    run_paths = []
+    tmp_dir = tempfile.mkdtemp(prefix='gig_sort_', dir=os.path.dirname(os.path.abspath(output)))
+    try:
+        with open(path, encoding='utf-8', newline='') as f:
+            reader = csv.DictReader(f)
+            fieldnames = reader.fieldnames or CSV_COLUMNS
+            while True:
+                chunk = [row for _, row in zip(range(chunk_rows), reader)]
+                if not chunk:
+                    break
+                chunk.sort(key=key)
+                run_path = os.path.join(tmp_dir, f"run-{len(run_paths):05d}.csv")
+                with open(run_path, 'w', encoding='utf-8', newline='') as run:
+                    writer = csv.DictWriter(run, fieldnames=fieldnames)
+                    writer.writeheader()
+                    writer.writerows(chunk)
+                run_paths.append(run_path)
+        
+        run_files = [open(run_path, encoding='utf-8', newline='') for run_path in run_paths]
+        sorted_tmp = os.path.join(tmp_dir, 'sorted.csv')
+        try:
+            with open(sorted_tmp, 'w', encoding='utf-8', newline='') as out:
+                writer = csv.DictWriter(out, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(heapq.merge(*(csv.DictReader(f) for f in run_files), key=key))
+        finally:
+            for f in run_files:
+                f.close()
+        os.replace(sorted_tmp, output)
+    finally:
+        for name in os.listdir(tmp_dir):
+            os.remove(os.path.join(tmp_dir, name))
+        os.rmdir(tmp_dir)
+    return output
+
+def csv_to_excel(path: str, excel_path: Optional[str] = None) -> str:
+    """Copies a CSV into an .xlsx with openpyxl's write-only (streaming) workbook."""
+    from openpyxl import Workbook
+    
+    excel_path = excel_path or os.path.splitext(path)[0] + '.xlsx'
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    with open(path, encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header:
+            sheet.append(header)
+        for count, row in enumerate(reader, start=2):
+            if count > EXCEL_MAX_ROWS:
+                logger.warning(f"Excel export truncated at {EXCEL_MAX_ROWS} rows")
+                break
+            sheet.append([_excel_value(header[i] if header else '', value) for i, value in enumerate(row)])
+    workbook.save(excel_path)
+    return excel_path
+
+def _excel_value(column: str, value: str):
+    convert = NUMERIC_COLUMNS.get(column)
+    if convert:
+        try:
+            return convert(value)
+        except ValueError:
+            return value
+    return value
\ No newline at end of file
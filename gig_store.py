@@ -0,0 +1,133 @@
+import os
+import uuid
+import logging
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Sequence
+import pyarrow as pa
+import pyarrow.dataset as ds
+from gig_normalize import price_usd, delivery_days, duration_hours
+
+logger = logging.getLogger(__name__)
+
+GIG_SCHEMA = pa.schema([
+    ('title', pa.string()),
+    ('url', pa.string()),
+    ('freelancer', pa.dictionary(pa.int32(), pa.string())),
+    ('rating', pa.float32()),
+    ('reviews', pa.int32()),
+    ('price', pa.string()),
+    ('price_usd', pa.float64()),
+    ('delivery_time', pa.string()),
+    ('delivery_days', pa.int16()),
+    ('completed_jobs', pa.int32()),
+    ('category', pa.dictionary(pa.int32(), pa.string())),
+    ('keywords', pa.list_(pa.string())),
+    ('description', pa.string()),
+    ('tags', pa.list_(pa.string())),
+    ('level', pa.dictionary(pa.int32(), pa.string())),
+    ('online_status', pa.bool_()),
+    ('response_time', pa.string()),
+    ('response_hours', pa.float32()),
+    ('last_delivery', pa.string()),
+    ('gig_created', pa.string()),
+    ('scraped_at', pa.timestamp('s')),
+    ('scrape_date', pa.date32()),
+])
+# Partition keys come back from the directory names; null (default partition)
+# values can't be unified across dictionary chunks, so read them as plain strings.
+READ_SCHEMA = GIG_SCHEMA.set(GIG_SCHEMA.get_field_index('category'), pa.field('category', pa.string()))
+PARTITIONING = ds.partitioning(
+    pa.schema([('category', pa.string()), ('scrape_date', pa.date32())]), flavor='hive'
+)
+
+def gig_to_record(gig) -> Dict:
+    return {
+        'title': gig.title,
+        'url': gig.url,
+        'freelancer': gig.freelancer,
+        'rating': gig.rating,
+        'reviews': gig.reviews,
+        'price': gig.price,
+        'delivery_time': gig.delivery_time,
+        'completed_jobs': gig.completed_jobs,
+        # Empty strings can't be a hive partition value; null maps to the default partition.
+        'category': gig.category or None,
+        'keywords': list(gig.keywords),
+        'description': gig.description,
+        'tags': list(gig.tags),
+        'level': gig.level,
+        'online_status': gig.online_status,
+        'response_time': gig.response_time,
+        'last_delivery': gig.last_delivery,
+        'gig_created': gig.gig_created,
+        'scraped_at': gig.scraped_at.replace(microsecond=0),
+        'scrape_date': gig.scraped_at.date(),
+    }
+
+def gigs_to_table(gigs: Iterable, rates: Optional[Dict[str, float]] = None) -> pa.Table:
+    records = [gig_to_record(gig) for gig in gigs]
+    # Derived columns come from gig_normalize for the whole batch at once.
+    derived = {
+        'price_usd': price_usd([record['price'] for record in records], rates),
+        'delivery_days': delivery_days([record['delivery_time'] for record in records]),
+        'response_hours': duration_hours([record['response_time'] for record in records]),
+    }
+    table = pa.Table.from_pylist(records, schema=GIG_SCHEMA)
+    for name, values in derived.items():
+        index = GIG_SCHEMA.get_field_index(name)
+        table = table.set_column(index, GIG_SCHEMA.field(name),
+                                 pa.array(values, GIG_SCHEMA.field(name).type, from_pandas=True))
+    return table
+
+class GigStore:
+    """Typed, partitioned Parquet store for scraped gigs.
+    
+    Files live under `category=<name>/scrape_date=<YYYY-MM-DD>/`, so reads
+    filtered on category or date only open the matching directories, and
+    filters on the numeric columns are pushed down to Parquet row groups.
+    """
+    
+    def __init__(self, root: str = "gig_store"):
+        self.root = root
+        
+    def write(self, gigs: Iterable, fsync: bool = False) -> int:
+        table = gigs_to_table(gigs)
+        if table.num_rows == 0:
+            return 0
+        os.makedirs(self.root, exist_ok=True)
+        written = []
+        # A unique basename per write so appends never replace earlier files.
+        ds.write_dataset(
+            table, self.root, format='parquet', partitioning=PARTITIONING,
+            basename_template=f"part-{datetime.now():%Y%m%d%H%M%S}-{uuid.uuid4().hex[:8]}-{{i}}.parquet",
+            existing_data_behavior='overwrite_or_ignore',
+            file_visitor=lambda written_file: written.append(written_file.path),
+        )
+        if fsync:
+            for path in written:
+                with open(path, 'rb') as f:
+                    os.fsync(f.fileno())
+        logger.debug(f"Wrote {table.num_rows} gigs to {len(written)} files under {self.root}")
+        return table.num_rows
+        
+    def dataset(self) -> ds.Dataset:
+        return ds.dataset(self.root, schema=READ_SCHEMA, format='parquet', partitioning=PARTITIONING)
+        
+    def read(self, columns: Optional[Sequence[str]] = None, filter: Optional[ds.Expression] = None,
+             categories: Optional[List[str]] = None, since: Optional[date] = None,
+             until: Optional[date] = None) -> pa.Table:
+        """Load matching rows; `filter` takes any pyarrow expression, e.g. ds.field('price_usd') < 50."""
+        if not os.path.isdir(self.root):
+            return READ_SCHEMA.empty_table().select(list(columns) if columns else READ_SCHEMA.names)
+        expression = filter
+        for condition in (
+            ds.field('category').isin(categories) if categories else None,
+            ds.field('scrape_date') >= since if since else None,
+            ds.field('scrape_date') <= until if until else None,
+        ):
+            if condition is not None:
+                expression = condition if expression is None else expression & condition
+        return self.dataset().to_table(columns=list(columns) if columns else None, filter=expression)
+        
+    def to_pandas(self, **kwargs):
+        return self.read(**kwargs).to_pandas()
\ No newline at end of file
@@ -0,0 +1,170 @@
+import os
+import gzip
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+import urllib.parse
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple
+from cache_paths import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROOT = os.path.join(CACHE_DIR, 'page_cache')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    source TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_last_access ON pages (last_access);
+"""
+
+@dataclass
+class CachedPage:
+    url: str
+    html: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    source: str
+    fetched_at: float
+    fresh: bool
+
+def cache_key(url: str) -> str:
+    """Same page regardless of query parameter order or fragment."""
+    parts = urllib.parse.urlsplit(url)
+    query = urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(parts.query, keep_blank_values=True)))
+    return urllib.parse.urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
+
+class PageCache:
+    """Content-addressed on-disk cache of fetched search pages.
+    
+    HTML is stored gzipped under objects/<hash[:2]>/<hash>.html.gz, so pages
+    that render identically are stored once; a SQLite index maps each URL to
+    its content plus the ETag/Last-Modified validators. Entries older than
+    `ttl` seconds are stale (revalidated before use, but still replayable
+    offline) and the least recently used ones are evicted once the objects
+    exceed `max_bytes`.
+    """
+    
+    def __init__(self, root: str = DEFAULT_ROOT, ttl: float = 24 * 3600,
+                 max_bytes: int = 512 * 1024 * 1024):
+        self.root = root
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(root, "index.sqlite"), check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        
+    def _object_path(self, content_hash: str) -> str:
+        return os.path.join(self.root, "objects", content_hash[:2], f"{content_hash}.html.gz")
+        
+    def get(self, url: str) -> Optional[CachedPage]:
+        key = cache_key(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, content_hash, etag, last_modified, source, fetched_at FROM pages WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            try:
+                with gzip.open(self._object_path(row[1]), 'rt', encoding='utf-8') as f:
+                    html = f.read()
+            except OSError:
+                self._conn.execute("DELETE FROM pages WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+            now = time.time()
+            self._conn.execute("UPDATE pages SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return CachedPage(row[0], html, row[2], row[3], row[4], row[5], now - row[5] < self.ttl)
+        
+    def put(self, url: str, html: str, etag: Optional[str] = None,
+            last_modified: Optional[str] = None, source: str = "http"):
+        data = html.encode('utf-8')
+        content_hash = hashlib.sha256(data).hexdigest()
+        path = self._object_path(content_hash)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (key, url, content_hash, etag, last_modified, source, "
+                "fetched_at, last_access, size) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (cache_key(url), url, content_hash, etag, last_modified, source, now, now, os.path.getsize(path))
+            )
+            self._conn.commit()
+        self._evict()
+        
+    def touch(self, url: str):
+        """Mark an entry fresh again after the server answered 304 Not Modified."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("UPDATE pages SET fetched_at = ?, last_access = ? WHERE key = ?",
+                               (now, now, cache_key(url)))
+            self._conn.commit()
+            
+    def _evict(self):
+        with self._lock:
+            # Objects shared by several URLs are counted (and removed) once.
+            total = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT content_hash, size FROM pages)"
+            ).fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            rows = self._conn.execute("SELECT key, content_hash, size FROM pages ORDER BY last_access").fetchall()
+            for key, content_hash, size in rows:
+                if total <= self.max_bytes:
+                    break
+                self._conn.execute("DELETE FROM pages WHERE key = ?", (key,))
+                still_used = self._conn.execute(
+                    "SELECT 1 FROM pages WHERE content_hash = ? LIMIT 1", (content_hash,)
+                ).fetchone()
+                if still_used is None:
+                    try:
+                        os.remove(self._object_path(content_hash))
+                    except OSError:
+                        pass
+                    total -= size
+            self._conn.commit()
+            
+    def iter_pages(self, url_contains: Optional[str] = None) -> Iterator[Tuple[str, str]]:
+        """(url, html) for every cached page, for offline replay through the parser."""
+        with self._lock:
+            rows = self._conn.execute("SELECT url, content_hash FROM pages ORDER BY url").fetchall()
+        for url, content_hash in rows:
+            if url_contains and url_contains not in url:
+                continue
+            try:
+                with gzip.open(self._object_path(content_hash), 'rt', encoding='utf-8') as f:
+                    yield url, f.read()
+            except OSError:
+                continue
+                
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            
+    def close(self):
+        with self._lock:
+            self._conn.close()
\ No newline at end of file
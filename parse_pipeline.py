@@ -0,0 +1,104 @@
+import os
+import time
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import fields
+from typing import Iterable, Iterator, List, Optional, Tuple
+from advanced_fiverr_scraper import AdvancedFiverrScraper, GigData
+from selector_cache import SelectorCache, DEFAULT_PATH as SELECTOR_CACHE_PATH
+
+logger = logging.getLogger(__name__)
+
+GIG_FIELDS = [field.name for field in fields(GigData)]
+
+# One parser per worker process, built once by the pool initializer.
+_worker_parser: Optional[AdvancedFiverrScraper] = None
+
+def _init_worker(parser_backend: str, selector_cache_path: Optional[str]):
+    global _worker_parser
+    _worker_parser = AdvancedFiverrScraper(fetch_mode="http", parser_backend=parser_backend,
+                                           selector_cache=SelectorCache(selector_cache_path))
+
+def _parse_in_worker(html) -> Tuple[List[tuple], bool, str]:
+    if isinstance(html, bytes):
+        html = html.decode('utf-8', errors='replace')
+    gigs, has_next, tier = _worker_parser.parse_page_html(html)
+    # Plain tuples pickle smaller and faster than dataclass instances.
+    return [tuple(getattr(gig, name) for name in GIG_FIELDS) for gig in gigs], has_next, tier
+
+class ParsePipeline:
+    """Parses fetched pages in a pool of worker processes.
+    
+    Fetchers call `submit(html)` and carry on fetching; each call returns a
+    Future of (gigs, has_next, tier). At most `max_pending` pages are queued
+    or being parsed at once, and `submit` blocks beyond that, so fetchers
+    slow down to the speed of the parsers instead of piling up HTML.
+    """
+    
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None,
+                 parser_backend: str = "lxml", selector_cache_path: Optional[str] = SELECTOR_CACHE_PATH):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 2
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        # spawn, not fork: fetchers are threads holding WebDriver sessions and locks.
+        self._executor = ProcessPoolExecutor(
+            self.workers, mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker, initargs=(parser_backend, selector_cache_path)
+        )
+        self.stats = {'submitted': 0, 'parsed': 0, 'failed': 0, 'blocked_seconds': 0.0}
+        
+    def submit(self, html) -> Future:
+        started = time.perf_counter()
+        self._slots.acquire()
+        blocked = time.perf_counter() - started
+        try:
+            inner = self._executor.submit(_parse_in_worker, html)
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self.stats['submitted'] += 1
+            self.stats['blocked_seconds'] += blocked
+        
+        outer: Future = Future()
+        
+        def done(future: Future):
+            self._slots.release()
+            try:
+                records, has_next, tier = future.result()
+            except Exception as e:
+                with self._lock:
+                    self.stats['failed'] += 1
+                outer.set_exception(e)
+                return
+            with self._lock:
+                self.stats['parsed'] += 1
+            outer.set_result(([GigData(*record) for record in records], has_next, tier))
+        
+        inner.add_done_callback(done)
+        return outer
+        
+    def parse(self, html) -> Tuple[List[GigData], bool, str]:
+        return self.submit(html).result()
+        
+    def map(self, pages: Iterable) -> Iterator[Tuple[List[GigData], bool, str]]:
+        """Results for each page in input order, with at most max_pending in flight."""
+        pending: List[Future] = []
+        for html in pages:
+            if len(pending) >= self.max_pending:
+                yield pending.pop(0).result()
+            pending.append(self.submit(html))
+        for future in pending:
+            yield future.result()
+            
+    def close(self):
+        self._executor.shutdown(wait=True)
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, *exc):
+        self.close()
\ No newline at end of file
@@ -0,0 +1,216 @@
+from typing import Dict, Iterator, List, Optional
+from bs4 import BeautifulSoup, Tag, NavigableString, Comment
+
+# Text inside these elements is not page text (matches BeautifulSoup's get_text).
+NON_TEXT_TAGS = {'script', 'style', 'template'}
+
+class ParserBackend:
+    """Minimal adapter the page parser and card extractors are written against.
+    
+    Nodes are whatever the underlying library uses; callers only ever pass
+    them back into the backend that produced them.
+    """
+    name = ""
+    
+    def parse(self, html: str):
+        raise NotImplementedError
+        
+    def select(self, node, selector: str) -> List:
+        raise NotImplementedError
+        
+    def iter_descendants(self, node) -> Iterator:
+        """Element descendants of node in document order, node itself excluded."""
+        raise NotImplementedError
+        
+    def children(self, node) -> List:
+        raise NotImplementedError
+        
+    def tag(self, node) -> str:
+        raise NotImplementedError
+        
+    def get_attr(self, node, name: str) -> Optional[str]:
+        """Attribute value, '' for a valueless attribute, None when absent."""
+        raise NotImplementedError
+        
+    def class_text(self, node) -> str:
+        return self.get_attr(node, 'class') or ""
+        
+    def text(self, node) -> str:
+        """Stripped text pieces joined without separator, like get_text(strip=True)."""
+        raise NotImplementedError
+        
+    def raw_text(self, node) -> str:
+        """Unmodified text content, e.g. the JSON inside a script element."""
+        raise NotImplementedError
+    
+    def direct_text_length(self, node) -> int:
+        """Length of the stripped text directly inside node, children excluded."""
+        raise NotImplementedError
+
+class BeautifulSoupBackend(ParserBackend):
+    def __init__(self, features: str = 'html.parser'):
+        self.features = features
+        self.name = features
+        
+    def parse(self, html: str):
+        return BeautifulSoup(html, self.features)
+        
+    def select(self, node, selector: str) -> List:
+        return node.select(selector)
+        
+    def iter_descendants(self, node) -> Iterator:
+        for elem in node.descendants:
+            if isinstance(elem, Tag):
+                yield elem
+                
+    def children(self, node) -> List:
+        return [child for child in node.children if isinstance(child, Tag)]
+        
+    def tag(self, node) -> str:
+        return node.name
+        
+    def get_attr(self, node, name: str) -> Optional[str]:
+        value = node.get(name)
+        if isinstance(value, list):
+            return " ".join(value)
+        return value
+        
+    def text(self, node) -> str:
+        return node.get_text(strip=True)
+        
+    def raw_text(self, node) -> str:
+        return node.string or ""
+    
+    def direct_text_length(self, node) -> int:
+        if node.name in NON_TEXT_TAGS:
+            return 0
+        return sum(len(child.strip()) for child in node.children
+                   if isinstance(child, NavigableString) and not isinstance(child, Comment))
+
+class LxmlBackend(ParserBackend):
+    name = 'lxml'
+    
+    def __init__(self):
+        import lxml.html
+        from lxml.cssselect import CSSSelector
+        self._fromstring = lxml.html.fromstring
+        self._selector_cls = CSSSelector
+        self._selectors: Dict[str, object] = {}
+        
+    def parse(self, html: str):
+        return self._fromstring(html)
+        
+    def select(self, node, selector: str) -> List:
+        compiled = self._selectors.get(selector)
+        if compiled is None:
+            compiled = self._selectors[selector] = self._selector_cls(selector)
+        return compiled(node)
+        
+    def iter_descendants(self, node) -> Iterator:
+        # Comments and processing instructions have a non-string tag.
+        for elem in node.iterdescendants():
+            if isinstance(elem.tag, str):
+                yield elem
+                
+    def children(self, node) -> List:
+        return [child for child in node if isinstance(child.tag, str)]
+        
+    def tag(self, node) -> str:
+        return node.tag
+        
+    def get_attr(self, node, name: str) -> Optional[str]:
+        return node.get(name)
+        
+    def text(self, node) -> str:
+        parts = []
+        stack = [node]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                piece = item.strip()
+                if piece:
+                    parts.append(piece)
+                continue
+            # Element text comes first, then each child followed by its tail.
+            pending = []
+            if isinstance(item.tag, str) and item.tag not in NON_TEXT_TAGS:
+                if item.text:
+                    pending.append(item.text)
+                for child in item:
+                    pending.append(child)
+                    if child.tail:
+                        pending.append(child.tail)
+            stack.extend(reversed(pending))
+        return "".join(parts)
+    
+    def raw_text(self, node) -> str:
+        return node.text or ""
+    
+    def direct_text_length(self, node) -> int:
+        if node.tag in NON_TEXT_TAGS:
+            return 0
+        length = len(node.text.strip()) if node.text else 0
+        return length + sum(len(child.tail.strip()) for child in node if child.tail)
+
+class SelectolaxBackend(ParserBackend):
+    name = 'selectolax'
+    
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+        self._parser_cls = LexborHTMLParser
+        
+    def parse(self, html: str):
+        return self._parser_cls(html).root
+        
+    def select(self, node, selector: str) -> List:
+        return node.css(selector)
+        
+    def iter_descendants(self, node) -> Iterator:
+        walker = node.traverse(include_text=False)
+        next(walker, None)
+        for elem in walker:
+            if not elem.tag.startswith('-'):
+                yield elem
+                
+    def children(self, node) -> List:
+        return [child for child in node.iter(include_text=False) if not child.tag.startswith('-')]
+        
+    def tag(self, node) -> str:
+        return node.tag
+        
+    def get_attr(self, node, name: str) -> Optional[str]:
+        attributes = node.attributes
+        if name not in attributes:
+            return None
+        return attributes[name] or ""
+        
+    def text(self, node) -> str:
+        parts = []
+        for piece in node.traverse(include_text=True):
+            if piece.tag != '-text' or piece.parent is None or piece.parent.tag in NON_TEXT_TAGS:
+                continue
+            text = piece.text_content.strip() if piece.text_content else ""
+            if text:
+                parts.append(text)
+        return "".join(parts)
+        
+    def raw_text(self, node) -> str:
+        return node.text(deep=True) or ""
+    
+    def direct_text_length(self, node) -> int:
+        if node.tag in NON_TEXT_TAGS:
+            return 0
+        return sum(len(child.text_content.strip()) for child in node.iter(include_text=True)
+                   if child.tag == '-text' and child.text_content)
+
+BACKENDS = {
+    'html.parser': lambda: BeautifulSoupBackend('html.parser'),
+    'bs4-lxml': lambda: BeautifulSoupBackend('lxml'),
+    'lxml': LxmlBackend,
+    'selectolax': SelectolaxBackend,
+}
+
+def get_backend(name: str) -> ParserBackend:
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown parser backend: {name} (choose from {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
\ No newline at end of file
@@ -0,0 +1,204 @@
+import time
+import logging
+import argparse
+import itertools
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+from advanced_fiverr_scraper import AdvancedFiverrScraper, GigData
+from gig_index import canonical_gig_url
+from gig_sinks import open_sink
+from scraper_pool import DriverPool, PooledPageScheduler
+from scrape_control import ScrapeControl
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class PlannedQuery:
+    keywords: Tuple[str, ...]
+    category: Optional[str] = None
+    sort_by: str = "relevant"
+    delivery_time: Optional[str] = None
+    online_only: bool = False
+    min_rating: Optional[float] = None
+
+    @property
+    def label(self) -> str:
+        """The search text, as tagged onto GigData.keywords."""
+        return " ".join(self.keywords + ((self.category,) if self.category else ()))
+
+    @property
+    def fetch_key(self) -> Tuple:
+        # Everything that goes into the search URL, normalised the way Fiverr
+        # reads it: one query string, case-insensitive, unknown sorts = relevant.
+        # Queries with equal keys get exactly the same result pages.
+        return (" ".join(self.label.lower().split()),
+                AdvancedFiverrScraper.SORT_MAP.get(self.sort_by, "relevant"),
+                self.delivery_time or None, bool(self.online_only))
+
+    def accepts(self, gig: GigData) -> bool:
+        return not self.min_rating or gig.rating >= self.min_rating
+
+@dataclass
+class FetchGroup:
+    """One search that is actually fetched, and every planned query it answers."""
+    queries: List[PlannedQuery]
+
+    @property
+    def min_rating(self) -> Optional[float]:
+        # Fetch with the loosest filter; each query re-applies its own afterwards.
+        ratings = [query.min_rating for query in self.queries]
+        return None if not all(ratings) else min(ratings)
+
+    def search_params(self) -> Dict:
+        first = self.queries[0]
+        params = {'keywords': list(first.keywords), 'category': first.category, 'sort_by': first.sort_by,
+                  'delivery_time': first.delivery_time, 'online_only': first.online_only}
+        if self.min_rating:
+            params['min_rating'] = self.min_rating
+        return params
+
+@dataclass
+class SweepResult:
+    gigs: List[GigData]
+    planned: int
+    fetched: int
+    pages_fetched: int
+    duplicates: int
+    seconds: float
+    gigs_per_query: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def dropped(self) -> int:
+        return self.planned - self.fetched
+
+class QueryPlanner:
+    """Turns keyword × category × sort × filter grids into as few searches as possible.
+
+    A planned query is dropped when its results are provably a subset of
+    another's: both have the same search URL, and its min_rating (the only
+    client-side filter) is at least as strict. Those queries share one fetch
+    and are answered by filtering its gigs. Filters that change the URL are
+    never merged, since page limits make their result sets incomparable.
+    """
+
+    @staticmethod
+    def expand(
+        keyword_sets: Sequence[Sequence[str]],
+        categories: Sequence[Optional[str]] = (None,),
+        sort_orders: Sequence[str] = ("relevant",),
+        delivery_times: Sequence[Optional[str]] = (None,),
+        online_only: Sequence[bool] = (False,),
+        min_ratings: Sequence[Optional[float]] = (None,)
+    ) -> List[PlannedQuery]:
+        queries = []
+        for keywords, category, sort_by, delivery_time, online, min_rating in itertools.product(
+                keyword_sets, categories, sort_orders, delivery_times, online_only, min_ratings):
+            keywords = tuple(keyword.strip() for keyword in keywords if keyword.strip())
+            queries.append(PlannedQuery(keywords, category or None, sort_by, delivery_time or None,
+                                        online, min_rating or None))
+        return queries
+
+    @staticmethod
+    def plan(queries: Sequence[PlannedQuery]) -> List[FetchGroup]:
+        groups: Dict[Tuple, FetchGroup] = {}
+        for query in dict.fromkeys(queries):
+            group = groups.get(query.fetch_key)
+            if group is None:
+                groups[query.fetch_key] = FetchGroup([query])
+            else:
+                group.queries.append(query)
+        return list(groups.values())
+
+    @staticmethod
+    def merge(groups: List[FetchGroup], results: List[List[GigData]]) -> Tuple[List[GigData], int]:
+        """URL-deduplicates gigs across groups, tagging each with every query that matched it."""
+        merged: Dict[object, GigData] = {}
+        duplicates = 0
+        for group, gigs in zip(groups, results):
+            for gig in gigs:
+                matched = [query for query in group.queries if query.accepts(gig)]
+                if not matched:
+                    continue
+                key = canonical_gig_url(gig.url)
+                if key is None:
+                    # Gigs without a link can't be matched up; each one is kept.
+                    key = len(merged)
+                kept = merged.get(key)
+                if kept is None:
+                    kept = merged[key] = gig
+                    kept.keywords = list(kept.keywords)
+                else:
+                    duplicates += 1
+                if not kept.category:
+                    kept.category = next((query.category for query in matched if query.category), "")
+                for query in matched:
+                    if query.label not in kept.keywords:
+                        kept.keywords.append(query.label)
+        return list(merged.values()), duplicates
+
+    def run(self, scheduler: PooledPageScheduler, queries: Sequence[PlannedQuery],
+            max_pages: int = 3, control: Optional[ScrapeControl] = None) -> SweepResult:
+        started = time.perf_counter()
+        groups = self.plan(queries)
+        planned = len(set(queries))
+        logger.info(f"Planned {planned} queries into {len(groups)} searches "
+                    f"({planned - len(groups)} answered by another search)")
+
+        results = scheduler.run([group.search_params() for group in groups], max_pages,
+                                dedupe_across_queries=False, control=control)
+        gigs, duplicates = self.merge(groups, results)
+
+        gigs_per_query: Dict[str, int] = {}
+        for gig in gigs:
+            for label in gig.keywords:
+                gigs_per_query[label] = gigs_per_query.get(label, 0) + 1
+        result = SweepResult(
+            gigs=gigs,
+            planned=planned,
+            fetched=len(groups),
+            pages_fetched=scheduler.stats.get('pages_fetched', 0),
+            duplicates=duplicates,
+            seconds=time.perf_counter() - started,
+            gigs_per_query=gigs_per_query,
+        )
+        logger.info(f"Sweep fetched {result.pages_fetched} pages for {result.fetched} searches "
+                    f"in {result.seconds:.1f}s: {len(gigs)} unique gigs, {duplicates} duplicates merged")
+        return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep keyword × category × sort grids with overlapping searches merged")
+    parser.add_argument('--keywords', nargs='+', required=True,
+                        help="One keyword set per argument, comma-separated keywords, e.g. 'logo,minimalist'")
+    parser.add_argument('--categories', nargs='+', default=[None])
+    parser.add_argument('--sort-by', nargs='+', default=["relevant"], choices=list(AdvancedFiverrScraper.SORT_MAP))
+    parser.add_argument('--delivery-time', nargs='+', default=[None])
+    parser.add_argument('--online-only', choices=("no", "yes", "both"), default="no")
+    parser.add_argument('--min-rating', nargs='+', type=float, default=[None])
+    parser.add_argument('--pages', type=int, default=3)
+    parser.add_argument('--size', type=int, default=2, help="Scrapers fetching in parallel")
+    parser.add_argument('--fetch-mode', default="auto", choices=AdvancedFiverrScraper.FETCH_MODES)
+    parser.add_argument('--output', default="sweep.jsonl", help=".csv, .jsonl or .parquet")
+    args = parser.parse_args()
+
+    planner = QueryPlanner()
+    queries = planner.expand(
+        [keyword_set.split(',') for keyword_set in args.keywords],
+        categories=args.categories,
+        sort_orders=args.sort_by,
+        delivery_times=args.delivery_time,
+        online_only={'no': (False,), 'yes': (True,), 'both': (False, True)}[args.online_only],
+        min_ratings=args.min_rating,
+    )
+    with DriverPool(args.size, fetch_mode=args.fetch_mode) as pool:
+        result = planner.run(PooledPageScheduler(pool), queries, args.pages)
+    with open_sink(args.output, append=False) as sink:
+        sink.write(result.gigs)
+
+    print(f"{result.planned} queries, {result.fetched} searches, {result.pages_fetched} pages fetched "
+          f"in {result.seconds:.1f}s")
+    for label, count in sorted(result.gigs_per_query.items()):
+        print(f"  {label}: {count} gigs")
+    print(f"{len(result.gigs)} unique gigs written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import threading
+from typing import Optional
+
+class ScrapeControl:
+    """Cancellation token and pause switch for a running search.
+
+    Any thread may call `cancel`, `pause` or `resume`; the scraper only acts
+    on them at its safe points (before each page, between scroll steps and
+    cards, and during politeness delays), on its own thread. The browser is
+    never touched from outside, so it stays open for the next search, and
+    the gigs found before the stop are kept.
+    """
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def paused(self) -> bool:
+        return not self._running.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+        # A paused search has to wake up to notice it was cancelled.
+        self._running.set()
+
+    def pause(self):
+        if not self.cancelled:
+            self._running.clear()
+
+    def resume(self):
+        self._running.set()
+
+    def wait(self) -> bool:
+        """Blocks while paused; returns whether the search should stop."""
+        self._running.wait()
+        return self.cancelled
+
+    def sleep(self, seconds: Optional[float]) -> bool:
+        """time.sleep that a cancel cuts short and a pause extends."""
+        if seconds and self._cancelled.wait(seconds):
+            return True
+        return self.wait()
@@ -0,0 +1,306 @@
+import time
+import queue
+import threading
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from advanced_fiverr_scraper import AdvancedFiverrScraper, GigData, PolitenessPolicy
+from selector_cache import SelectorCache
+from gig_index import canonical_gig_url
+from gig_filters import GigFilters
+from page_cache import PageCache
+from parse_pipeline import ParsePipeline
+from scrape_control import ScrapeControl
+
+logger = logging.getLogger(__name__)
+
+class DriverPool:
+    """A fixed-size pool of warm AdvancedFiverrScraper instances (one Chrome each)."""
+    
+    def __init__(self, size: int = 2, headless: bool = True, proxy: Optional[str] = None,
+                 fetch_mode: str = "auto", page_cache: Optional[PageCache] = None,
+                 factory: Optional[Callable[[], AdvancedFiverrScraper]] = None):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.size = size
+        selector_cache = SelectorCache()
+        self._factory = factory or (lambda: AdvancedFiverrScraper(
+            headless=headless, proxy=proxy, fetch_mode=fetch_mode, selector_cache=selector_cache,
+            page_cache=page_cache))
+        self._idle = queue.Queue()
+        self._all: List[AdvancedFiverrScraper] = []
+        self._lock = threading.Lock()
+        self._warm_up()
+        
+    def _warm_up(self):
+        errors = []
+        
+        def start():
+            try:
+                scraper = self._factory()
+                if scraper.fetch_mode in ("auto", "browser"):
+                    scraper.ensure_driver()
+            except Exception as e:
+                errors.append(e)
+                return
+            with self._lock:
+                self._all.append(scraper)
+            self._idle.put(scraper)
+        
+        # Chrome cold starts dominate pool creation, so start them side by side.
+        threads = [threading.Thread(target=start, daemon=True) for _ in range(self.size)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        if errors:
+            self.close()
+            raise errors[0]
+        logger.info(f"Driver pool ready with {self.size} browsers")
+        
+    def acquire(self, timeout: Optional[float] = None) -> AdvancedFiverrScraper:
+        return self._idle.get(timeout=timeout)
+        
+    def release(self, scraper: AdvancedFiverrScraper):
+        self._idle.put(scraper)
+        
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[AdvancedFiverrScraper]:
+        scraper = self.acquire(timeout)
+        try:
+            yield scraper
+        finally:
+            self.release(scraper)
+            
+    def close(self, timeout: Optional[float] = None):
+        """Quit every browser, first waiting up to `timeout` seconds for leased ones to come back."""
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+            with self._lock:
+                busy = len(self._all)
+            while busy:
+                try:
+                    self._idle.get(timeout=max(deadline - time.monotonic(), 0))
+                    busy -= 1
+                except queue.Empty:
+                    logger.warning(f"Closing {busy} pooled browsers that are still in use")
+                    break
+        with self._lock:
+            scrapers, self._all = self._all, []
+        for scraper in scrapers:
+            try:
+                scraper.close()
+            except Exception as e:
+                logger.warning(f"Failed to close pooled browser: {e}")
+                
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, *exc):
+        self.close()
+
+@dataclass
+class PageJob:
+    query_index: int
+    page: int
+    url: str
+    use_browser: bool = False
+
+class PooledPageScheduler:
+    """Fans search result pages for one or more queries out over a DriverPool.
+    
+    Every worker applies its scraper's PolitenessPolicy (or the one given
+    here) between the pages it fetches, so the request rate per browser
+    matches the sequential scraper while throughput grows with the pool size.
+    With a ParsePipeline, workers only fetch and parsing runs in its worker
+    processes, so each browser moves on to its next page straight away.
+    A ScrapeControl passed to `run` pauses or stops every worker at its
+    next safe point; pages fetched by then are still merged and returned.
+    """
+    
+    SEARCH_KEYS = ('keywords', 'category', 'sort_by', 'delivery_time', 'online_only',
+                   'min_price', 'max_price', 'top_rated_seller')
+    
+    def __init__(self, pool: DriverPool, politeness: Optional[PolitenessPolicy] = None,
+                 pipeline: Optional[ParsePipeline] = None):
+        self.pool = pool
+        self.politeness = politeness
+        self.pipeline = pipeline
+        self.stats: Dict[str, float] = {}
+        
+    def search(self, max_pages: int = 3, control: Optional[ScrapeControl] = None,
+               **search_params) -> List[GigData]:
+        return self.run([search_params], max_pages, control=control)[0]
+        
+    def run(self, searches: List[Dict], max_pages: int = 3,
+            dedupe_across_queries: bool = True,
+            control: Optional[ScrapeControl] = None) -> List[List[GigData]]:
+        started = time.perf_counter()
+        base_urls = []
+        with self.pool.lease() as scraper:
+            for params in searches:
+                url_params = {key: params[key] for key in self.SEARCH_KEYS if key in params}
+                base_urls.append(scraper.build_search_url(**url_params))
+        
+        # Page-major order: page 1 of every query is fetched before any page 2,
+        # so the end of a query's pagination is known before its deep pages run.
+        jobs = queue.Queue()
+        for page in range(1, max_pages + 1):
+            for index, url in enumerate(base_urls):
+                jobs.put(PageJob(index, page, AdvancedFiverrScraper.page_url(url, page)))
+        
+        last_page = [max_pages] * len(searches)
+        # Workers reject cards before extracting them and add their counts here;
+        # the merge below filters pages parsed without them (the pipeline).
+        query_filters = [GigFilters.from_params(params) for params in searches]
+        results: Dict[Tuple[int, int], List[GigData]] = {}
+        lock = threading.Lock()
+        parsing = [0]
+        parse_errors = [0]
+        
+        def record(job: PageJob, page_gigs: List[GigData], has_next: bool):
+            with lock:
+                results[(job.query_index, job.page)] = page_gigs
+                if not has_next:
+                    last_page[job.query_index] = min(last_page[job.query_index], job.page)
+        
+        def parsed(job: PageJob, future, has_next: Optional[bool], tier: Optional[str], fetch_mode: str):
+            try:
+                page_gigs, parsed_next, _ = future.result()
+            except Exception as e:
+                # A page that fails to parse is an error like a failed fetch,
+                # not a page without cards, so it isn't rendered again.
+                logger.error(f"Error parsing page {job.page} of query {job.query_index}: {e}")
+                with lock:
+                    parse_errors[0] += 1
+                    last_page[job.query_index] = min(last_page[job.query_index], job.page - 1)
+                    parsing[0] -= 1
+                return
+            if not page_gigs and tier != "browser" and fetch_mode == "auto":
+                # The HTTP copy had no cards; render this page in a browser instead.
+                jobs.put(PageJob(job.query_index, job.page, job.url, use_browser=True))
+            else:
+                record(job, page_gigs, parsed_next if has_next is None else has_next)
+            with lock:
+                parsing[0] -= 1
+        
+        def next_job() -> Optional[PageJob]:
+            # With a pipeline, pages still being parsed may requeue a browser retry.
+            while True:
+                try:
+                    return jobs.get(timeout=0.05) if self.pipeline else jobs.get_nowait()
+                except queue.Empty:
+                    with lock:
+                        if not self.pipeline or parsing[0] == 0:
+                            return None
+        
+        def worker():
+            with self.pool.lease() as scraper:
+                # Lets the scraper's scroll and parse loops see the control too.
+                scraper.control = control
+                try:
+                    work(scraper)
+                finally:
+                    scraper.control = None
+                    scraper.filters = None
+        
+        def work(scraper: AdvancedFiverrScraper):
+            fetched_before = False
+            while True:
+                if control is not None and control.wait():
+                    return
+                job = next_job()
+                if job is None:
+                    return
+                with lock:
+                    if job.page > last_page[job.query_index]:
+                        continue
+                
+                if fetched_before:
+                    (self.politeness or scraper.politeness).between_pages(control)
+                    if control is not None and control.wait():
+                        return
+                fetched_before = True
+                
+                try:
+                    logger.info(f"Scraping query {job.query_index} page {job.page}")
+                    if self.pipeline is None:
+                        filters = GigFilters.from_params(searches[job.query_index])
+                        scraper.filters = filters if filters.active else None
+                        page_gigs, has_next = scraper.scrape_page_with_recovery(job.url)
+                        with lock:
+                            for name, count in filters.eliminated.items():
+                                query_filters[job.query_index].eliminated[name] += count
+                        record(job, page_gigs, has_next)
+                        continue
+                    html, has_next, tier = scraper.fetch_page_html_with_recovery(job.url, use_browser=job.use_browser)
+                except Exception as e:
+                    logger.error(f"Error scraping page {job.page} of query {job.query_index}: {e}")
+                    with lock:
+                        last_page[job.query_index] = min(last_page[job.query_index], job.page - 1)
+                    continue
+                
+                if html is None:
+                    record(job, [], False)
+                    continue
+                with lock:
+                    parsing[0] += 1
+                future = self.pipeline.submit(html)
+                future.add_done_callback(
+                    lambda f, job=job, has_next=has_next, tier=tier, mode=scraper.fetch_mode:
+                    parsed(job, f, has_next, tier, mode)
+                )
+        
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(self.pool.size)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Workers stopped by a cancel don't wait for pages still in the pipeline.
+        while self.pipeline is not None and parsing[0]:
+            time.sleep(0.05)
+        
+        merged = []
+        pages_fetched = 0
+        duplicates = 0
+        # A gig listed on several pages or under several queries is kept once,
+        # in the first query/page it was seen on (or once per query, when the
+        # caller needs to know every query that found it).
+        seen_urls = set()
+        filtered = {}
+        for index, filters in enumerate(query_filters):
+            if not dedupe_across_queries:
+                seen_urls = set()
+            gigs = []
+            for page in range(1, last_page[index] + 1):
+                for gig in results.get((index, page), []):
+                    # Filtered first: a gig this query rejects may still belong to a later one.
+                    if filters.active and not filters.accepts(gig):
+                        continue
+                    key = canonical_gig_url(gig.url)
+                    if key is not None:
+                        if key in seen_urls:
+                            duplicates += 1
+                            continue
+                        seen_urls.add(key)
+                    gigs.append(gig)
+            merged.append(gigs)
+            for name, count in filters.eliminated.items():
+                filtered[name] = filtered.get(name, 0) + count
+            pages_fetched += sum(1 for (qi, _) in results if qi == index)
+        
+        elapsed = time.perf_counter() - started
+        self.stats = {
+            'pages_fetched': pages_fetched,
+            'seconds': elapsed,
+            'pages_per_second': pages_fetched / elapsed if elapsed else 0.0,
+            'duplicates': duplicates,
+            'filtered': filtered,
+            'parse_errors': parse_errors[0],
+            'cancelled': control is not None and control.cancelled,
+        }
+        logger.info(f"Pooled run fetched {pages_fetched} pages in {elapsed:.1f}s "
+                    f"with {self.pool.size} browsers")
+        return merged
\ No newline at end of file
@@ -0,0 +1,229 @@
+import sys
+import time
+import queue
+import logging
+import argparse
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+from advanced_fiverr_scraper import AdvancedFiverrScraper, GigData
+from scraper_pool import DriverPool
+from scrape_control import ScrapeControl
+
+logger = logging.getLogger(__name__)
+
+class _FirstWriteTimer:
+    """Sink wrapper that notes when the first gigs of a search arrive."""
+    
+    def __init__(self, sink=None):
+        self.sink = sink
+        self.first_write: Optional[float] = None
+        
+    def write(self, gigs: List[GigData]):
+        if self.first_write is None and gigs:
+            self.first_write = time.perf_counter()
+        if self.sink is not None:
+            self.sink.write(gigs)
+            
+    def flush(self):
+        if self.sink is not None and hasattr(self.sink, 'flush'):
+            self.sink.flush()
+
+class ScraperService:
+    """Long-lived owner of warm scrapers that runs search jobs on demand.
+    
+    Browsers start in the background as soon as the service does, so the
+    first search doesn't wait for Chrome either. Idle browsers are health
+    checked every `health_interval` seconds, and a browser is restarted
+    after `max_pages` pages or once its process tree holds more than
+    `max_rss_bytes`. Closing the service cancels running searches and waits
+    for their browsers to come back before quitting them. Jobs, the health
+    check and `close` run on different threads, so the running searches'
+    controls and the stats are only touched under a lock.
+    """
+    
+    def __init__(self, size: int = 1, headless: bool = True, fetch_mode: str = "auto",
+                 max_pages: int = 200, max_rss_bytes: int = 1536 * 1024 * 1024,
+                 health_interval: float = 30.0,
+                 factory: Optional[Callable[[], AdvancedFiverrScraper]] = None):
+        self.size = size
+        self.headless = headless
+        self.fetch_mode = fetch_mode
+        self.max_pages = max_pages
+        self.max_rss_bytes = max_rss_bytes
+        self.health_interval = health_interval
+        self.factory = factory
+        self.pool: Optional[DriverPool] = None
+        self.stats = {'jobs': 0, 'failed': 0, 'restarted': 0, 'unhealthy': 0}
+        self.last_job: Dict = {}
+        self._ready = threading.Event()
+        self._stopping = threading.Event()
+        self._start_error: Optional[Exception] = None
+        self._controls = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=size)
+        
+    def start(self) -> 'ScraperService':
+        threading.Thread(target=self._start, daemon=True).start()
+        return self
+        
+    def _start(self):
+        try:
+            pool = DriverPool(self.size, headless=self.headless, fetch_mode=self.fetch_mode, factory=self.factory)
+        except Exception as e:
+            logger.error(f"Scraper service failed to start: {e}")
+            self._start_error = e
+            self._ready.set()
+            return
+        if self._stopping.is_set():
+            pool.close()
+            self._ready.set()
+            return
+        self.pool = pool
+        self._ready.set()
+        threading.Thread(target=self._health_loop, daemon=True).start()
+        logger.info(f"Scraper service ready with {self.size} warm scrapers")
+        
+    @property
+    def start_failed(self) -> bool:
+        return self._start_error is not None
+        
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        self._ready.wait(timeout)
+        if self._start_error is not None:
+            raise self._start_error
+        return self.pool is not None
+        
+    def submit(self, **search_params) -> Future:
+        """Queue a search_gigs_advanced call; the Future resolves to its gigs.
+        
+        Pass `control=ScrapeControl()` to pause or cancel the search while it runs.
+        """
+        if self._stopping.is_set():
+            raise RuntimeError("Scraper service is closed")
+        return self._executor.submit(self._run_job, time.perf_counter(), search_params)
+        
+    def search(self, **search_params) -> List[GigData]:
+        return self.submit(**search_params).result()
+        
+    def _run_job(self, submitted: float, search_params: Dict) -> List[GigData]:
+        if not self.wait_ready():
+            raise RuntimeError("Scraper service is closed")
+        timer = _FirstWriteTimer(search_params.pop('sink', None))
+        control = search_params.pop('control', None) or ScrapeControl()
+        with self._lock:
+            if self._stopping.is_set():
+                control.cancel()
+            self._controls.add(control)
+        with self.pool.lease() as scraper:
+            started = time.perf_counter()
+            try:
+                gigs = scraper.search_gigs_advanced(sink=timer, control=control, **search_params)
+            except Exception:
+                with self._lock:
+                    self.stats['failed'] += 1
+                raise
+            finally:
+                with self._lock:
+                    self._controls.discard(control)
+            finished = time.perf_counter()
+            last_job = {
+                'queued_seconds': started - submitted,
+                'first_gig_seconds': timer.first_write - submitted if timer.first_write else None,
+                'seconds': finished - submitted,
+                'pages': len(scraper.page_stats),
+                'gigs': len(gigs),
+                'cancelled': control.cancelled,
+            }
+            with self._lock:
+                self.stats['jobs'] += 1
+                self.last_job = last_job
+            self._maintain(scraper)
+        return gigs
+        
+    def _maintain(self, scraper: AdvancedFiverrScraper):
+        if scraper.driver is None:
+            return
+        reason = None
+        if scraper.pages_served >= self.max_pages:
+            reason = f"served {scraper.pages_served} pages"
+        else:
+            rss = scraper.browser_memory_bytes()
+            if rss > self.max_rss_bytes:
+                reason = f"uses {rss / 2 ** 20:.0f} MiB"
+        if reason:
+            self._restart(scraper, reason)
+            
+    def _restart(self, scraper: AdvancedFiverrScraper, reason: str):
+        logger.info(f"Restarting browser that {reason}")
+        try:
+            scraper.restart_driver()
+            with self._lock:
+                self.stats['restarted'] += 1
+        except Exception as e:
+            # The scraper starts a browser again the next time a page needs one.
+            logger.error(f"Browser restart failed: {e}")
+            
+    def _health_loop(self):
+        while not self._stopping.wait(self.health_interval):
+            idle = []
+            # Only idle scrapers are checked; busy ones are checked after their job.
+            while len(idle) < self.size:
+                try:
+                    idle.append(self.pool.acquire(timeout=0))
+                except queue.Empty:
+                    break
+            for scraper in idle:
+                try:
+                    if scraper.is_healthy():
+                        self._maintain(scraper)
+                    else:
+                        with self._lock:
+                            self.stats['unhealthy'] += 1
+                        self._restart(scraper, "stopped responding")
+                finally:
+                    self.pool.release(scraper)
+                    
+    def stop(self):
+        """Refuse new jobs and cancel running searches without waiting for them."""
+        with self._lock:
+            self._stopping.set()
+            controls = list(self._controls)
+        for control in controls:
+            control.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        
+    def close(self, timeout: float = 30.0):
+        self.stop()
+        if self.pool is not None:
+            # Cancelled searches stop at their next safe point and hand their
+            # browsers back; only one stuck past `timeout` is quit under it.
+            self.pool.close(timeout)
+            
+    def __enter__(self):
+        return self.start()
+        
+    def __exit__(self, *exc):
+        self.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Run searches on a warm scraper service, one query per line on stdin")
+    parser.add_argument('--pages', type=int, default=1)
+    parser.add_argument('--size', type=int, default=1)
+    parser.add_argument('--fetch-mode', default="auto", choices=AdvancedFiverrScraper.FETCH_MODES)
+    parser.add_argument('--max-pages-per-browser', type=int, default=200)
+    args = parser.parse_args()
+    
+    with ScraperService(size=args.size, fetch_mode=args.fetch_mode, max_pages=args.max_pages_per_browser) as service:
+        print("Enter comma-separated keywords per line (empty line or EOF to quit)")
+        for line in sys.stdin:
+            keywords = [keyword.strip() for keyword in line.split(',') if keyword.strip()]
+            if not keywords:
+                break
+            gigs = service.search(keywords=keywords, max_pages=args.pages)
+            job = service.last_job
+            first = f"{job['first_gig_seconds']:.2f}s" if job['first_gig_seconds'] is not None else "-"
+            print(f"{len(gigs)} gigs from {job['pages']} pages: first gig after {first}, done in {job['seconds']:.2f}s")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
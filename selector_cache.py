@@ -0,0 +1,104 @@
+import os
+import json
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+from parser_backends import ParserBackend
+from cache_paths import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = os.path.join(CACHE_DIR, 'selector_cache.json')
+
+class SelectorCache:
+    """Remembers how gig cards were found for each page layout.
+    
+    Layouts are identified by a fingerprint of the page's top-level tag and
+    class structure. Each entry records the extraction strategy ('json' for
+    the embedded state, 'dom' for card markup) and, for 'dom', the selector
+    that matched. Entries are persisted as JSON when a path is given.
+    """
+    
+    def __init__(self, path: Optional[str] = DEFAULT_PATH, fingerprint_depth: int = 4):
+        self.path = path
+        self.fingerprint_depth = fingerprint_depth
+        self.entries: Dict[str, Dict] = {}
+        self._invalidated = set()
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable selector cache {path}: {e}")
+                
+    def fingerprint(self, backend: ParserBackend, doc) -> str:
+        # Sibling signatures are de-duplicated so the number of result cards
+        # on a page does not change its fingerprint.
+        digest = hashlib.sha1()
+        level = [doc]
+        for depth in range(self.fingerprint_depth):
+            signatures = set()
+            next_level = []
+            for node in level:
+                for child in backend.children(node):
+                    signature = f"{backend.tag(child)}.{'.'.join(sorted(backend.class_text(child).split()))}"
+                    if signature not in signatures:
+                        signatures.add(signature)
+                        next_level.append(child)
+            digest.update(f"{depth}:{'|'.join(sorted(signatures))};".encode('utf-8'))
+            level = next_level
+        return digest.hexdigest()[:16]
+        
+    def get(self, fingerprint: str) -> Optional[Dict]:
+        return self.entries.get(fingerprint)
+        
+    def remember(self, fingerprint: str, strategy: str, selector: Optional[str] = None):
+        with self._lock:
+            entry = self.entries.get(fingerprint)
+            if entry and entry['strategy'] == strategy and entry.get('selector') == selector:
+                entry['hits'] += 1
+                return
+            self._invalidated.discard(fingerprint)
+            self.entries[fingerprint] = {
+                'strategy': strategy,
+                'selector': selector,
+                'hits': 1,
+                'updated_at': datetime.now().isoformat(),
+            }
+            logger.info(f"Learned {strategy} strategy for layout {fingerprint}: {selector or '-'}")
+        self.save()
+        
+    def invalidate(self, fingerprint: str):
+        with self._lock:
+            if self.entries.pop(fingerprint, None) is None:
+                return
+            self._invalidated.add(fingerprint)
+            logger.info(f"Selector cache entry for layout {fingerprint} stopped matching, re-probing")
+        self.save()
+        
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            merged = {}
+            # Other scrapers (e.g. in a pool) may share the file; keep their entries.
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, encoding='utf-8') as f:
+                        merged = json.load(f)
+                except (OSError, ValueError):
+                    merged = {}
+            for fingerprint in self._invalidated:
+                merged.pop(fingerprint, None)
+            merged.update(self.entries)
+            tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(merged, f, indent=2)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.warning(f"Failed to save selector cache: {e}")
\ No newline at end of file
@@ -0,0 +1,37 @@
+import os
+import sys
+import pytest
+
+# The modules live at the top of the repository rather than in a package.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from advanced_fiverr_scraper import AdvancedFiverrScraper, PolitenessPolicy
+from benchmark_scraper import FixtureServer
+from selector_cache import SelectorCache
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Keeps default cache and index paths out of the real ~/.cache."""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+
+@pytest.fixture
+def fixture_server():
+    with FixtureServer(total_pages=4, cards_per_page=10) as server:
+        yield server
+
+@pytest.fixture
+def make_scraper(fixture_server):
+    """Builds HTTP-only scrapers against the fixture server, with no delays."""
+    scrapers = []
+
+    def make(**kwargs):
+        kwargs.setdefault('fetch_mode', 'http')
+        scraper = AdvancedFiverrScraper(base_url=fixture_server.base_url,
+                                        politeness=PolitenessPolicy(between_pages=(0, 0)),
+                                        selector_cache=SelectorCache(None), **kwargs)
+        scrapers.append(scraper)
+        return scraper
+
+    yield make
+    for scraper in scrapers:
+        scraper.close()
@@ -0,0 +1,17 @@
+from datetime import datetime
+from advanced_fiverr_scraper import GigData
+
+def make_gig(url: str, **values) -> GigData:
+    fields = dict(title="Logo design", url=url, freelancer="seller", rating=4.8, reviews=10,
+                  price="$20", delivery_time="2 days", completed_jobs=5, category="", keywords=[],
+                  description="", tags=[], level="Level 1", online_status=True,
+                  response_time="1 hour", last_delivery="", gig_created="", scraped_at=datetime.now())
+    fields.update(values)
+    return GigData(**fields)
+
+class ListSink:
+    def __init__(self):
+        self.gigs = []
+
+    def write(self, gigs):
+        self.gigs.extend(gigs)
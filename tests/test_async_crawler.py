@@ -0,0 +1,23 @@
+import asyncio
+import pytest
+from async_crawler import AsyncCrawlEngine
+from benchmark_scraper import FixtureServer
+
+@pytest.fixture
+def engine(fixture_server):
+    engine = AsyncCrawlEngine(concurrency=4, rate_per_host=1000, burst=1000, base_url=fixture_server.base_url)
+    yield engine
+    engine.close()
+
+def test_pages_past_the_last_one_are_not_yielded(engine):
+    # The fixture has 4 pages; it still answers for later ones, with new cards.
+    jobs = AsyncCrawlEngine.expand_jobs([['logo']], max_pages=7)
+    gigs = asyncio.run(engine.collect(jobs))
+    assert len(gigs) == 40
+    assert len({gig.url for gig in gigs}) == 40
+    assert engine.stats['gigs'] == 40
+
+def test_gigs_come_in_page_order(engine):
+    gigs = asyncio.run(engine.collect(AsyncCrawlEngine.expand_jobs([['logo']], max_pages=4)))
+    pages = [int(gig.url.rsplit('-', 1)[1]) // 10 for gig in gigs]
+    assert pages == sorted(pages)
@@ -0,0 +1,33 @@
+import pytest
+from benchmark_scraper import make_search_page
+from card_detection import detect_repeated_cards
+from parser_backends import BACKENDS, get_backend
+
+def cards_page(count: int) -> str:
+    cards = []
+    for i in range(count):
+        modifier = ' featured' if i % 3 == 0 else ''
+        badge = '<span class="badge">Pro</span>' if i % 2 else ''
+        cards.append(f'<div class="card{modifier}"><h3>Gig number {i} with a title long enough to count as real card text</h3>'
+                     f'{badge}<p>$20</p></div>')
+    return (f'<html><body><div class="side"><p>Filters</p><p>Sort</p><p>Help</p></div>'
+            f'<div class="results">{"".join(cards)}</div></body></html>')
+
+@pytest.fixture(params=sorted(BACKENDS))
+def backend(request):
+    try:
+        return get_backend(request.param)
+    except ImportError:
+        pytest.skip(f"{request.param} is not installed")
+
+def test_cards_with_optional_badges_and_modifiers_form_one_group(backend):
+    cards, selector = detect_repeated_cards(backend, backend.parse(cards_page(9)))
+    assert len(cards) == 9
+    assert selector == "div.card"
+    # In page order, whatever their variant.
+    assert [backend.class_text(card) for card in cards[:3]] == ["card featured", "card", "card"]
+
+def test_fixture_page_cards(backend):
+    cards, selector = detect_repeated_cards(backend, backend.parse(make_search_page(1, cards_per_page=12)))
+    assert len(cards) == 12
+    assert selector is not None
@@ -0,0 +1,57 @@
+import csv
+import json
+import pytest
+from crawl_jobs import CrawlJob, read_output_urls
+from gig_sinks import open_sink
+
+class Crash(BaseException):
+    """Stands in for the process being killed; the search loop only catches Exception."""
+
+def run_job(job, scraper, append):
+    sink = open_sink(job.output, append=append)
+    try:
+        return job.run(scraper, sink)
+    finally:
+        sink.close()
+
+def output_urls(path):
+    if path.endswith('.csv'):
+        with open(path, encoding='utf-8', newline='') as f:
+            return [row['URL'] for row in csv.DictReader(f)]
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line)['url'] for line in f]
+
+def test_job_runs_every_search_and_writes_each_gig_once(tmp_path, make_scraper):
+    # The fixture serves the same gigs for both searches.
+    job = CrawlJob(str(tmp_path / 'job.json'), [{'keywords': ['a']}, {'keywords': ['b']}], 3,
+                   str(tmp_path / 'gigs.jsonl'))
+    assert run_job(job, make_scraper(), append=False)
+    assert len(output_urls(job.output)) == 30
+    assert [search['gigs'] for search in CrawlJob.load(job.path).searches] == [30, 0]
+
+@pytest.mark.parametrize('extension', ['jsonl', 'csv'])
+def test_resume_after_crash_between_flush_and_checkpoint(tmp_path, make_scraper, monkeypatch, extension):
+    job = CrawlJob(str(tmp_path / 'job.json'), [{'keywords': ['logo']}], 4, str(tmp_path / f'gigs.{extension}'))
+    job.save()
+    save = CrawlJob.save
+    saves = []
+
+    def crash_on_third_page(self):
+        saves.append(1)
+        if len(saves) == 3:
+            raise Crash()
+        save(self)
+
+    monkeypatch.setattr(CrawlJob, 'save', crash_on_third_page)
+    with pytest.raises(Crash):
+        run_job(job, make_scraper(), append=False)
+    monkeypatch.setattr(CrawlJob, 'save', save)
+    # Page 3 reached the output but not the checkpoint.
+    assert len(output_urls(job.output)) == 30
+    resumed = CrawlJob.load(job.path)
+    assert resumed.searches[0]['next_page'] == 3
+
+    assert run_job(resumed, make_scraper(), append=True)
+    urls = output_urls(job.output)
+    assert len(urls) == len(set(urls)) == 40
+    assert len(read_output_urls(job.output)) == 40
@@ -0,0 +1,24 @@
+import numpy as np
+from gig_batch import GigBatch
+from helpers import make_gig
+
+def test_gigs_round_trip(make_scraper):
+    gigs = make_scraper().search_gigs_advanced(['logo'], max_pages=3)
+    batch = GigBatch(gigs[:5], capacity=2)
+    batch.extend(gigs[5:])
+    assert len(batch) == len(gigs)
+    for original, restored in zip(gigs, batch):
+        assert restored.to_dict() == original.to_dict()
+    assert batch.gig(-1).to_dict() == gigs[-1].to_dict()
+
+def test_columns_and_normalized_values():
+    gigs = [make_gig(f"https://www.fiverr.com/seller/gig-{i}", price=price, rating=rating)
+            for i, (price, rating) in enumerate([("$20", 4.5), ("€30", 5.0), ("$20", 4.9)])]
+    batch = GigBatch(gigs)
+    assert list(batch.column('rating')) == [4.5, 5.0, 4.9]
+    assert list(batch.column('price')) == ["$20", "€30", "$20"]
+    assert len(batch.pools['price'].values) == 2
+    prices = batch.normalized()['price_usd']
+    assert prices[0] == prices[2] == 20.0 and np.isnan(prices[1])
+    frame = batch.to_dataframe(['url', 'price'], normalized=True)
+    assert list(frame.columns) == ['url', 'price', 'price_usd', 'delivery_days', 'response_hours']
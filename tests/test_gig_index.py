@@ -0,0 +1,33 @@
+from gig_index import GigIndex, canonical_gig_url
+from helpers import make_gig
+
+def test_canonical_url_drops_tracking_and_case():
+    assert canonical_gig_url("HTTPS://WWW.Fiverr.com/seller/logo-design/?context=1#reviews") == \
+        "https://www.fiverr.com/seller/logo-design"
+
+def test_cards_without_a_gig_link_have_no_key():
+    for url in ("N/A", "", None, "https://www.fiverr.com", "https://www.fiverr.com/"):
+        assert canonical_gig_url(url) is None
+
+def test_update_reports_new_and_changed_gigs():
+    index = GigIndex(':memory:')
+    gig = make_gig("https://www.fiverr.com/seller/logo?context=1")
+    assert index.update([gig]) == ([gig], 0)
+    assert index.update([make_gig("https://www.fiverr.com/seller/logo")]) == ([], 1)
+    cheaper = make_gig("https://www.fiverr.com/seller/logo", price="$15")
+    assert index.update([cheaper]) == ([cheaper], 0)
+    assert len(index.history("https://www.fiverr.com/seller/logo")) == 2
+
+def test_changes_does_not_record():
+    index = GigIndex(':memory:')
+    gig = make_gig("https://www.fiverr.com/seller/logo")
+    assert index.changes([gig]) == ([gig], 0)
+    assert len(index) == 0
+    assert index.changes([gig]) == ([gig], 0)
+
+def test_gigs_without_a_link_are_always_new():
+    index = GigIndex(':memory:')
+    gigs = [make_gig("N/A", title="First"), make_gig("N/A", title="Second")]
+    assert index.update(gigs) == (gigs, 0)
+    assert index.update(gigs) == (gigs, 0)
+    assert len(index) == 0
@@ -0,0 +1,34 @@
+import math
+import numpy as np
+import pytest
+from gig_filters import GigFilters
+from gig_normalize import price_usd, price_usd_scalar, delivery_days, duration_hours
+
+PRICES = ["$20", "From $1,200", "US$45", "$1.5k", "USD 30", "€30", "£12", "45", "N/A", "", None]
+
+def test_scalar_and_batch_price_parsing_agree():
+    batch = price_usd(PRICES)
+    for price, value in zip(PRICES, batch):
+        scalar = price_usd_scalar(price)
+        assert (math.isnan(scalar) and np.isnan(value)) or scalar == value, price
+    assert list(batch[:5]) == [20.0, 1200.0, 45.0, 1500.0, 30.0]
+
+def test_other_currencies_convert_only_with_a_rate():
+    assert math.isnan(price_usd_scalar("€30"))
+    assert price_usd_scalar("€30", {'EUR': 1.1}) == pytest.approx(33.0)
+    assert price_usd(["€30"], {'EUR': 1.1})[0] == pytest.approx(33.0)
+
+def test_price_filter_never_rejects_prices_without_a_usd_amount():
+    filters = GigFilters(min_price=25, max_price=40)
+    assert not filters.rejects_price("€30")
+    assert not filters.rejects_price("45")
+    assert not filters.rejects_price("N/A")
+    assert filters.rejects_price("$20")
+    assert filters.rejects_price("$45")
+    assert not filters.rejects_price("$30")
+    assert filters.eliminated == {'min_price': 1, 'max_price': 1, 'min_rating': 0, 'top_rated_seller': 0}
+
+def test_durations():
+    assert list(duration_hours(["2 days", "Avg. response time: 1 hour", "30 min", "soon"])[:3]) == [48.0, 1.0, 0.5]
+    assert np.isnan(duration_hours(["soon"])[0])
+    assert list(delivery_days(["3 days", "5 hours"])) == [3.0, 1.0]
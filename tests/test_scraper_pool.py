@@ -0,0 +1,59 @@
+from concurrent.futures import Future
+import pytest
+from parse_pipeline import ParsePipeline
+from scraper_pool import DriverPool, PooledPageScheduler
+
+@pytest.fixture
+def pool(make_scraper):
+    pool = DriverPool(1, factory=make_scraper)
+    yield pool
+    pool.close()
+
+def test_each_query_is_filtered_before_cross_query_dedup(pool, make_scraper):
+    # The fixture serves the same gigs for every query.
+    everything = make_scraper().search_gigs_advanced(['logo'], max_pages=1)
+    min_rating = max(gig.rating for gig in everything)
+    top_rated = {gig.url for gig in everything if gig.rating >= min_rating}
+    assert len(top_rated) < len(everything)
+
+    scheduler = PooledPageScheduler(pool)
+    strict, loose = scheduler.run([{'keywords': ['a'], 'min_rating': min_rating}, {'keywords': ['b']}],
+                                  max_pages=1)
+    # A gig the first query rejects still belongs to the second.
+    assert {gig.url for gig in strict} == top_rated
+    assert {gig.url for gig in loose} == {gig.url for gig in everything} - top_rated
+    assert scheduler.stats['duplicates'] == len(top_rated)
+    assert scheduler.stats['filtered']['min_rating'] == len(everything) - len(top_rated)
+
+def test_queries_keep_their_own_gigs_without_cross_query_dedup(pool):
+    scheduler = PooledPageScheduler(pool)
+    first, second = scheduler.run([{'keywords': ['a']}, {'keywords': ['b']}], max_pages=2,
+                                  dedupe_across_queries=False)
+    assert len(first) == len(second) == 20
+
+class FailingPipeline(ParsePipeline):
+    """Fails to parse the second page it is given."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.submitted = 0
+
+    def submit(self, html):
+        self.submitted += 1
+        if self.submitted == 2:
+            future = Future()
+            future.set_exception(ValueError("unparseable"))
+            return future
+        return super().submit(html)
+
+def test_failed_parse_ends_the_query_instead_of_rendering_again(pool):
+    pool._all[0].fetch_mode = "auto"
+    pipeline = FailingPipeline(workers=1, selector_cache_path=None)
+    try:
+        scheduler = PooledPageScheduler(pool, pipeline=pipeline)
+        gigs = scheduler.search(max_pages=4, keywords=['logo'])
+    finally:
+        pipeline.close()
+    assert len(gigs) == 10
+    assert pipeline.submitted == 2
+    assert scheduler.stats['parse_errors'] == 1
@@ -0,0 +1,24 @@
+import time
+from advanced_fiverr_scraper import AdvancedFiverrScraper, PolitenessPolicy
+from benchmark_scraper import FixtureServer
+from scraper_service import ScraperService
+from selector_cache import SelectorCache
+
+def test_stop_cancels_running_searches_without_waiting():
+    with FixtureServer(total_pages=20, cards_per_page=5, latency=0.2) as server:
+        service = ScraperService(factory=lambda: AdvancedFiverrScraper(
+            base_url=server.base_url, fetch_mode="http", selector_cache=SelectorCache(None),
+            politeness=PolitenessPolicy(between_pages=(0, 0)))).start()
+        try:
+            assert len(service.search(keywords=['logo'], max_pages=1)) == 5
+            running = service.submit(keywords=['logo'], max_pages=20)
+            time.sleep(0.5)
+            started = time.perf_counter()
+            service.stop()
+            assert time.perf_counter() - started < 0.1
+            gigs = running.result(timeout=10)
+        finally:
+            service.close()
+    assert 0 < len(gigs) < 100
+    assert service.last_job['cancelled']
+    assert service.stats['jobs'] == 2
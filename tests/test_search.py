@@ -0,0 +1,89 @@
+import pytest
+from advanced_fiverr_scraper import AdvancedFiverrScraper, PolitenessPolicy
+from gig_index import GigIndex
+from scrape_control import ScrapeControl
+from helpers import ListSink, make_gig
+
+def test_search_walks_every_page(make_scraper):
+    gigs = make_scraper().search_gigs_advanced(['logo'], max_pages=10)
+    assert len(gigs) == 40
+    assert len({gig.url for gig in gigs}) == 40
+
+def test_url_projection_leaves_other_fields_empty(make_scraper):
+    gigs = make_scraper().search_gigs_advanced(['logo'], max_pages=1, fields=['url'])
+    assert len(gigs) == 10
+    for gig in gigs:
+        assert gig.url.startswith('https://')
+        assert gig.title is None and gig.level is None and gig.rating is None
+        assert gig.tags == []
+
+def test_projection_still_applies_filters(make_scraper):
+    unfiltered = make_scraper().search_gigs_advanced(['logo'], max_pages=1)
+    expected = {gig.url for gig in unfiltered if gig.rating >= 4.9}
+    gigs = make_scraper().search_gigs_advanced(['logo'], max_pages=1, fields=['url'], min_rating=4.9)
+    assert {gig.url for gig in gigs} == expected
+
+def test_index_refuses_partial_fields(make_scraper):
+    with pytest.raises(ValueError, match="hashed field"):
+        make_scraper().search_gigs_advanced(['logo'], max_pages=1, fields=['url', 'title'],
+                                            index=GigIndex(':memory:'))
+
+def test_unknown_field_is_rejected(make_scraper):
+    with pytest.raises(ValueError, match="Unknown gig fields"):
+        make_scraper().search_gigs_advanced(['logo'], max_pages=1, fields=['url', 'colour'])
+
+def test_index_only_passes_new_gigs_to_the_sink(make_scraper):
+    index = GigIndex(':memory:')
+    first, second = ListSink(), ListSink()
+    make_scraper().search_gigs_advanced(['logo'], max_pages=2, index=index, sink=first)
+    make_scraper().search_gigs_advanced(['logo'], max_pages=2, index=index, sink=second)
+    assert len(first.gigs) == 20
+    assert second.gigs == []
+
+class CancellingScraper(AdvancedFiverrScraper):
+    """Serves three gigs per page and is cancelled while page 2 loads."""
+
+    def scrape_page_with_recovery(self, url):
+        page = int(url.split('page=')[1]) if 'page=' in url else 1
+        if page == 2:
+            self.control.cancel()
+        self.page_stats.append({'seconds': 0.0})
+        return [make_gig(f"https://www.fiverr.com/seller/gig-{page}-{i}") for i in range(3)], True
+
+@pytest.fixture
+def cancelling_scraper():
+    scraper = CancellingScraper(fetch_mode="http", politeness=PolitenessPolicy(between_pages=(0, 0)))
+    yield scraper
+    scraper.close()
+
+def test_cut_short_page_is_dropped_when_pages_are_checkpointed(cancelling_scraper):
+    pages, sink = [], ListSink()
+    gigs = cancelling_scraper.search_gigs_advanced(
+        ['logo'], max_pages=5, control=ScrapeControl(), sink=sink,
+        on_page=lambda page, page_gigs, has_next: pages.append(page))
+    assert pages == [1]
+    assert len(gigs) == 3
+    assert len(sink.gigs) == 3
+
+def test_cut_short_page_is_kept_without_checkpoints(cancelling_scraper):
+    gigs = cancelling_scraper.search_gigs_advanced(['logo'], max_pages=5, control=ScrapeControl())
+    assert len(gigs) == 6
+
+class RepeatingScraper(AdvancedFiverrScraper):
+    """Lists the same gig on every page, next to one of the page's own."""
+
+    def scrape_page_with_recovery(self, url):
+        page = int(url.split('page=')[1]) if 'page=' in url else 1
+        self.page_stats.append({'seconds': 0.0})
+        return [make_gig("https://www.fiverr.com/seller/popular?context=1", rating=4.0 + page / 10),
+                make_gig(f"https://www.fiverr.com/seller/gig-{page}")], page < 3
+
+def test_gig_repeated_across_pages_is_kept_once_from_its_first_page():
+    scraper = RepeatingScraper(fetch_mode="http", politeness=PolitenessPolicy(between_pages=(0, 0)))
+    try:
+        gigs = scraper.search_gigs_advanced(['logo'], max_pages=5)
+    finally:
+        scraper.close()
+    assert [gig.url.rsplit('/', 1)[1] for gig in gigs] == [
+        'popular?context=1', 'gig-1', 'gig-2', 'gig-3']
+    assert gigs[0].rating == pytest.approx(4.1)